@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import List, cast
+from typing import List, Optional, Tuple, cast
 
 from arcade import SpriteList
 
+from arena.distance_field import DistanceField, bake_distance_field
 from arena.spawn_point import SpawnPoint
 from arena.wall import Wall
 from path import Path
@@ -17,6 +18,9 @@ class Arena:
         self._spawn_points: List[SpawnPoint] = []
         self._initial_spawn_points: List[SpawnPoint] = [None, None, None, None]
         self.patrol_loop: Path
+        self._distance_field: Optional[DistanceField] = None
+        self.bounds: Tuple[float, float, float, float] = (0, 0, 0, 0)
+        "(left, bottom, right, top) of the whole map, in world coordinates"
 
     @property
     def walls(self) -> Sequence[Wall]:
@@ -30,6 +34,37 @@ class Arena:
     def initial_spawn_points(self) -> Sequence[SpawnPoint]:
         return self._initial_spawn_points
 
+    @property
+    def distance_field(self) -> Optional[DistanceField]:
+        """
+        Signed distance to the nearest wall, or `None` until `bake_distance_field`
+        """
+        return self._distance_field
+
+    def bake_distance_field(self, bounds: Tuple[float, float, float, float]):
+        """
+        One-time computation of the wall distance field, once all walls are added.
+
+        `bounds` is the (left, bottom, right, top) area to cover.
+        """
+        self._distance_field = bake_distance_field(
+            [(wall.transform, wall.size) for wall in self.walls], bounds
+        )
+
+    def get_wall_distance(self, point: Tuple[float, float]) -> float:
+        """
+        Approximate distance from `point` to the nearest wall.  Negative inside a
+        wall.  Much cheaper than testing against wall polygons.
+        """
+        return self._distance_field.sample(point)
+
+    def get_wall_gradient(self, point: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Approximate direction pointing away from the nearest wall.  Roughly unit
+        length.
+        """
+        return self._distance_field.sample_gradient(point)
+
     def init_for_drawing(self, sprite_lists: SpriteLists):
         """
         One-time initialization to prepare for rendering
@@ -89,6 +89,13 @@ def load_arena_by_name(name: str) -> Arena:
         ]
     )
 
+    map_width = tilemap.width * tilemap.tile_width
+    map_height = tilemap.height * tilemap.tile_height
+    arena.bounds = (0, y_offset - map_height, map_width, y_offset)
+
+    # Walls never move, so distances to them can be computed once up front
+    arena.bake_distance_field(arena.bounds)
+
     return arena
 
 
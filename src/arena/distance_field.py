@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import math
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_DISTANCE_FIELD_CELL_SIZE = 8
+"Spacing between samples of a baked distance field, measured in pixels"
+
+
+class DistanceField:
+    """
+    Signed distance to the nearest wall, sampled on a regular grid.
+
+    Positive outside walls, negative inside them, in pixels.  The gradient points
+    away from the nearest wall, and is roughly unit length.
+
+    Lookups bilinearly interpolate the four nearest samples, so they cost the same
+    no matter how many walls there are.  Points off the edge of the grid are clamped
+    to the edge.
+    """
+
+    def __init__(
+        self,
+        origin: Tuple[float, float],
+        cell_size: float,
+        distances: np.ndarray,
+    ):
+        self.origin = origin
+        "World position of the sample at row 0, column 0"
+        self.cell_size = cell_size
+        self.distances = distances
+        "2D array of distances, indexed [row, column], where row is y and column is x"
+        gradient_y, gradient_x = np.gradient(distances, cell_size)
+        self.gradient_x = gradient_x
+        self.gradient_y = gradient_y
+        # Indexing nested lists is much faster than indexing arrays one item at a time
+        self._distance_rows = distances.tolist()
+        self._gradient_x_rows = gradient_x.tolist()
+        self._gradient_y_rows = gradient_y.tolist()
+        self._rows, self._columns = distances.shape
+
+    def sample(self, point: Tuple[float, float]) -> float:
+        """
+        Signed distance from `point` to the nearest wall.
+        """
+        return self._interpolate(self._distance_rows, point)
+
+    def sample_gradient(self, point: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Direction from the nearest wall toward `point`.
+        """
+        return (
+            self._interpolate(self._gradient_x_rows, point),
+            self._interpolate(self._gradient_y_rows, point),
+        )
+
+    def sample_many(self, points: np.ndarray) -> np.ndarray:
+        """
+        Signed distance from each of an (N, 2) array of points to the nearest wall,
+        all at once.
+        """
+        x = (points[:, 0] - self.origin[0]) / self.cell_size
+        y = (points[:, 1] - self.origin[1]) / self.cell_size
+        x = np.clip(x, 0.0, self._columns - 1.0)
+        y = np.clip(y, 0.0, self._rows - 1.0)
+        column = np.minimum(x.astype(int), self._columns - 2)
+        row = np.minimum(y.astype(int), self._rows - 2)
+        tx = x - column
+        ty = y - row
+        distances = self.distances
+        bottom = distances[row, column] * (1 - tx) + distances[row, column + 1] * tx
+        top = (
+            distances[row + 1, column] * (1 - tx) + distances[row + 1, column + 1] * tx
+        )
+        return bottom * (1 - ty) + top * ty
+
+    def get_bounds(self) -> Tuple[float, float, float, float]:
+        """
+        (left, bottom, right, top) of the area covered by samples.
+        """
+        left, bottom = self.origin
+        return (
+            left,
+            bottom,
+            left + (self._columns - 1) * self.cell_size,
+            bottom + (self._rows - 1) * self.cell_size,
+        )
+
+    def _interpolate(
+        self, samples: List[List[float]], point: Tuple[float, float]
+    ) -> float:
+        rows = self._rows
+        columns = self._columns
+        x = (point[0] - self.origin[0]) / self.cell_size
+        y = (point[1] - self.origin[1]) / self.cell_size
+        x = min(max(x, 0.0), columns - 1.0)
+        y = min(max(y, 0.0), rows - 1.0)
+        column = min(int(x), columns - 2)
+        row = min(int(y), rows - 2)
+        tx = x - column
+        ty = y - row
+        lower = samples[row]
+        upper = samples[row + 1]
+        bottom = lower[column] * (1 - tx) + lower[column + 1] * tx
+        top = upper[column] * (1 - tx) + upper[column + 1] * tx
+        return bottom * (1 - ty) + top * ty
+
+
+def bake_distance_field(
+    boxes: Sequence[Tuple[Tuple[float, float, float], Tuple[float, float]]],
+    bounds: Tuple[float, float, float, float],
+    cell_size: float = DEFAULT_DISTANCE_FIELD_CELL_SIZE,
+) -> DistanceField:
+    """
+    Compute the distance field of a set of rotated rectangles, such as walls.
+
+    `boxes` is a list of (transform, size) where transform = (x, y, radians) is
+    the center and rotation, and size = (width, height).
+
+    `bounds` is the (left, bottom, right, top) area to cover.
+    """
+    left, bottom, right, top = bounds
+    columns = max(2, math.ceil((right - left) / cell_size) + 1)
+    rows = max(2, math.ceil((top - bottom) / cell_size) + 1)
+    xs = left + np.arange(columns) * cell_size
+    ys = bottom + np.arange(rows) * cell_size
+    grid_x, grid_y = np.meshgrid(xs, ys)
+
+    # With no walls at all, nothing is closer than the far corner
+    distances = np.full((rows, columns), math.hypot(right - left, top - bottom))
+    for (x, y, radians), (width, height) in boxes:
+        # Express every sample in the box's local space, where it is axis-aligned
+        offset_x = grid_x - x
+        offset_y = grid_y - y
+        c = math.cos(radians)
+        s = math.sin(radians)
+        local_x = np.abs(offset_x * c + offset_y * s) - width / 2
+        local_y = np.abs(-offset_x * s + offset_y * c) - height / 2
+        # Exact signed distance to a box
+        outside = np.hypot(np.maximum(local_x, 0), np.maximum(local_y, 0))
+        inside = np.minimum(np.maximum(local_x, local_y), 0)
+        np.minimum(distances, outside + inside, out=distances)
+
+    return DistanceField((left, bottom), cell_size, distances)
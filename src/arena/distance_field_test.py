@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import math
+from unittest import TestCase
+
+import numpy as np
+
+from arena.distance_field import bake_distance_field
+
+
+class TestDistanceField(TestCase):
+    def test_single_box(self):
+        # 20x20 box centered at (50, 50)
+        field = bake_distance_field([((50, 50, 0), (20, 20))], (0, 0, 100, 100), 5)
+
+        self.assertAlmostEqual(field.sample((50, 20)), 20)
+        self.assertAlmostEqual(field.sample((50, 50)), -10)
+        # Between samples, interpolated
+        self.assertAlmostEqual(field.sample((52.5, 22.5)), 17.5)
+
+        gradient = field.sample_gradient((50, 20))
+        self.assertAlmostEqual(gradient[0], 0)
+        self.assertAlmostEqual(gradient[1], -1)
+
+    def test_rotated_box(self):
+        # A square rotated 45 degrees presents a corner
+        field = bake_distance_field(
+            [((50, 50, math.pi / 4), (20, 20))], (0, 0, 100, 100), 5
+        )
+        self.assertAlmostEqual(field.sample((80, 50)), 30 - 10 * math.sqrt(2))
+
+    def test_clamps_outside_bounds(self):
+        field = bake_distance_field([((50, 50, 0), (20, 20))], (0, 0, 100, 100), 5)
+        self.assertAlmostEqual(field.sample((50, -100)), field.sample((50, 0)))
+
+    def test_sample_many_matches_sample(self):
+        field = bake_distance_field([((50, 50, 0), (20, 20))], (0, 0, 100, 100), 5)
+        points = [(50, 20), (52.5, 22.5), (50, -100), (99, 99)]
+        distances = field.sample_many(np.array(points))
+        for point, distance in zip(points, distances):
+            self.assertAlmostEqual(distance, field.sample(point))
+        self.assertEqual(field.get_bounds(), (0, 0, 100, 100))
@@ -21,6 +21,20 @@ class Wall:
     def sprite(self):
         return self._sprite
 
+    @property
+    def transform(self):
+        """
+        (x, y, radians) of the wall's center
+        """
+        return self._transform
+
+    @property
+    def size(self):
+        """
+        (width, height)
+        """
+        return self._size
+
     def init_for_drawing(self):
         """
         call once all other attributes are set, to initialize graphical
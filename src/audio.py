@@ -1,18 +1,37 @@
-import pygame
+from __future__ import annotations
+
 import os
 import platform
 from typing import Optional
 
+import pygame
+
 # Windows misses the dll directory for pygame
 # The below patch fixes it
-if platform.system() == 'Windows':
-    os.add_dll_directory(
-        os.path.dirname(pygame.__file__)
-    )
+if platform.system() == "Windows":
+    os.add_dll_directory(os.path.dirname(pygame.__file__))
 
 MASTER = pygame.mixer
-MASTER.init()
-MASTER.set_num_channels(128)
+
+_audio_enabled = True
+
+
+def disable_audio():
+    """
+    Keep the mixer from ever starting, and make every sound silent.  For running
+    without an audio device, such as headless matches.
+    """
+    global _audio_enabled
+    _audio_enabled = False
+
+
+def _init_mixer():
+    # Started on first use instead of on import, so that importing weapons does
+    # not require an audio device
+    if not MASTER.get_init():
+        MASTER.init()
+        MASTER.set_num_channels(128)
+
 
 # This class is intended to be used as a controller
 # that controls a universal mixer.
@@ -25,12 +44,19 @@ class TwistedSound:
     channel: Optional[MASTER.Channel] = None
 
     def play(self, times=1, volume=0.05):
+        if self.sound is None:
+            return
         self.channel = MASTER.find_channel(force=True)
         self.channel.set_volume(volume)
         self.channel.play(self.sound, times - 1)
 
     def stop(self):
+        if self.channel is None:
+            return
         self.channel.stop()
 
     def select(self, selection: str):
+        if not _audio_enabled:
+            return
+        _init_mixer()
         self.sound = MASTER.Sound(selection)
@@ -1,31 +1,125 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, List
+
 import arcade
 
+from collision_layers import CollisionLayer
 from linked_sprite import LinkedSprite
 from ordnances.ordnance import Ordnance
 from sprite_lists import SpriteLists
 
+if TYPE_CHECKING:
+    from vehicle import Vehicle
+
+VEHICLE_RESTITUTION = 0.5
+"How bouncy vehicle-on-vehicle impacts are, from 0 (dead stop) to 1 (no energy lost)"
+
 
 def ordnance_hits_wall(sprite_lists: SpriteLists):
     for ordnance_sprite in sprite_lists.ordnance:
         ordnance_sprite: LinkedSprite[Ordnance]
-        walls_touching_ordnance = arcade.check_for_collision_with_list(
-            ordnance_sprite, sprite_lists.walls
+        ordnance = ordnance_sprite.owner
+        # Discard by bitmask before any geometry
+        if ordnance.queries_collision_world or not (
+            ordnance.collision_mask & CollisionLayer.WALL
+        ):
+            continue
+        walls_touching_ordnance = sprite_lists.collision_world.overlap_sprite(
+            ordnance_sprite, CollisionLayer.WALL
         )
 
+        _begin_collisions(sprite_lists, ordnance, walls_touching_ordnance)
         if len(walls_touching_ordnance) > 0:
-            ordnance_sprite.owner.on_collision_with_wall(walls_touching_ordnance)
+            ordnance.on_collision_with_wall(walls_touching_ordnance)
 
 
 def ordnance_hits_vehicle(delta_time, sprite_lists: SpriteLists):
     for ordnance_sprite in sprite_lists.ordnance:
         ordnance_sprite: LinkedSprite[Ordnance]
-        vehicles_touching_ordnance = arcade.check_for_collision_with_list(
-            ordnance_sprite, sprite_lists.vehicles
+        ordnance = ordnance_sprite.owner
+        # Discard by bitmask before any geometry
+        if ordnance.queries_collision_world or not (
+            ordnance.collision_mask & CollisionLayer.VEHICLE
+        ):
+            continue
+        # Ordnance never hits the vehicle that fired it
+        vehicles_touching_ordnance = sprite_lists.collision_world.overlap_sprite(
+            ordnance_sprite, CollisionLayer.VEHICLE, ordnance.owner_sprite
         )
 
+        _begin_collisions(sprite_lists, ordnance, vehicles_touching_ordnance)
         if len(vehicles_touching_ordnance) > 0:
-            ordnance_sprite.owner.on_collision_with_vehicle(
-                delta_time, vehicles_touching_ordnance
+            ordnance.on_collision_with_vehicle(delta_time, vehicles_touching_ordnance)
+
+
+def end_ordnance_contacts(sprite_lists: SpriteLists):
+    """
+    Finish the collision world's tick, and tell ordnance about contacts that ended.
+
+    Call once per tick, after every collision query.
+    """
+    for sprite, other in sprite_lists.collision_world.contacts.end_tick():
+        owner = getattr(sprite, "owner", None)
+        if isinstance(owner, Ordnance):
+            owner.on_collision_end(other)
+
+
+def _begin_collisions(
+    sprite_lists: SpriteLists, ordnance: Ordnance, touching: List[arcade.Sprite]
+):
+    contacts = sprite_lists.collision_world.contacts
+    for other in touching:
+        if contacts.get(ordnance.sprite, other).began:
+            ordnance.on_collision_begin(other)
+
+
+def vehicle_hits_vehicle(delta_time: float, sprite_lists: SpriteLists):
+    """
+    Push apart vehicles that moved into each other this tick, and bounce them off
+    each other with an impulse fed into each drive mode's external force.
+
+    Call after vehicles move, before the collision world is updated.
+    """
+    collision_world = sprite_lists.collision_world
+    for sprite_a, sprite_b in collision_world.find_vehicle_pairs():
+        sprite_a: LinkedSprite[Vehicle]
+        sprite_b: LinkedSprite[Vehicle]
+        contact = collision_world.get_contact(sprite_a, sprite_b)
+        if contact is None:
+            continue
+        # normal points from b toward a
+        normal = contact.normal
+        depth = contact.depth
+        vehicle_a = sprite_a.owner
+        vehicle_b = sprite_b.owner
+
+        # Velocity of a relative to b, along the normal
+        motion_a = collision_world.get_motion_since_update(sprite_a)
+        motion_b = collision_world.get_motion_since_update(sprite_b)
+        closing_speed = (
+            (motion_a[0] - motion_b[0]) * normal[0]
+            + (motion_a[1] - motion_b[1]) * normal[1]
+        ) / delta_time
+        if closing_speed < 0:
+            # Vehicles all weigh the same, so they share the impulse equally
+            impulse = -(1 + VEHICLE_RESTITUTION) * closing_speed / 2
+            vehicle_a.movement.apply_external_force(
+                (normal[0] * impulse, normal[1] * impulse, 0)
             )
+            vehicle_b.movement.apply_external_force(
+                (-normal[0] * impulse, -normal[1] * impulse, 0)
+            )
+
+        # Separate the vehicles so they do not sink into each other, without pushing
+        # either into a wall
+        _push_vehicle(vehicle_a, normal, depth / 2)
+        _push_vehicle(vehicle_b, normal, -depth / 2)
+
+
+def _push_vehicle(vehicle: Vehicle, normal, distance: float):
+    push = (normal[0] * distance, normal[1] * distance, 0)
+    impact = vehicle.movement.find_time_of_impact(vehicle, push)
+    vehicle.location = vehicle.movement.add_vector3(
+        vehicle.movement.scale_vector3(push, impact.fraction), vehicle.location
+    )
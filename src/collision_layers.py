@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from enum import IntFlag
+from typing import Dict
+
+
+class CollisionLayer(IntFlag):
+    """
+    Categories of collidable things.  Combine with `|` to build a mask of layers to
+    query.
+    """
+
+    NONE = 0
+    WALL = 1
+    VEHICLE = 2
+    PROJECTILE = 4
+    BEAM = 8
+    EXPLOSION = 16
+    PICKUP = 32
+
+    ALL = WALL | VEHICLE | PROJECTILE | BEAM | EXPLOSION | PICKUP
+
+
+_collision_masks: Dict[CollisionLayer, CollisionLayer] = {}
+"For each layer, the mask of layers it collides with"
+
+
+def get_collision_mask(layer: CollisionLayer) -> CollisionLayer:
+    """
+    Mask of every layer that things on `layer` collide with.  Check a candidate's
+    layer against this mask before doing any geometry.
+    """
+    return _collision_masks.get(layer, CollisionLayer.NONE)
+
+
+def layers_collide(layer_a: CollisionLayer, layer_b: CollisionLayer) -> bool:
+    return bool(get_collision_mask(layer_a) & layer_b)
+
+
+def set_layers_collide(
+    layer_a: CollisionLayer, layer_b: CollisionLayer, collide: bool = True
+):
+    """
+    Configure whether two layers collide.  Always symmetric: if a collides with b,
+    b collides with a.
+    """
+    for layer, other in ((layer_a, layer_b), (layer_b, layer_a)):
+        mask = get_collision_mask(layer)
+        _collision_masks[layer] = mask | other if collide else mask & ~other
+
+
+# Default layer-pair matrix.  Ordnance never collides with other ordnance.
+set_layers_collide(CollisionLayer.WALL, CollisionLayer.VEHICLE)
+set_layers_collide(CollisionLayer.VEHICLE, CollisionLayer.VEHICLE)
+for _ordnance_layer in (
+    CollisionLayer.PROJECTILE,
+    CollisionLayer.BEAM,
+    CollisionLayer.EXPLOSION,
+):
+    set_layers_collide(_ordnance_layer, CollisionLayer.WALL)
+    set_layers_collide(_ordnance_layer, CollisionLayer.VEHICLE)
+set_layers_collide(CollisionLayer.PICKUP, CollisionLayer.VEHICLE)
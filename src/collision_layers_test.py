@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+from collision_layers import (
+    CollisionLayer,
+    get_collision_mask,
+    layers_collide,
+    set_layers_collide,
+)
+
+
+class TestCollisionLayers(TestCase):
+    def test_default_matrix(self):
+        self.assertEqual(
+            get_collision_mask(CollisionLayer.PROJECTILE),
+            CollisionLayer.WALL | CollisionLayer.VEHICLE,
+        )
+        self.assertTrue(layers_collide(CollisionLayer.PICKUP, CollisionLayer.VEHICLE))
+        self.assertFalse(layers_collide(CollisionLayer.PICKUP, CollisionLayer.WALL))
+        self.assertFalse(
+            layers_collide(CollisionLayer.PROJECTILE, CollisionLayer.EXPLOSION)
+        )
+
+    def test_configure_is_symmetric(self):
+        set_layers_collide(CollisionLayer.PROJECTILE, CollisionLayer.BEAM)
+        try:
+            self.assertTrue(
+                layers_collide(CollisionLayer.BEAM, CollisionLayer.PROJECTILE)
+            )
+        finally:
+            set_layers_collide(CollisionLayer.PROJECTILE, CollisionLayer.BEAM, False)
+        self.assertFalse(layers_collide(CollisionLayer.BEAM, CollisionLayer.PROJECTILE))
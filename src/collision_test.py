@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+import arcade
+
+from audio import disable_audio
+from collision import VEHICLE_RESTITUTION, vehicle_hits_vehicle
+from sprite_lists import SpriteLists
+from test_fakes import FakePlayer
+from vehicle import Vehicle
+
+
+class TestVehicleHitsVehicle(TestCase):
+    def setUp(self):
+        disable_audio()
+        self.sprite_lists = SpriteLists()
+        # 50 wide, 25 tall while facing along x
+        self.vehicle_a = Vehicle(FakePlayer(), self.sprite_lists, 0)
+        self.vehicle_b = Vehicle(FakePlayer(), self.sprite_lists, 1)
+
+    def collide(self, a_from: float, a_to: float, b: float) -> float:
+        """
+        Drive vehicle a along y = 100 from `a_from` to `a_to`, into vehicle b parked
+        at `b`, then resolve the collision.  Returns how deep they overlapped.
+        """
+        collision_world = self.sprite_lists.collision_world
+        self.vehicle_a.location = (a_from, 100, 0)
+        self.vehicle_b.location = (b, 100, 0)
+        collision_world.bake_walls()
+        collision_world.update()
+
+        self.vehicle_a.location = (a_to, 100, 0)
+        contact = collision_world.get_contact(
+            self.vehicle_a.sprite, self.vehicle_b.sprite
+        )
+        # Normal points from b toward a
+        self.assertEqual(contact.normal, (-1, 0))
+        vehicle_hits_vehicle(1 / 60, self.sprite_lists)
+        return contact.depth
+
+    def get_external_velocity(self, vehicle: Vehicle):
+        return vehicle.movement.vehicle_type.external_velocity
+
+    def test_separates_along_normal(self):
+        depth = self.collide(80, 100, 140)
+        self.assertAlmostEqual(depth, 10)
+
+        self.assertAlmostEqual(self.vehicle_a.center_x, 100 - depth / 2)
+        self.assertAlmostEqual(self.vehicle_b.center_x, 140 + depth / 2)
+        self.assertAlmostEqual(self.vehicle_a.center_y, 100)
+        self.assertAlmostEqual(self.vehicle_b.center_y, 100)
+        self.assertIsNone(
+            self.sprite_lists.collision_world.get_contact(
+                self.vehicle_a.sprite, self.vehicle_b.sprite
+            )
+        )
+
+    def test_applies_equal_and_opposite_impulses(self):
+        self.collide(80, 100, 140)
+
+        impulse_a = self.get_external_velocity(self.vehicle_a)
+        impulse_b = self.get_external_velocity(self.vehicle_b)
+        # Closing at 20 pixels per tick, shared equally
+        closing_speed = 20 * 60
+        self.assertAlmostEqual(
+            impulse_a[0], -(1 + VEHICLE_RESTITUTION) * closing_speed / 2
+        )
+        self.assertAlmostEqual(impulse_a[1], 0)
+        self.assertEqual(
+            tuple(-component for component in impulse_a[:2]), impulse_b[:2]
+        )
+
+    def test_no_impulse_when_separating(self):
+        # Already overlapping, but a is backing away from b
+        self.collide(110, 100, 140)
+
+        self.assertEqual(self.get_external_velocity(self.vehicle_a), (0, 0, 0))
+        self.assertEqual(self.get_external_velocity(self.vehicle_b), (0, 0, 0))
+        self.assertAlmostEqual(self.vehicle_b.center_x, 145)
+
+    def test_never_pushes_a_vehicle_through_a_wall(self):
+        # Just past b's front bumper, closer than its half of the overlap
+        wall = arcade.SpriteSolidColor(10, 100, arcade.color.BLACK)
+        wall.position = (172, 100)
+        self.sprite_lists.walls.append(wall)
+        self.collide(80, 100, 140)
+
+        # Pushed as far as it fits, measured with the shape that movement sweeps
+        vehicle_b = self.vehicle_b
+        front = max(x for x, _ in vehicle_b.movement.local_hit_box)
+        self.assertGreater(vehicle_b.center_x, 140)
+        self.assertLessEqual(vehicle_b.center_x + front, wall.left)
+        # The vehicle that hit it is still pushed its full share
+        self.assertAlmostEqual(self.vehicle_a.center_x, 95)
@@ -0,0 +1,784 @@
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import arcade
+import numpy as np
+
+from arena.distance_field import DistanceField
+from collision_layers import CollisionLayer
+from contact_cache import ContactCache
+from iron_math import add_vec, scale_vec
+from narrowphase import (
+    Contact,
+    Obb,
+    ObbCache,
+    circle_obb_contact,
+    closest_point_on_polygon,
+    obb_obb_contact,
+    point_polygon_distance,
+    polygon_contact,
+    raycast_sprite,
+)
+from spatial_grid import SpatialGrid, get_sprite_bounds
+from sweep_and_prune import SweepAndPrune
+
+TIME_OF_IMPACT_ITERATIONS = 8
+"""
+Bisection steps used to find a time of impact.  Each step halves the error, so the
+result is within 1/256th of the step in which the impact happened.
+"""
+
+
+class RaycastHit:
+    """
+    Result of a raycast or segment sweep against the `CollisionWorld`.
+    """
+
+    distance: float
+    "Distance from the ray's origin to `point`"
+    fraction: float
+    "Time of impact: how far along the ray or segment `point` is, from 0 to 1"
+    point: Tuple[float, float]
+    "Where the ray first touches `sprite`"
+    sprite: arcade.Sprite
+    layer: CollisionLayer
+    "Which layer `sprite` belongs to"
+
+    def __init__(
+        self,
+        distance: float,
+        fraction: float,
+        point: Tuple[float, float],
+        sprite: arcade.Sprite,
+        layer: CollisionLayer,
+    ):
+        self.distance = distance
+        self.fraction = fraction
+        self.point = point
+        self.sprite = sprite
+        self.layer = layer
+
+
+class TimeOfImpact:
+    """
+    Result of casting a moving shape through the `CollisionWorld`.
+    """
+
+    fraction: float
+    "How much of the attempted motion can happen before touching anything, from 0 to 1"
+    normal: Optional[Tuple[float, float]]
+    "Unit vector pointing away from the surface that was hit, or `None` if nothing was"
+    sprite: Optional[arcade.Sprite]
+    "What was hit, or `None`"
+
+    def __init__(
+        self,
+        fraction: float,
+        normal: Optional[Tuple[float, float]] = None,
+        sprite: Optional[arcade.Sprite] = None,
+    ):
+        self.fraction = fraction
+        self.normal = normal
+        self.sprite = sprite
+
+
+class CollisionWorld:
+    """
+    Owns the collision shapes of walls and vehicles, indexed by spatial grids, and
+    answers geometric queries against them.
+
+    Beams, explosions, movement, and any future AI all share this one index instead
+    of each scanning sprite lists on their own.
+
+    Walls never move, so they are binned once by `bake_walls`.  Vehicles must be
+    rebinned by calling `update` every tick after they move.
+
+    Queries accept a `mask` of `CollisionLayer`s to search, and an optional sprite
+    to `ignore`, typically the sprite doing the asking.
+    """
+
+    def __init__(self, walls: arcade.SpriteList, vehicles: arcade.SpriteList):
+        self._walls = walls
+        self._vehicles = vehicles
+        self._wall_grid = SpatialGrid()
+        self._vehicle_grid = SpatialGrid()
+        self._vehicle_positions: Dict[arcade.Sprite, Tuple[float, float]] = {}
+        self._vehicle_motion: Dict[arcade.Sprite, Tuple[float, float]] = {}
+        "How far each vehicle moved between the last two calls to `update`"
+        self._max_vehicle_motion = 0.0
+        self._vehicle_sweep = SweepAndPrune()
+        self._obbs = ObbCache()
+        self.wall_distance_field: Optional[DistanceField] = None
+        "Distance to the nearest wall, if the arena baked one"
+        self.contacts = ContactCache()
+        """
+        Results of `overlap_sprite`, `contact_sprite`, and `get_contact`, kept
+        between ticks to warm start them and to report begin and end events.
+        """
+
+    def bake_walls(self, distance_field: Optional[DistanceField] = None):
+        """
+        Bin every wall.  Call once after the arena is loaded.
+
+        The arena's `distance_field`, if given, lets batched queries skip
+        everything that is far from walls.
+        """
+        self._wall_grid.rebuild(self._walls)
+        self.wall_distance_field = distance_field
+
+    def get_vehicle_bounding_circles(
+        self,
+    ) -> Tuple[List[arcade.Sprite], np.ndarray, np.ndarray]:
+        """
+        Return vehicle sprites, and the (V, 2) centers and (V,) radii of circles
+        around them, for culling large batches of queries with NumPy before
+        running exact ones.
+
+        Circles are grown by how far each vehicle moved in the last update, to
+        also cover `moving` queries.
+        """
+        vehicles = list(self._vehicles)
+        centers = np.empty((len(vehicles), 2))
+        radii = np.empty(len(vehicles))
+        for index, vehicle in enumerate(vehicles):
+            left, bottom, right, top = get_sprite_bounds(vehicle)
+            centers[index] = ((left + right) / 2, (bottom + top) / 2)
+            motion = self._vehicle_motion.get(vehicle, (0.0, 0.0))
+            radii[index] = math.hypot(right - left, top - bottom) / 2 + math.hypot(
+                *motion
+            )
+        return vehicles, centers, radii
+
+    def update(self):
+        """
+        Rebin vehicles.  Call every tick after vehicles move, before anything
+        queries the world.
+        """
+        self._vehicle_grid.rebuild(self._vehicles)
+        previous_positions = self._vehicle_positions
+        self._vehicle_positions = {}
+        self._vehicle_motion = {}
+        self._max_vehicle_motion = 0.0
+        for vehicle in self._vehicles:
+            position = vehicle.position
+            self._vehicle_positions[vehicle] = position
+            previous = previous_positions.get(vehicle)
+            if previous is None:
+                continue
+            motion = (position[0] - previous[0], position[1] - previous[1])
+            self._vehicle_motion[vehicle] = motion
+            self._max_vehicle_motion = max(
+                self._max_vehicle_motion, abs(motion[0]), abs(motion[1])
+            )
+
+    def find_vehicle_pairs(self) -> List[Tuple[arcade.Sprite, arcade.Sprite]]:
+        """
+        Return every pair of vehicles whose bounding boxes overlap, using their
+        current positions.
+        """
+        return self._vehicle_sweep.find_pairs(self._vehicles)
+
+    def get_motion_since_update(self, vehicle: arcade.Sprite) -> Tuple[float, float]:
+        """
+        How far a vehicle has moved since the last call to `update`.
+        """
+        previous = self._vehicle_positions.get(vehicle)
+        if previous is None:
+            return (0.0, 0.0)
+        position = vehicle.position
+        return (position[0] - previous[0], position[1] - previous[1])
+
+    def overlap_sprite(
+        self,
+        sprite: arcade.Sprite,
+        mask: CollisionLayer = CollisionLayer.ALL,
+        ignore: Optional[arcade.Sprite] = None,
+    ) -> List[arcade.Sprite]:
+        """
+        Return every sprite whose hit box overlaps `sprite`'s hit box.
+        """
+        return [
+            candidate
+            for grid, layer in self._get_grids(mask)
+            for candidate in grid.query(sprite)
+            if candidate is not ignore
+            and self.contacts.test(sprite, candidate, self._obbs).contact is not None
+        ]
+
+    def contact_sprite(
+        self,
+        sprite: arcade.Sprite,
+        mask: CollisionLayer = CollisionLayer.ALL,
+        ignore: Optional[arcade.Sprite] = None,
+    ) -> List[Tuple[arcade.Sprite, Contact]]:
+        """
+        Like `overlap_sprite`, but also return how each overlapping sprite touches
+        `sprite`.  Contact normals point toward `sprite`.
+        """
+        contacts: List[Tuple[arcade.Sprite, Contact]] = []
+        for grid, layer in self._get_grids(mask):
+            for candidate in grid.query(sprite):
+                if candidate is ignore:
+                    continue
+                contact = self.contacts.test(sprite, candidate, self._obbs).contact
+                if contact is not None:
+                    contacts.append((candidate, contact))
+        return contacts
+
+    def get_contact(
+        self, sprite_a: arcade.Sprite, sprite_b: arcade.Sprite
+    ) -> Optional[Contact]:
+        """
+        How two sprites touch, with the normal pointing toward `sprite_a`, or `None`
+        if they do not overlap.
+        """
+        return self.contacts.test(sprite_a, sprite_b, self._obbs).contact
+
+    def overlap_obb(
+        self,
+        obb: Obb,
+        mask: CollisionLayer = CollisionLayer.ALL,
+        ignore: Optional[arcade.Sprite] = None,
+    ) -> List[arcade.Sprite]:
+        """
+        Return every sprite whose hit box overlaps an oriented box.
+        """
+        corners = obb.get_corners()
+        xs = [corner[0] for corner in corners]
+        ys = [corner[1] for corner in corners]
+        return [
+            candidate
+            for grid, layer in self._get_grids(mask)
+            for candidate in grid.query_bounds(min(xs), min(ys), max(xs), max(ys))
+            if candidate is not ignore and self._overlaps_obb(obb, corners, candidate)
+        ]
+
+    def overlap_circle(
+        self,
+        center: Tuple[float, float],
+        radius: float,
+        mask: CollisionLayer = CollisionLayer.ALL,
+        ignore: Optional[arcade.Sprite] = None,
+    ) -> List[arcade.Sprite]:
+        """
+        Return every sprite whose hit box overlaps a circle.
+        """
+        return [
+            sprite
+            for sprite, layer in self._overlap_circle_with_layers(
+                center, radius, mask, ignore
+            )
+        ]
+
+    def raycast(
+        self,
+        origin: Tuple[float, float],
+        direction: Tuple[float, float],
+        max_distance: float,
+        mask: CollisionLayer = CollisionLayer.ALL,
+        ignore: Optional[arcade.Sprite] = None,
+        radius: float = 0,
+        moving: bool = False,
+    ) -> Optional[RaycastHit]:
+        """
+        Find the first sprite hit by a ray.  `direction` must be a unit vector.
+
+        A non-zero `radius` sweeps a circle along the ray instead of a point, for
+        things with thickness, such as projectiles.
+
+        `moving` treats the ray as the path of something that moved along it during
+        the last tick, while vehicles were also moving:
+
+        - Each vehicle is tested against the ray's motion relative to that vehicle, so
+          a vehicle that drove across the path is hit, and one that drove over the
+          origin after the ray left it is not.
+        - A sprite already touching the origin only counts as a hit if it still
+          touches the end of the ray.  Something moving out of a sprite, such as a
+          bullet leaving the muzzle of its own vehicle, is not impacting it.
+
+        Returns `None` if nothing is hit within `max_distance`.
+        """
+        hits = self._trace(
+            origin,
+            direction,
+            max_distance,
+            mask,
+            ignore,
+            radius,
+            moving,
+            True,
+        )
+        return hits[0] if hits else None
+
+    def sweep_segment(
+        self,
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+        mask: CollisionLayer = CollisionLayer.ALL,
+        ignore: Optional[arcade.Sprite] = None,
+        radius: float = 0,
+        moving: bool = False,
+    ) -> List[RaycastHit]:
+        """
+        Find every sprite touched by a line segment, sorted nearest to `start` first.
+        The first hit is the earliest time of impact.
+
+        `radius` and `moving` are the same as for `raycast`.
+        """
+        delta_x = end[0] - start[0]
+        delta_y = end[1] - start[1]
+        length = math.sqrt(delta_x * delta_x + delta_y * delta_y)
+        if length == 0:
+            return [
+                RaycastHit(0.0, 0.0, start, sprite, layer)
+                for sprite, layer in self._overlap_circle_with_layers(
+                    start, radius, mask, ignore
+                )
+            ]
+        direction = (delta_x / length, delta_y / length)
+        return self._trace(
+            start,
+            direction,
+            length,
+            mask,
+            ignore,
+            radius,
+            moving,
+            False,
+        )
+
+    def raycast_many(
+        self,
+        origin: Tuple[float, float],
+        directions: np.ndarray,
+        max_distance: float,
+        mask: CollisionLayer = CollisionLayer.ALL,
+        ignore: Optional[arcade.Sprite] = None,
+    ) -> List[Optional[RaycastHit]]:
+        """
+        Find the first sprite hit by each of many rays from the same origin, such as
+        the pellets of a shotgun blast.  `directions` is an (N, 2) array of unit
+        vectors.
+
+        Candidates are gathered once for all rays, then every ray is intersected
+        with every edge of every candidate's hit box in one NumPy operation.  A
+        sprite containing `origin` is hit by every ray, at distance 0.
+
+        Returns one hit, or `None`, per ray.
+        """
+        directions = np.asarray(directions, dtype=float).reshape(-1, 2)
+        hits: List[Optional[RaycastHit]] = [None] * len(directions)
+        candidates = self._find_along_rays(origin, directions, max_distance, mask)
+
+        edge_starts: List[np.ndarray] = []
+        edge_owners: List[int] = []
+        for index, (sprite, layer) in enumerate(candidates):
+            if sprite is ignore:
+                continue
+            points = sprite.get_adjusted_hit_box()
+            if closest_point_on_polygon(origin, points)[1]:
+                return [
+                    RaycastHit(0.0, 0.0, origin, sprite, layer)
+                    for _ in range(len(directions))
+                ]
+            edge_starts.append(np.asarray(points, dtype=float))
+            edge_owners.extend([index] * len(points))
+        if len(edge_starts) == 0:
+            return hits
+
+        # Rays are origin + distance * direction, edges are start + along * edge
+        starts = np.concatenate(edge_starts)
+        edges = np.concatenate(
+            [np.roll(points, -1, axis=0) - points for points in edge_starts]
+        )
+        offsets = starts - origin
+        denominators = np.outer(directions[:, 0], edges[:, 1]) - np.outer(
+            directions[:, 1], edges[:, 0]
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            distances = (
+                offsets[:, 0] * edges[:, 1] - offsets[:, 1] * edges[:, 0]
+            ) / denominators
+            along = (
+                np.outer(directions[:, 1], offsets[:, 0])
+                - np.outer(directions[:, 0], offsets[:, 1])
+            ) / denominators
+        # Rays parallel to an edge divide by zero, and are never valid
+        valid = (
+            (denominators != 0)
+            & (along >= 0)
+            & (along <= 1)
+            & (distances >= 0)
+            & (distances <= max_distance)
+        )
+        distances = np.where(valid, distances, np.inf)
+        nearest_edges = distances.argmin(axis=1)
+        nearest_distances = distances[np.arange(len(directions)), nearest_edges]
+        for ray in np.flatnonzero(np.isfinite(nearest_distances)).tolist():
+            distance = float(nearest_distances[ray])
+            sprite, layer = candidates[edge_owners[nearest_edges[ray]]]
+            direction = (float(directions[ray, 0]), float(directions[ray, 1]))
+            hits[ray] = RaycastHit(
+                distance,
+                distance / max_distance if max_distance else 0.0,
+                add_vec(origin, scale_vec(direction, distance)),
+                sprite,
+                layer,
+            )
+        return hits
+
+    def cast_polygon(
+        self,
+        local_points: Sequence[Tuple[float, float]],
+        location: Tuple[float, float, float],
+        motion: Tuple[float, float, float],
+        mask: CollisionLayer = CollisionLayer.ALL,
+        ignore: Optional[arcade.Sprite] = None,
+    ) -> TimeOfImpact:
+        """
+        Find how far a convex polygon can move and turn before it touches anything.
+
+        `local_points` is the polygon relative to its center, unrotated, such as a
+        scaled hit box.  `location` and `motion` are (x, y, radians).
+
+        Candidates are gathered with one grid query covering the whole motion.  The
+        motion is then advanced in steps too short to pass through anything, until
+        it first overlaps a candidate, and the time of impact is bisected within that
+        step.
+
+        Sprites the polygon already overlaps at the start of the motion are ignored,
+        so that something pushed into a wall can still drive back out.
+        """
+        start_points = _transform_points(local_points, location, motion, 0)
+        end_points = _transform_points(local_points, location, motion, 1)
+        xs = [point[0] for point in start_points + end_points]
+        ys = [point[1] for point in start_points + end_points]
+        # Corners swing outward along an arc while turning
+        reach = max(math.hypot(x, y) for x, y in local_points)
+        bulge = reach * abs(motion[2]) / 2
+        local_xs = [point[0] for point in local_points]
+        local_ys = [point[1] for point in local_points]
+        thickness = min(max(local_xs) - min(local_xs), max(local_ys) - min(local_ys))
+        candidates = []
+        for grid, layer in self._get_grids(mask):
+            for sprite in grid.query_bounds(
+                min(xs) - bulge, min(ys) - bulge, max(xs) + bulge, max(ys) + bulge
+            ):
+                if sprite is ignore:
+                    continue
+                points = sprite.get_adjusted_hit_box()
+                if not arcade.are_polygons_intersecting(start_points, points):
+                    candidates.append((sprite, points))
+                    left, bottom, right, top = get_sprite_bounds(sprite)
+                    thickness = min(thickness, right - left, top - bottom)
+        if not candidates:
+            return TimeOfImpact(1.0)
+
+        def find_overlap(polygon):
+            for sprite, points in candidates:
+                if arcade.are_polygons_intersecting(polygon, points):
+                    return (sprite, points)
+            return None
+
+        # No point moves further than this, so stepping by less than the thinnest
+        # shape involved cannot skip over anything
+        travel = math.hypot(motion[0], motion[1]) + reach * abs(motion[2])
+        steps = max(1, math.ceil(travel / max(thickness, 1)))
+        free = 0.0
+        blocker = None
+        for step in range(1, steps + 1):
+            blocked = step / steps
+            blocker = find_overlap(
+                _transform_points(local_points, location, motion, blocked)
+            )
+            if blocker is not None:
+                break
+            free = blocked
+        if blocker is None:
+            return TimeOfImpact(1.0)
+        for _ in range(TIME_OF_IMPACT_ITERATIONS):
+            middle = (free + blocked) / 2
+            overlap = find_overlap(
+                _transform_points(local_points, location, motion, middle)
+            )
+            if overlap is None:
+                free = middle
+            else:
+                blocked = middle
+                blocker = overlap
+        sprite, points = blocker
+        contact = polygon_contact(
+            _transform_points(local_points, location, motion, blocked), points
+        )
+        normal = contact.normal if contact is not None else None
+        return TimeOfImpact(free, normal, sprite)
+
+    def nearest(
+        self,
+        point: Tuple[float, float],
+        k: int = 1,
+        mask: CollisionLayer = CollisionLayer.ALL,
+        ignore: Optional[arcade.Sprite] = None,
+    ) -> List[Tuple[float, arcade.Sprite]]:
+        """
+        Find the `k` sprites closest to `point`, measured to the nearest edge of
+        their hit box.  Distance is 0 if `point` is inside a hit box.
+
+        Returns a list of (distance, sprite), nearest first.  Fewer than `k` if there
+        are not enough sprites in the world.
+        """
+        grids = [grid for grid, layer in self._get_grids(mask)]
+        if k <= 0 or not grids:
+            return []
+        # All grids share the default cell size, so they share cell coordinates
+        cell_size = grids[0].cell_size
+        center = grids[0].get_cell_containing(point)
+        max_radius = 0
+        for grid in grids:
+            bounds = grid.occupied_bounds
+            if bounds is not None:
+                max_radius = max(
+                    max_radius,
+                    abs(bounds[0] - center[0]),
+                    abs(bounds[1] - center[1]),
+                    abs(bounds[2] - center[0]),
+                    abs(bounds[3] - center[1]),
+                )
+
+        distances: Dict[arcade.Sprite, float] = {}
+        # Search outward one ring of cells at a time.  After searching `radius` rings,
+        # anything not yet found is at least `radius * cell_size` away.
+        for radius in range(max_radius + 1):
+            for grid in grids:
+                for cell in grid.cells_in_ring(center, radius):
+                    for sprite in grid.get_cell(cell):
+                        if sprite is ignore or sprite in distances:
+                            continue
+                        distances[sprite] = point_polygon_distance(
+                            point, sprite.get_adjusted_hit_box()
+                        )
+            if len(distances) >= k:
+                kth_distance = sorted(distances.values())[k - 1]
+                if kth_distance <= radius * cell_size:
+                    break
+        found = sorted(
+            ((distance, sprite) for sprite, distance in distances.items()),
+            key=lambda found: found[0],
+        )
+        return found[:k]
+
+    def _overlap_circle_with_layers(
+        self,
+        center: Tuple[float, float],
+        radius: float,
+        mask: CollisionLayer,
+        ignore: Optional[arcade.Sprite],
+    ):
+        x, y = center
+        return [
+            (candidate, layer)
+            for grid, layer in self._get_grids(mask)
+            for candidate in grid.query_bounds(
+                x - radius, y - radius, x + radius, y + radius
+            )
+            if candidate is not ignore
+            and self._overlaps_circle(center, radius, candidate)
+        ]
+
+    def _overlaps_obb(
+        self,
+        obb: Obb,
+        corners: Sequence[Tuple[float, float]],
+        sprite: arcade.Sprite,
+    ):
+        if len(sprite.get_hit_box()) == 4:
+            return obb_obb_contact(obb, self._obbs.get(sprite)) is not None
+        return polygon_contact(corners, sprite.get_adjusted_hit_box()) is not None
+
+    def _overlaps_circle(
+        self, center: Tuple[float, float], radius: float, sprite: arcade.Sprite
+    ):
+        if len(sprite.get_hit_box()) == 4:
+            return (
+                circle_obb_contact(center, radius, self._obbs.get(sprite)) is not None
+            )
+        return point_polygon_distance(center, sprite.get_adjusted_hit_box()) <= radius
+
+    def _get_grids(self, mask: CollisionLayer):
+        """
+        Returns a list of (grid, layer) for each layer in `mask`
+        """
+        grids: List[Tuple[SpatialGrid, CollisionLayer]] = []
+        if mask & CollisionLayer.WALL:
+            grids.append((self._wall_grid, CollisionLayer.WALL))
+        if mask & CollisionLayer.VEHICLE:
+            grids.append((self._vehicle_grid, CollisionLayer.VEHICLE))
+        return grids
+
+    def _find_along_rays(
+        self,
+        origin: Tuple[float, float],
+        directions: np.ndarray,
+        max_distance: float,
+        mask: CollisionLayer,
+    ) -> List[Tuple[arcade.Sprite, CollisionLayer]]:
+        """
+        Sprites in any grid cell crossed by any of the rays, without duplicates.
+        """
+        candidates: List[Tuple[arcade.Sprite, CollisionLayer]] = []
+        ends = (np.asarray(origin) + directions * max_distance).tolist()
+        for grid, layer in self._get_grids(mask):
+            found = set()
+            for end in ends:
+                for _, cell in grid.cells_along_segment(origin, (end[0], end[1])):
+                    for sprite in grid.get_cell(cell):
+                        if sprite not in found:
+                            found.add(sprite)
+                            candidates.append((sprite, layer))
+        return candidates
+
+    def _trace(
+        self,
+        origin: Tuple[float, float],
+        direction: Tuple[float, float],
+        max_distance: float,
+        mask: CollisionLayer,
+        ignore: Optional[arcade.Sprite],
+        radius: float,
+        moving: bool,
+        first_only: bool,
+    ):
+        end = add_vec(origin, scale_vec(direction, max_distance))
+        tested = set()
+        hits: List[RaycastHit] = []
+        closest = math.inf
+        for grid, layer in self._get_grids(mask):
+            relative = moving and layer == CollisionLayer.VEHICLE
+            # Relative to a moving vehicle, the ray starts displaced by its motion
+            margin = radius + self._max_vehicle_motion if relative else radius
+            for fraction, candidates in self._walk_grid(grid, origin, end, margin):
+                if first_only and closest < fraction * max_distance:
+                    # Everything in this cell and beyond is further than our hit
+                    break
+                for sprite in candidates:
+                    if sprite is ignore or sprite in tested:
+                        continue
+                    tested.add(sprite)
+                    motion = self._vehicle_motion.get(sprite) if relative else None
+                    if motion:
+                        distance = self._raycast_moving_sprite(
+                            origin, end, max_distance, sprite, motion, radius
+                        )
+                    else:
+                        distance = raycast_sprite(
+                            origin, direction, max_distance, sprite, radius, self._obbs
+                        )
+                    if distance is None:
+                        continue
+                    if (
+                        moving
+                        and distance == 0
+                        and point_polygon_distance(end, sprite.get_adjusted_hit_box())
+                        > radius
+                    ):
+                        # Started touching the sprite, but moved away from it
+                        continue
+                    if distance < closest:
+                        closest = distance
+                    hits.append(
+                        RaycastHit(
+                            distance,
+                            distance / max_distance if max_distance else 0.0,
+                            add_vec(origin, scale_vec(direction, distance)),
+                            sprite,
+                            layer,
+                        )
+                    )
+        hits.sort(key=lambda hit: hit.distance)
+        return hits
+
+    def _raycast_moving_sprite(
+        self,
+        origin: Tuple[float, float],
+        end: Tuple[float, float],
+        max_distance: float,
+        sprite: arcade.Sprite,
+        motion: Tuple[float, float],
+        radius: float,
+    ):
+        """
+        Raycast in the frame of reference of a sprite which moved by `motion` over the
+        same tick the ray swept from `origin` to `end`.
+
+        Returns distance along the original ray, like `raycast_sprite`.
+        """
+        relative_origin = (origin[0] + motion[0], origin[1] + motion[1])
+        delta_x = end[0] - relative_origin[0]
+        delta_y = end[1] - relative_origin[1]
+        length = math.sqrt(delta_x * delta_x + delta_y * delta_y)
+        if length == 0:
+            # Moving in lockstep with the sprite
+            if point_polygon_distance(end, sprite.get_adjusted_hit_box()) <= radius:
+                return 0.0
+            return None
+        distance = raycast_sprite(
+            relative_origin,
+            (delta_x / length, delta_y / length),
+            length,
+            sprite,
+            radius,
+            self._obbs,
+        )
+        if distance is None:
+            return None
+        # Same time of impact, measured along the original ray
+        return distance / length * max_distance
+
+    def _walk_grid(
+        self,
+        grid: SpatialGrid,
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+        radius: float,
+    ):
+        """
+        Yield (fraction, candidates) for sprites that might touch a segment, in order
+        along the segment where possible.
+
+        `radius` grows the segment on every side.
+        """
+        if radius == 0:
+            # Walk cells in order along the ray so that raycasts can stop early
+            for fraction, cell in grid.cells_along_segment(start, end):
+                yield (fraction, grid.get_cell(cell))
+        else:
+            # A thick ray can touch sprites in cells beside the ones it crosses.
+            # Thick rays are short projectile sweeps, so a bounding box query is cheap.
+            yield (
+                0.0,
+                grid.query_bounds(
+                    min(start[0], end[0]) - radius,
+                    min(start[1], end[1]) - radius,
+                    max(start[0], end[0]) + radius,
+                    max(start[1], end[1]) + radius,
+                ),
+            )
+
+
+def _transform_points(
+    local_points: Sequence[Tuple[float, float]],
+    location: Tuple[float, float, float],
+    motion: Tuple[float, float, float],
+    fraction: float,
+):
+    """
+    Place a polygon at `location`, advanced by a fraction of `motion`.
+    """
+    x = location[0] + motion[0] * fraction
+    y = location[1] + motion[1] * fraction
+    radians = location[2] + motion[2] * fraction
+    c = math.cos(radians)
+    s = math.sin(radians)
+    return [(x + px * c - py * s, y + px * s + py * c) for px, py in local_points]
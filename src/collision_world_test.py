@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import math
+from unittest import TestCase
+
+import arcade
+
+from collision_layers import CollisionLayer
+from collision_world import CollisionWorld
+
+
+def make_box(x: float, y: float, width: int = 20, height: int = 20):
+    sprite = arcade.SpriteSolidColor(width, height, arcade.color.BLACK)
+    sprite.position = (x, y)
+    return sprite
+
+
+class TestCollisionWorld(TestCase):
+    def setUp(self):
+        self.walls = arcade.SpriteList()
+        self.vehicles = arcade.SpriteList()
+        self.world = CollisionWorld(self.walls, self.vehicles)
+        self.wall = make_box(200, 0)
+        self.walls.append(self.wall)
+        self.vehicle = make_box(100, 0)
+        self.vehicles.append(self.vehicle)
+        self.world.bake_walls()
+        self.world.update()
+
+    def test_raycast_stops_at_first_hit(self):
+        hit = self.world.raycast((0, 0), (1, 0), 400)
+        self.assertIs(hit.sprite, self.vehicle)
+        self.assertEqual(hit.layer, CollisionLayer.VEHICLE)
+        self.assertAlmostEqual(hit.distance, 90)
+
+        hit = self.world.raycast((0, 0), (1, 0), 400, CollisionLayer.WALL)
+        self.assertIs(hit.sprite, self.wall)
+        self.assertAlmostEqual(hit.point[0], 190)
+
+        self.assertIsNone(self.world.raycast((0, 0), (-1, 0), 400))
+
+    def test_raycast_many_matches_raycast(self):
+        directions = [(1, 0), (math.cos(0.2), math.sin(0.2)), (-1, 0), (0, 1)]
+        hits = self.world.raycast_many((0, 0), directions, 400)
+        for direction, hit in zip(directions, hits):
+            expected = self.world.raycast((0, 0), direction, 400)
+            if expected is None:
+                self.assertIsNone(hit)
+                continue
+            self.assertIs(hit.sprite, expected.sprite)
+            self.assertAlmostEqual(hit.distance, expected.distance)
+            self.assertAlmostEqual(hit.point[1], expected.point[1])
+
+        hits = self.world.raycast_many(
+            (0, 0), [(1, 0)], 400, CollisionLayer.WALL, self.wall
+        )
+        self.assertEqual(hits, [None])
+
+    def test_raycast_many_from_inside(self):
+        hits = self.world.raycast_many((100, 0), [(1, 0), (0, 1)], 400)
+        self.assertEqual([hit.sprite for hit in hits], [self.vehicle, self.vehicle])
+        self.assertEqual([hit.distance for hit in hits], [0, 0])
+        hits = self.world.raycast_many((100, 0), [(1, 0)], 400, ignore=self.vehicle)
+        self.assertIs(hits[0].sprite, self.wall)
+
+    def test_sweep_segment_returns_every_hit_in_order(self):
+        hits = self.world.sweep_segment((0, 0), (300, 0))
+        self.assertEqual([hit.sprite for hit in hits], [self.vehicle, self.wall])
+
+    def test_overlap_circle(self):
+        self.assertEqual(self.world.overlap_circle((100, 30), 25), [self.vehicle])
+        self.assertEqual(self.world.overlap_circle((100, 30), 15), [])
+
+    def test_nearest(self):
+        found = self.world.nearest((180, 0), 2)
+        self.assertEqual(
+            [sprite for distance, sprite in found], [self.wall, self.vehicle]
+        )
+        self.assertAlmostEqual(found[0][0], 10)
+        self.assertAlmostEqual(found[1][0], 70)
+
+        found = self.world.nearest((180, 0), 5, CollisionLayer.VEHICLE)
+        self.assertEqual(found, [(70, self.vehicle)])
+
+    def test_moving_sweep(self):
+        # A thin wall between two ticks' positions is not skipped over
+        self.walls.append(make_box(50, 0, 2, 20))
+        self.world.bake_walls()
+        hit = self.world.raycast((0, 0), (1, 0), 80, radius=1, moving=True)
+        self.assertEqual(hit.layer, CollisionLayer.WALL)
+        self.assertAlmostEqual(hit.fraction, 48 / 80)
+
+        # Moving out of a sprite is not an impact
+        self.assertIsNotNone(self.world.raycast((105, 5), (0, 1), 10))
+        self.assertIsNone(self.world.raycast((105, 5), (0, 1), 10, moving=True))
+
+        # A vehicle that drove across the path during the tick is hit, even though
+        # the path's start and end never touch it
+        self.vehicle.position = (100, 40)
+        self.world.update()
+        self.vehicle.position = (100, -40)
+        self.world.update()
+        self.assertIsNone(self.world.raycast((95, 0), (1, 0), 10))
+        hit = self.world.raycast((95, 0), (1, 0), 10, moving=True)
+        self.assertIs(hit.sprite, self.vehicle)
+        self.assertAlmostEqual(hit.fraction, 0.375)
+
+    def test_cast_polygon(self):
+        square = [(-5, -5), (5, -5), (5, 5), (-5, 5)]
+
+        # Stops touching the wall's left edge at x = 190
+        impact = self.world.cast_polygon(
+            square, (150, 0, 0), (100, 0, 0), CollisionLayer.WALL
+        )
+        self.assertIs(impact.sprite, self.wall)
+        self.assertAlmostEqual(impact.fraction, 0.35, places=2)
+        self.assertAlmostEqual(impact.normal[0], -1)
+        self.assertAlmostEqual(impact.normal[1], 0)
+
+        impact = self.world.cast_polygon(square, (150, 0, 0), (0, 100, 0))
+        self.assertEqual(impact.fraction, 1)
+        self.assertIsNone(impact.sprite)
+
+        # Already overlapping the vehicle, so free to back away from it
+        impact = self.world.cast_polygon(square, (100, 0, 0), (-20, 0, 0))
+        self.assertEqual(impact.fraction, 1)
@@ -9,6 +9,34 @@ SCREEN_TITLE = "John Deer Clown School"
 TICK_DURATION = 1 / 60
 "Duration of a single update tick of the game, measured in seconds"
 
+FRAME_DURATION = 1 / 60
+"""
+How often the window is updated and redrawn, in seconds.  Independent of
+TICK_DURATION: frames that fall between ticks draw sprites interpolated between
+them.
+"""
+
+MAX_TICKS_PER_FRAME = 4
+"""
+Most simulation ticks run in one frame to catch up after a slow frame.  Beyond
+this, the game slows down.
+"""
+
+TICK_BUDGET = 0.008
+"""
+Seconds a tick may take, on average, before cosmetic work is shed to catch up.
+Leaves the rest of each frame for drawing.
+"""
+
+ROUND_UPDATE_RATE = 20
+"Times per second round state, such as countdowns and win checks, is updated"
+
+HUD_UPDATE_RATE = 15
+"Times per second player HUDs are refreshed"
+
+DEBUG_HUD_UPDATE_RATE = 5
+"Times per second the debug HUD readout is rebuilt"
+
 HIT_INDICATOR_DURATION = 0.2
 "How long the car flashes for in seconds"
 
@@ -20,6 +48,12 @@ Also fixes known issue where, when pausing in debugger, update and draw each get
 called twice back-to-back instead of alternating once per.
 """
 
+USE_SIMULATION_THREAD = os.environ.get("USE_SIMULATION_THREAD") == "true"
+"""
+Simulate on a separate thread, drawing the latest snapshot of the world on the
+main thread, so that slow ticks don't hold up drawing.
+"""
+
 START_WITH_ALTERNATE_CONTROLLER_LAYOUT = False
 """
 Use alternate (Mario Kart-style?) controller layout where A/B are gas and brake,
@@ -51,6 +85,18 @@ DRAW_INPUT_DEBUG_HUD = False
 Draw a text overlay listing the name and value of all controller inputs.
 """
 
+DRAW_ORDNANCE_POOL_DEBUG_HUD = False
+"""
+Draw a text overlay with how much of each ordnance pool is in use, and how often it
+ran out.
+"""
+
+DRAW_FRAME_BUDGET_DEBUG_HUD = False
+"""
+Draw a text overlay with how long ticks take against their budget, and how often
+quality was lowered to keep up.
+"""
+
 START_FULLSCREEN = False
 """
 Start the game in fullscreen mode.  Can also be toggled with F11 on keyboard.
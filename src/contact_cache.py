@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+import arcade
+
+from narrowphase import Contact, ObbCache, SeparatingAxis, get_sprite_contact
+
+
+class CachedContact:
+    """
+    What is remembered about one pair of sprites from one tick to the next.
+    """
+
+    separating_axis: SeparatingAxis
+    "Warm start for the next narrowphase test of this pair"
+    contact: Optional[Contact]
+    "Result of the latest test this tick, or `None` if the pair was not touching"
+    was_touching: bool
+    "The pair was touching at the end of the previous tick"
+    seen_tick: int
+    "Tick on which this pair was last tested or reported"
+
+    def __init__(self):
+        self.separating_axis = SeparatingAxis()
+        self.contact = None
+        self.was_touching = False
+        self.seen_tick = -1
+
+    @property
+    def began(self) -> bool:
+        """
+        The pair is touching now, but was not at the end of the previous tick.
+        """
+        return self.contact is not None and not self.was_touching
+
+
+class ContactCache:
+    """
+    Remembers every pair of sprites tested against each other, keyed by
+    (sprite, other), so that persistent contacts are not rediscovered from scratch
+    every tick.
+
+    Each pair keeps the axis that last separated it, which usually rejects the pair
+    again with a single projection.  Comparing what touched this tick to what
+    touched last tick gives begin, stay, and end events.
+
+    Call `end_tick` once per tick after every query, to collect ended contacts and
+    forget pairs that were not tested this tick.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple[arcade.Sprite, arcade.Sprite], CachedContact] = {}
+        self._tick = 0
+
+    def get(
+        self, sprite: arcade.Sprite, other: arcade.Sprite
+    ) -> Optional[CachedContact]:
+        return self._entries.get((sprite, other))
+
+    def test(
+        self,
+        sprite: arcade.Sprite,
+        other: arcade.Sprite,
+        obbs: Optional[ObbCache] = None,
+    ) -> CachedContact:
+        """
+        Run the narrowphase for a pair, warm started from the last test, and record
+        the result.  The contact normal points toward `sprite`.
+        """
+        entry = self._get_or_add(sprite, other)
+        entry.contact = get_sprite_contact(sprite, other, obbs, entry.separating_axis)
+        return entry
+
+    def report(
+        self,
+        sprite: arcade.Sprite,
+        other: arcade.Sprite,
+        contact: Optional[Contact] = None,
+    ) -> CachedContact:
+        """
+        Record that a pair is touching, for queries that find hits on their own,
+        such as raycasts.
+        """
+        entry = self._get_or_add(sprite, other)
+        entry.contact = contact if contact is not None else Contact((0.0, 0.0), 0.0)
+        return entry
+
+    def end_tick(self) -> List[Tuple[arcade.Sprite, arcade.Sprite]]:
+        """
+        Finish the tick.  Returns every pair that was touching at the end of the
+        previous tick, but is not touching now, including pairs that were not
+        tested at all, such as ordnance that was removed.
+        """
+        ended: List[Tuple[arcade.Sprite, arcade.Sprite]] = []
+        tick = self._tick
+        for pair, entry in list(self._entries.items()):
+            touching = entry.seen_tick == tick and entry.contact is not None
+            if entry.was_touching and not touching:
+                ended.append(pair)
+            if entry.seen_tick != tick:
+                del self._entries[pair]
+                continue
+            entry.was_touching = touching
+        self._tick += 1
+        return ended
+
+    def _get_or_add(self, sprite: arcade.Sprite, other: arcade.Sprite):
+        entry = self._entries.get((sprite, other))
+        if entry is None:
+            entry = CachedContact()
+            self._entries[(sprite, other)] = entry
+        elif entry.seen_tick != self._tick:
+            entry.contact = None
+        entry.seen_tick = self._tick
+        return entry
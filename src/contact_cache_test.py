@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+import arcade
+
+from contact_cache import ContactCache
+
+
+def make_box(x: float, y: float):
+    sprite = arcade.SpriteSolidColor(20, 20, arcade.color.BLACK)
+    sprite.position = (x, y)
+    return sprite
+
+
+class TestContactCache(TestCase):
+    def test_begin_stay_end(self):
+        a = make_box(0, 0)
+        b = make_box(15, 0)
+        cache = ContactCache()
+
+        self.assertTrue(cache.test(a, b).began)
+        self.assertEqual(cache.end_tick(), [])
+        contact = cache.test(a, b)
+        self.assertIsNotNone(contact.contact)
+        self.assertFalse(contact.began)
+        self.assertEqual(cache.end_tick(), [])
+
+        b.center_x = 40
+        self.assertIsNone(cache.test(a, b).contact)
+        self.assertEqual(cache.end_tick(), [(a, b)])
+
+    def test_warm_start_rejects_separated_pair(self):
+        a = make_box(0, 0)
+        b = make_box(40, 0)
+        cache = ContactCache()
+
+        self.assertIsNone(cache.test(a, b).contact)
+        self.assertIsNotNone(cache.get(a, b).separating_axis.axis)
+        cache.end_tick()
+        b.center_x = 15
+        # The remembered axis no longer separates them, so the full test runs
+        self.assertTrue(cache.test(a, b).began)
+        self.assertIsNone(cache.get(a, b).separating_axis.axis)
+
+    def test_untested_pairs_end_and_are_forgotten(self):
+        a = make_box(0, 0)
+        b = make_box(15, 0)
+        cache = ContactCache()
+
+        cache.report(a, b)
+        cache.end_tick()
+        # Nothing tested `a` this tick, for example because it was removed
+        self.assertEqual(cache.end_tick(), [(a, b)])
+        self.assertIsNone(cache.get(a, b))
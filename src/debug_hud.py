@@ -1,34 +1,33 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 
 import arcade
 from arcade import Text
 
-from constants import DRAW_DRIVE_MODE_DEBUG_HUD, DRAW_INPUT_DEBUG_HUD
+from constants import (
+    DRAW_DRIVE_MODE_DEBUG_HUD,
+    DRAW_FRAME_BUDGET_DEBUG_HUD,
+    DRAW_INPUT_DEBUG_HUD,
+    DRAW_ORDNANCE_POOL_DEBUG_HUD,
+)
+from frame_budget import FrameBudgetGovernor
+from ordnances.ordnance_pool import OrdnancePools
 from player import Player
-from player_input import PlayerInput
+from player_input import CONTROLS
 
 
 class DebugHud:
-    def __init__(self, players: List[Player]):
+    def __init__(
+        self,
+        players: List[Player],
+        ordnance_pools: OrdnancePools,
+        frame_budget: FrameBudgetGovernor,
+    ):
         self.players = players
-        self.controls = [
-            "x_axis",
-            "y_axis",
-            "rx_axis",
-            "ry_axis",
-            "accelerate_axis",
-            "brake_axis",
-            "primary_fire_button",
-            "secondary_fire_button",
-            "swap_weapons_button",
-            "reload_button",
-            "debug_1",
-            "debug_2",
-            "debug_3",
-            "debug_4",
-        ]
+        self.ordnance_pools = ordnance_pools
+        self.frame_budget = frame_budget
+        self.__readout = ""
         self.__text = Text(
             "Text Drawing Examples",
             0,
@@ -50,11 +49,44 @@ class DebugHud:
                 lines += [f"Layout: {player_input.layout_name}"]
                 lines += [
                     f"{control}: {getattr(player_input, control).value}"
-                    for control in self.controls
+                    for control in CONTROLS
                 ]
+        if DRAW_ORDNANCE_POOL_DEBUG_HUD:
+            lines += [pool.get_readout() for pool in self.ordnance_pools]
+        if DRAW_FRAME_BUDGET_DEBUG_HUD:
+            lines += [self.frame_budget.get_readout()]
         return "\n".join(lines)
 
-    def draw(self):
-        if DRAW_INPUT_DEBUG_HUD or DRAW_DRIVE_MODE_DEBUG_HUD:
-            self.__text.text = self.get_readout()
+    @property
+    def enabled(self) -> bool:
+        return (
+            DRAW_INPUT_DEBUG_HUD
+            or DRAW_DRIVE_MODE_DEBUG_HUD
+            or DRAW_ORDNANCE_POOL_DEBUG_HUD
+            or DRAW_FRAME_BUDGET_DEBUG_HUD
+        )
+
+    @property
+    def readout(self) -> str:
+        "As of the last `update`"
+        return self.__readout
+
+    def update(self):
+        """
+        Rebuild the readout.  May be called off the main thread.
+        """
+        if self.enabled:
+            self.__readout = self.get_readout()
+
+    def draw(self, readout: Optional[str] = None):
+        """
+        Draw `readout`, such as one captured in a `WorldSnapshot`, or else the
+        readout as of the last `update`.
+        """
+        if readout is None:
+            readout = self.__readout
+        if self.enabled:
+            # Laying out text is slow, so this is done only when it changes
+            if readout != self.__text.text:
+                self.__text.text = readout
             self.__text.draw()
@@ -26,11 +26,5 @@ class DriveMode:
     def drive_input(self, delta_time: float, vehicle: Vehicle, input: PlayerInput):
         ...
 
-    def move(
-        self,
-        delta_time: float,
-        vehicle: Vehicle,
-        walls: arcade.SpriteList,
-        vehicles: arcade.SpriteList,
-    ):
+    def move(self, delta_time: float, vehicle: Vehicle):
         ...
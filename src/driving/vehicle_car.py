@@ -112,13 +112,7 @@ class BasicCar(DriveMode):
         self.vehicle_velocity = (x, y, turn)
         return (x, y, turn)
 
-    def move(
-        self,
-        delta_time: float,
-        vehicle: Vehicle,
-        walls: arcade.SpriteList,
-        cars: arcade.SpriteList,
-    ):
+    def move(self, delta_time: float, vehicle: Vehicle):
 
         # If there are external forces moving the car, apply friction
         self.apply_reductive_force(self.friction, delta_time)
@@ -128,47 +122,17 @@ class BasicCar(DriveMode):
         # and external forces that have been applied to this car
         real_velocity = self.get_real_velocity(delta_time)
 
-        # check if the car can move to its new position
-        is_valid_position = self.move_controls.check_for_valid_movement(
-            vehicle, real_velocity, walls, cars
-        )
-
-        if is_valid_position is False:
-            # the vehicle is colliding, this checks to move the vehicle so that the collision visually appears
-            # as close to the wall as possible
-            smaller_velocity = (
-                real_velocity[0] * 0.3,
-                real_velocity[1] * 0.3,
-                real_velocity[2] * 0.3,
-            )
-
-            # check if the car can move to its new position
-            is_valid_position = self.move_controls.check_for_valid_movement(
-                vehicle, smaller_velocity, walls, cars
-            )
+        # find how much of the movement can happen before the car touches something
+        impact = self.move_controls.find_time_of_impact(vehicle, real_velocity)
 
-            if is_valid_position is True:
-                collision_point = self.move_controls.add_vector3(
-                    smaller_velocity, vehicle.location
-                )
+        # move right up to the point of contact, rather than stopping short of it
+        vehicle.location = self.move_controls.add_vector3(
+            self.move_controls.scale_vector3(real_velocity, impact.fraction),
+            vehicle.location,
+        )
 
-                vehicle.location = self.move_controls.add_vector3(
-                    smaller_velocity, vehicle.location
-                )
-            else:
-                collision_point = self.move_controls.add_vector3(
-                    real_velocity, vehicle.location
-                )
-
-            self.collide_at_point(collision_point, real_velocity, delta_time)
-
-        else:
-            # no wall collisions means a valid spot to move to
-            # collisions with other objects result in collision
-            # but are not an invalid position
-            vehicle.location = self.move_controls.add_vector3(
-                real_velocity, vehicle.location
-            )
+        if impact.sprite is not None:
+            self.collide_at_point(vehicle.location, real_velocity, delta_time)
 
         # reset the shadow sprite to the vehicle position
         self.move_controls.set_shadow_sprite_position(vehicle.location, (0, 0, 0))
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import math
+
+
+class FixedTimestep:
+    """
+    Turns variable frame times into a whole number of fixed-length simulation
+    ticks, carrying leftover time over to the next frame.
+
+    Gameplay then does not depend on frame rate.  If frames take so long that more
+    than `max_ticks` are owed, the extra time is dropped, so the game slows down
+    instead of falling further and further behind.
+    """
+
+    tick_duration: float
+    max_ticks: int
+    "Most ticks run in one frame to catch up"
+    accumulated_time: float
+    "Time not yet simulated, always less than one tick after `advance`"
+
+    def __init__(self, tick_duration: float, max_ticks: int):
+        self.tick_duration = tick_duration
+        self.max_ticks = max_ticks
+        self.accumulated_time = 0.0
+
+    @property
+    def blend(self) -> float:
+        """
+        How far the current moment is between the last two ticks, from 0 to 1.
+        """
+        return self.accumulated_time / self.tick_duration
+
+    def advance(self, delta_time: float) -> int:
+        """
+        Add a frame's time, and return how many ticks to run for it.
+        """
+        self.accumulated_time += delta_time
+        ticks = math.floor(self.accumulated_time / self.tick_duration)
+        if ticks > self.max_ticks:
+            self.accumulated_time = 0.0
+            return self.max_ticks
+        self.accumulated_time -= ticks * self.tick_duration
+        return ticks
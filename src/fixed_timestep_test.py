@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+from fixed_timestep import FixedTimestep
+
+
+class TestFixedTimestep(TestCase):
+    def test_carries_leftover_time(self):
+        timestep = FixedTimestep(0.1, 4)
+        self.assertEqual(timestep.advance(0.25), 2)
+        self.assertAlmostEqual(timestep.blend, 0.5)
+        self.assertEqual(timestep.advance(0.07), 1)
+        self.assertAlmostEqual(timestep.blend, 0.2)
+        self.assertEqual(timestep.advance(0.01), 0)
+
+    def test_drops_time_beyond_max_ticks(self):
+        timestep = FixedTimestep(0.1, 4)
+        self.assertEqual(timestep.advance(2), 4)
+        self.assertEqual(timestep.blend, 0)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from enum import IntEnum
+from typing import List, Optional, Tuple
+
+from system_scheduler import System
+
+TICK_TIME_SMOOTHING = 0.1
+"How much each tick moves the average tick time, from 0 to 1"
+DEGRADE_DELAY_TICKS = 30
+"""
+Fewest ticks between lowering quality twice.  Long enough for the average tick
+time to show whether shedding helped, so that one spike doesn't shed everything.
+"""
+RECOVERY_DELAY_TICKS = 60
+"Ticks with headroom to spare, since quality last changed, before it is raised again"
+MAX_RECOVERY_DELAY_TICKS = 600
+"""
+Longest wait before raising quality again.  Each time raising quality puts ticks
+back over budget, the wait doubles, up to this.
+"""
+RECOVERY_HEADROOM = 0.7
+"Fraction of the budget the average tick must fit in before quality is raised"
+
+
+class QualityTier(IntEnum):
+    """
+    How much cosmetic work is shed to keep ticks within budget, from none to most.
+    """
+
+    FULL = 0
+    REDUCED = 1
+    LOW = 2
+    MINIMAL = 3
+
+
+class FrameBudgetGovernor:
+    """
+    Measures each tick against a time budget, lowering the quality tier while ticks
+    run over budget and raising it again once there is headroom to spare.
+
+    Systems registered with `shed` are throttled or skipped from a given tier up.
+    Anything else may check `tier` itself.  Only shed cosmetic work that is part
+    of the measured tick: shedding gameplay would change the match, and shedding
+    anything outside the tick cannot bring ticks back within budget.
+
+    Counts how often each tier is entered and how long it lasts, so that we can see
+    how often quality drops in real matches.
+    """
+
+    budget: float
+    "Seconds each tick should take at most"
+    tier: QualityTier
+    enabled: bool
+    """
+    While `False`, ticks are still measured but the tier only changes through
+    `set_tier`, so that what is simulated doesn't depend on how fast the CPU is.
+    """
+    average_tick_time: float
+    "Smoothed seconds per tick"
+    peak_tick_time: float
+    "Slowest tick so far, in seconds"
+    entered: List[int]
+    "Times each tier was entered"
+    ticks_in_tier: List[int]
+    "Ticks spent in each tier"
+
+    def __init__(self, budget: float):
+        self.budget = budget
+        self.tier = QualityTier.FULL
+        self.enabled = True
+        self.average_tick_time = 0.0
+        self.peak_tick_time = 0.0
+        self.entered = [0] * len(QualityTier)
+        self.ticks_in_tier = [0] * len(QualityTier)
+        self._ticks_since_change = 0
+        self._last_change_raised = False
+        self._recovery_delay = RECOVERY_DELAY_TICKS
+        self._shed: List[Tuple[System, QualityTier, Optional[int]]] = []
+
+    def shed(self, system: System, tier: QualityTier, throttle: Optional[int] = None):
+        """
+        From `tier` up, run `system` only one in every `throttle` times it is due,
+        or not at all if `throttle` is `None`.
+        """
+        self._shed.append((system, tier, throttle))
+        self._shed.sort(key=lambda rule: rule[1])
+        self._apply_tier()
+
+    def record_tick(self, tick_time: float):
+        """
+        Report how many seconds the last tick took.
+        """
+        self.average_tick_time += (
+            tick_time - self.average_tick_time
+        ) * TICK_TIME_SMOOTHING
+        self.peak_tick_time = max(self.peak_tick_time, tick_time)
+        self.ticks_in_tier[self.tier] += 1
+        self._ticks_since_change += 1
+        if not self.enabled:
+            return
+        if (
+            self._last_change_raised
+            and self._ticks_since_change >= self._recovery_delay
+        ):
+            # Raising quality held up, so it may be raised again sooner next time
+            self._recovery_delay = RECOVERY_DELAY_TICKS
+        if self.average_tick_time > self.budget:
+            if (
+                self.tier < QualityTier.MINIMAL
+                and self._ticks_since_change >= DEGRADE_DELAY_TICKS
+            ):
+                if self._last_change_raised:
+                    # Raising quality put ticks back over budget; wait longer
+                    self._recovery_delay = min(
+                        self._recovery_delay * 2, MAX_RECOVERY_DELAY_TICKS
+                    )
+                self.set_tier(QualityTier(self.tier + 1))
+        elif self.average_tick_time < self.budget * RECOVERY_HEADROOM:
+            if (
+                self.tier > QualityTier.FULL
+                and self._ticks_since_change >= self._recovery_delay
+            ):
+                self.set_tier(QualityTier(self.tier - 1))
+
+    def set_tier(self, tier: QualityTier):
+        self._last_change_raised = tier < self.tier
+        self.tier = tier
+        self.entered[tier] += 1
+        self._ticks_since_change = 0
+        self._apply_tier()
+
+    def get_readout(self) -> str:
+        tiers = ", ".join(
+            f"{tier.name.lower()} x{self.entered[tier]} {self.ticks_in_tier[tier]}t"
+            for tier in QualityTier
+        )
+        return (
+            f"quality {self.tier.name.lower()}: "
+            f"tick {self.average_tick_time * 1000:.2f}/{self.budget * 1000:.2f}ms, "
+            f"peak {self.peak_tick_time * 1000:.2f}ms, {tiers}"
+        )
+
+    def _apply_tier(self):
+        for system, _, _ in self._shed:
+            system.enabled = True
+            system.throttle = 1
+        # Rules for higher tiers come later, and win
+        for system, tier, throttle in self._shed:
+            if self.tier >= tier:
+                if throttle is None:
+                    system.enabled = False
+                else:
+                    system.enabled = True
+                    system.throttle = throttle
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+from frame_budget import (
+    DEGRADE_DELAY_TICKS,
+    RECOVERY_DELAY_TICKS,
+    FrameBudgetGovernor,
+    QualityTier,
+)
+from system_scheduler import SystemScheduler
+
+
+class TestFrameBudgetGovernor(TestCase):
+    def setUp(self):
+        self.governor = FrameBudgetGovernor(0.008)
+
+    def record(self, tick_time: float, ticks: int):
+        for _ in range(ticks):
+            self.governor.record_tick(tick_time)
+
+    def test_lowers_quality_one_tier_at_a_time(self):
+        self.record(0.004, 100)
+        self.assertEqual(self.governor.tier, QualityTier.FULL)
+
+        self.record(0.02, DEGRADE_DELAY_TICKS)
+        self.assertEqual(self.governor.tier, QualityTier.REDUCED)
+        self.record(0.02, DEGRADE_DELAY_TICKS)
+        self.assertEqual(self.governor.tier, QualityTier.LOW)
+        self.record(0.02, 10 * DEGRADE_DELAY_TICKS)
+        self.assertEqual(self.governor.tier, QualityTier.MINIMAL)
+        self.assertEqual(self.governor.peak_tick_time, 0.02)
+
+    def test_recovers_once_there_is_headroom(self):
+        self.governor.set_tier(QualityTier.LOW)
+        # Within budget, but without headroom to spare
+        self.record(0.007, 2 * RECOVERY_DELAY_TICKS)
+        self.assertEqual(self.governor.tier, QualityTier.LOW)
+
+        self.record(0.002, RECOVERY_DELAY_TICKS)
+        self.assertEqual(self.governor.tier, QualityTier.REDUCED)
+        self.record(0.002, RECOVERY_DELAY_TICKS)
+        self.assertEqual(self.governor.tier, QualityTier.FULL)
+
+        self.assertEqual(self.governor.entered[QualityTier.LOW], 1)
+        self.assertEqual(self.governor.entered[QualityTier.FULL], 1)
+        self.assertEqual(sum(self.governor.ticks_in_tier), 4 * RECOVERY_DELAY_TICKS)
+
+    def test_recovers_once_shedding_takes_effect(self):
+        scheduler = SystemScheduler(60)
+        clock = [0.0]
+        storm_ticks = 300
+
+        def base(delta_time: float):
+            clock[0] += 0.002
+
+        def storm(delta_time: float):
+            # Work that costs more than the whole budget, while the storm lasts
+            if scheduler.tick < storm_ticks:
+                clock[0] += 0.012
+
+        scheduler.add("base", base)
+        storm_system = scheduler.add("storm", storm)
+        self.governor.shed(storm_system, QualityTier.REDUCED, throttle=4)
+
+        tiers = []
+        for _ in range(storm_ticks + 600):
+            start = clock[0]
+            scheduler.update(1 / 60)
+            self.governor.record_tick(clock[0] - start)
+            tiers.append(self.governor.tier)
+
+        # Shedding was enough, so quality never dropped further
+        self.assertEqual(max(tiers), QualityTier.REDUCED)
+        storm_tiers = tiers[:storm_ticks]
+        self.assertGreater(
+            storm_tiers.count(QualityTier.REDUCED), storm_tiers.count(QualityTier.FULL)
+        )
+        self.assertEqual(self.governor.tier, QualityTier.FULL)
+
+    def test_holds_tier_while_disabled(self):
+        self.governor.enabled = False
+        self.record(0.02, 10 * DEGRADE_DELAY_TICKS)
+        self.assertEqual(self.governor.tier, QualityTier.FULL)
+        self.assertEqual(self.governor.peak_tick_time, 0.02)
+
+        self.governor.set_tier(QualityTier.LOW)
+        self.record(0.002, 10 * RECOVERY_DELAY_TICKS)
+        self.assertEqual(self.governor.tier, QualityTier.LOW)
+
+    def test_sheds_systems_by_tier(self):
+        scheduler = SystemScheduler(60)
+        calls = []
+        system = scheduler.add("hud", lambda _: calls.append(scheduler.tick))
+        self.governor.shed(system, QualityTier.REDUCED, throttle=3)
+        self.governor.shed(system, QualityTier.LOW)
+
+        for _ in range(6):
+            scheduler.update(1 / 60)
+        self.assertEqual(len(calls), 6)
+
+        self.governor.set_tier(QualityTier.REDUCED)
+        calls.clear()
+        for _ in range(6):
+            scheduler.update(1 / 60)
+        self.assertEqual(calls, [6, 9])
+
+        self.governor.set_tier(QualityTier.LOW)
+        calls.clear()
+        for _ in range(6):
+            scheduler.update(1 / 60)
+        self.assertEqual(calls, [])
+
+        self.governor.set_tier(QualityTier.FULL)
+        scheduler.update(1 / 60)
+        self.assertEqual(len(calls), 1)
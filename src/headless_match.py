@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import sys
+import time
+from typing import List
+
+import pyglet
+
+# No window will ever open, so pyglet must not open a hidden one either
+pyglet.options["shadow_window"] = False
+
+# isort: split
+
+from pyglet.window.key import KeyStateHandler
+
+from audio import disable_audio
+from constants import ARENA, TICK_DURATION
+from match import Match
+from player import Player
+
+
+class HeadlessMatch:
+    """
+    Runs a `Match` without a window, drawing, sound, or input devices, stepping
+    fixed ticks as fast as the CPU allows.  For benchmarks, bots, and tuning
+    sweeps.
+
+    Known limitation: every texture is still decoded from disk when `textures` is
+    imported, so a headless run needs the `assets` folder and pays for loading
+    images it never draws.  Vehicle hit boxes are computed from their images, so
+    those would be needed anyway.  Nothing is ever sent to a GPU.
+
+    Quality is held at `QualityTier.FULL`, so that a run simulates the same thing
+    however fast the CPU is.
+
+    Drive players by setting their inputs between steps, or, for the keyboard
+    player, by calling `on_key_press` and `on_key_release` on `keyboard`.
+    """
+
+    match: Match
+    keyboard: KeyStateHandler
+    ticks: int
+    "Ticks simulated so far"
+
+    def __init__(self, arena_name: str = ARENA):
+        disable_audio()
+        self.keyboard = KeyStateHandler()
+        self.match = Match(self.keyboard)
+        self.match.setup(arena_name, use_controllers=False)
+        self.match.sprite_lists.frame_budget.enabled = False
+        self.ticks = 0
+
+    @property
+    def players(self) -> List[Player]:
+        return self.match.player_manager.players
+
+    def step(self, ticks: int = 1):
+        """
+        Simulate `ticks` ticks of `TICK_DURATION` each.
+        """
+        update = self.match.update
+        for _ in range(ticks):
+            update(TICK_DURATION)
+        self.ticks += ticks
+
+    def run_for(self, seconds: float):
+        """
+        Simulate `seconds` of game time.
+        """
+        self.step(round(seconds / TICK_DURATION))
+
+
+def main():
+    """
+    Benchmark: simulate a match for the given number of ticks, and report how many
+    ticks per second the CPU can simulate.
+    """
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 3600
+    headless_match = HeadlessMatch()
+    start = time.perf_counter()
+    headless_match.step(ticks)
+    elapsed = time.perf_counter() - start
+    print(f"{ticks} ticks in {elapsed:.2f}s, {ticks / elapsed:.0f} ticks per second")
+    print(headless_match.match.sprite_lists.frame_budget.get_readout())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+# isort: split
+
+# Before anything imports pyglet.window, which would open a hidden window
+from headless_match import HeadlessMatch
+
+# isort: split
+
+import arcade
+import numpy as np
+import pygame
+import pyglet
+
+from frame_budget import QualityTier
+from linked_sprite import LinkedSpriteSolidColor
+from ordnances.ordnance import Ordnance
+from ordnances.ordnance_lifetimes import DEFAULT_ORDNANCE_BUDGET
+from ordnances.projectile import Projectile
+from player_input import CONTROLS
+from rounds.round_controller import State
+from simulation_thread import InputHandoff
+
+
+class TestHeadlessMatch(TestCase):
+    def test_plays_rounds_without_window_or_audio(self):
+        headless_match = HeadlessMatch()
+        headless_match.step(600)
+
+        self.assertEqual(headless_match.ticks, 600)
+        round_controller = headless_match.match.round_controller
+        # Past the countdown, with everyone driving
+        self.assertEqual(round_controller._state, State.PLAYING)
+        self.assertTrue(
+            all(player.controls_active for player in headless_match.players)
+        )
+
+        # Nothing was sent to a GPU or an audio device
+        self.assertIsNone(pyglet.gl.current_context)
+        sprite_lists = headless_match.match.sprite_lists
+        for sprite_list in (
+            sprite_lists.vehicles,
+            sprite_lists.vehicle_attachments,
+            sprite_lists.ordnance,
+            sprite_lists.projectiles,
+            sprite_lists.walls,
+            sprite_lists.huds,
+        ):
+            self.assertFalse(sprite_list._initialized)
+        self.assertIsNone(round_controller._hud)
+        self.assertFalse(pygame.mixer.get_init())
+
+    def test_holds_quality_however_slow_ticks_are(self):
+        headless_match = HeadlessMatch()
+        frame_budget = headless_match.match.sprite_lists.frame_budget
+        # Every tick is over budget
+        frame_budget.budget = 0
+        headless_match.step(600)
+
+        self.assertEqual(frame_budget.tier, QualityTier.FULL)
+        self.assertEqual(sum(frame_budget.entered), 0)
+
+    def test_keeps_every_ordnance_at_minimal_quality(self):
+        headless_match = HeadlessMatch()
+        sprite_lists = headless_match.match.sprite_lists
+        sprite_lists.frame_budget.set_tier(QualityTier.MINIMAL)
+        ordnance_lifetimes = sprite_lists.ordnance_lifetimes
+        self.assertEqual(ordnance_lifetimes.budget, DEFAULT_ORDNANCE_BUDGET)
+
+        # More than a quarter of the budget, as far from walls as the arena allows
+        distance_field = headless_match.match.arena.distance_field
+        row, column = np.unravel_index(
+            np.argmax(distance_field.distances), distance_field.distances.shape
+        )
+        x = distance_field.origin[0] + column * distance_field.cell_size
+        y = distance_field.origin[1] + row * distance_field.cell_size
+        for _ in range(DEFAULT_ORDNANCE_BUDGET // 2):
+            bullet = Projectile(
+                LinkedSpriteSolidColor[Ordnance](8, 3, arcade.color.RED),
+                sprite_lists,
+                damage=1,
+                speed=0,
+            )
+            bullet.launch((x, y, 0), 0)
+        headless_match.step()
+
+        self.assertEqual(ordnance_lifetimes.evicted, 0)
+        self.assertGreaterEqual(ordnance_lifetimes.count, DEFAULT_ORDNANCE_BUDGET // 2)
+
+    def test_takes_input_from_handoff(self):
+        headless_match = HeadlessMatch()
+        match = headless_match.match
+        match.input_handoff = InputHandoff()
+        samples = match.player_manager.sample_inputs()
+        accelerate = CONTROLS.index("accelerate_axis")
+        # Accelerating, though no key is held on the keyboard itself
+        samples[0] = samples[0][:accelerate] + (1,) + samples[0][accelerate + 1 :]
+        match.input_handoff.publish(samples)
+        headless_match.step()
+
+        self.assertEqual(headless_match.players[0].input.accelerate_axis.value, 1)
+        self.assertEqual(headless_match.players[1].input.accelerate_axis.value, 0)
@@ -4,6 +4,8 @@ import typing
 
 import arcade
 
+from texture_cache import get_circle_texture, get_solid_color_texture
+
 T = typing.TypeVar("T")
 
 
@@ -11,9 +13,27 @@ class LinkedSprite(typing.Generic[T], arcade.Sprite):
     owner: T
 
 
-class LinkedSpriteSolidColor(typing.Generic[T], arcade.SpriteSolidColor):
+class LinkedSpriteSolidColor(typing.Generic[T], arcade.Sprite):
+    """
+    Solid-color rectangle.  Every rectangle of the same color shares one texture.
+    """
+
     owner: T
 
+    def __init__(self, width: float, height: float, color: arcade.Color):
+        super().__init__(texture=get_solid_color_texture(color))
+        self.width = width
+        self.height = height
+
 
 class LinkedSpriteCircle(typing.Generic[T], arcade.SpriteCircle):
+    """
+    Circle.  Every circle of the same radius, color, and softness shares one
+    texture.
+    """
+
     owner: T
+
+    def __init__(self, radius: float, color: arcade.Color, soft: bool = False):
+        # Skip SpriteCircle's own texture generation
+        arcade.Sprite.__init__(self, texture=get_circle_texture(radius, color, soft))
@@ -1,100 +1,168 @@
 from __future__ import annotations
 
+import time
+from typing import Optional
+
 import arcade
 
 from arena.arena import Arena
-from arena.arena_loader import load_arena_by_name
-from collision import ordnance_hits_vehicle, ordnance_hits_wall
 from constants import (
-    ARENA,
+    DEBUG_HUD_UPDATE_RATE,
+    FRAME_DURATION,
+    HUD_UPDATE_RATE,
+    MAX_TICKS_PER_FRAME,
     SCREEN_HEIGHT,
     SCREEN_TITLE,
     SCREEN_WIDTH,
     TICK_DURATION,
     USE_DEBUGGER_TIMING_FIXES,
+    USE_SIMULATION_THREAD,
 )
 from debug_hud import DebugHud
-from debug_patrol_loop import DebugPatrolLoop
+from fixed_timestep import FixedTimestep
+from frame_budget import QualityTier
 from fullscreen import FullscreenController
 from global_input import GlobalInput, bind_global_inputs_to_keyboard
 from hud import Hud
-from ordnances.ordnance import update_ordnance
+from match import Match
 from player_manager import PlayerManager
-from rounds.game_modes.stock import StockGameMode
 from rounds.round_controller import RoundController
+from simulation_thread import InputHandoff, SimulationThread
+from snapshot_renderer import SnapshotRenderer
+from sprite_interpolation import SpriteInterpolation
 from sprite_lists import SpriteLists
+from world_snapshot import capture_snapshot
 
 
 class MyGame(arcade.Window):
     # Declare class members; enables tab-completion
     input_debug_hud: DebugHud = None
+    match: Match
     sprite_lists: SpriteLists
+    player_manager: PlayerManager
+    round_controller: RoundController
+    simulation_thread: Optional[SimulationThread] = None
+    "Runs the match when `USE_SIMULATION_THREAD` is set"
+    snapshot_renderer: SnapshotRenderer
 
     def __init__(self, width: int, height: int, title: str):
         super().__init__(
-            width, height, title, enable_polling=True, update_rate=TICK_DURATION
+            width, height, title, enable_polling=True, update_rate=FRAME_DURATION
         )
         self.physics_engine = None
         arcade.set_background_color(arcade.color.AMAZON)
-        self.player_manager = PlayerManager(self.keyboard)
+        # The debugger timing fixes need the match to run on the main thread
+        self.use_simulation_thread = (
+            USE_SIMULATION_THREAD and not USE_DEBUGGER_TIMING_FIXES
+        )
+        self.sprite_lists = SpriteLists(lazy=self.use_simulation_thread)
+        self.match = Match(self.keyboard, self.sprite_lists)
+        self.player_manager = self.match.player_manager
         self.global_input = GlobalInput(self.keyboard, None)
         bind_global_inputs_to_keyboard(self.global_input)
-        self.sprite_lists = SpriteLists()
+        self.fixed_timestep = FixedTimestep(TICK_DURATION, MAX_TICKS_PER_FRAME)
+        self.sprite_interpolation = SpriteInterpolation(
+            [
+                self.sprite_lists.vehicles,
+                self.sprite_lists.vehicle_attachments,
+                self.sprite_lists.ordnance,
+                self.sprite_lists.projectiles,
+            ]
+        )
         self.arena: Arena
         self.fullscreen_controller = FullscreenController(self, self.global_input)
 
     def setup(self):
         self.projectile_sprite_list = arcade.SpriteList()
 
-        # Arena
-        self.arena = load_arena_by_name(ARENA)
-        self.arena.init_for_drawing(self.sprite_lists)
-
-        # Players
-        self.player_manager.setup(
-            self.sprite_lists,
-            self.arena,
-        )
-
-        game_mode = StockGameMode(self.player_manager.players)
-        self.round_controller = RoundController(
-            game_mode, self.player_manager.players, self.arena, self.sprite_lists
-        )
+        self.match.setup()
+        self.arena = self.match.arena
+        self.round_controller = self.match.round_controller
 
         # Debug UI for input handling
-        self.input_debug_hud = DebugHud(self.player_manager.players)
+        self.input_debug_hud = DebugHud(
+            self.player_manager.players,
+            self.sprite_lists.ordnance_pools,
+            self.sprite_lists.frame_budget,
+        )
 
         # Player Huds
         self.hud = Hud(self.player_manager.players, self.sprite_lists)
 
-        # Debug thingie that puppeteers a player on a patrol loop
-        self.debug_patrol_loop = DebugPatrolLoop(self.player_manager, self.arena)
+        # Nobody notices HUDs lagging a few ticks behind, so they update less often,
+        # and less still while ticks run over budget.  They are a small part of a
+        # tick; most of the shedding is done by the match itself.
+        hud_system = self.match.systems.add(
+            "hud", lambda _: self.hud.update(), rate=HUD_UPDATE_RATE, after=("rounds",)
+        )
+        debug_hud_system = self.match.systems.add(
+            "debug_hud",
+            lambda _: self.input_debug_hud.update(),
+            rate=DEBUG_HUD_UPDATE_RATE,
+            after=("rounds",),
+        )
+        frame_budget = self.sprite_lists.frame_budget
+        frame_budget.shed(debug_hud_system, QualityTier.REDUCED, throttle=4)
+        frame_budget.shed(debug_hud_system, QualityTier.LOW)
+        # Health bars are gameplay information, so they slow down but never stop
+        frame_budget.shed(hud_system, QualityTier.LOW, throttle=2)
+        frame_budget.shed(hud_system, QualityTier.MINIMAL, throttle=4)
+
+        if self.use_simulation_thread:
+            # Walls never change, so they are drawn directly instead of copied
+            # into every snapshot
+            moving_sprite_lists = [
+                self.sprite_lists.vehicles,
+                self.sprite_lists.vehicle_attachments,
+                self.sprite_lists.ordnance,
+                self.sprite_lists.projectiles,
+                self.sprite_lists.huds,
+            ]
+            self.snapshot_renderer = SnapshotRenderer(len(moving_sprite_lists))
+            # Input devices belong to this thread, so input is sampled here every
+            # frame and handed to the match
+            self.match.input_handoff = InputHandoff()
+            self.match.input_handoff.publish(self.player_manager.sample_inputs())
+            self.simulation_thread = SimulationThread(
+                self.match.update,
+                lambda tick: capture_snapshot(
+                    tick,
+                    moving_sprite_lists,
+                    (self.round_controller.hud_text, self.input_debug_hud.readout),
+                ),
+                self.fixed_timestep,
+            )
+            self.simulation_thread.start()
 
     def on_update(self, delta_time):
         # Arcade engine has a quirk where, in the debugger, it calls `on_update` twice back-to-back,
         # then `on_draw` twice, and so on.
         # We avoid this bug by ignoring the `on_update()` call from arcade, instead calling it ourselves
         # from `on_draw`
-        if not USE_DEBUGGER_TIMING_FIXES:
-            self.our_update(delta_time)
+        if USE_DEBUGGER_TIMING_FIXES:
+            return
+        if self.simulation_thread is not None:
+            # The match runs on its own thread; only input and window controls
+            # are left
+            self.simulation_thread.check()
+            self.match.input_handoff.publish(self.player_manager.sample_inputs())
+            self.global_input.update()
+            self.fullscreen_controller.update()
+            return
+        # The simulation always advances in ticks of TICK_DURATION, however long
+        # frames take
+        ticks = self.fixed_timestep.advance(delta_time)
+        for tick in range(ticks):
+            if tick == ticks - 1:
+                self.sprite_interpolation.save_previous()
+            self.our_update(TICK_DURATION)
 
     def our_update(self, delta_time: float):
         # Pretty sure this does animation updates, in case any of the sprites
         # Have animations
         self.global_input.update()
         self.fullscreen_controller.update()
-        self.player_manager.update_inputs()
-        for player in self.player_manager.players:
-            player.update(delta_time)
-        self.debug_patrol_loop.update(delta_time)
-        update_ordnance(
-            delta_time,
-            self.sprite_lists,
-        )
-        ordnance_hits_wall(self.sprite_lists)
-        ordnance_hits_vehicle(delta_time, self.sprite_lists)
-        self.round_controller.update(delta_time)
-        self.hud.update()
+        self.match.update(delta_time)
 
     def on_draw(self):
         if USE_DEBUGGER_TIMING_FIXES:
@@ -102,10 +170,34 @@ class MyGame(arcade.Window):
 
         # clear screen
         self.clear()
+        if self.simulation_thread is not None:
+            self.draw_latest_snapshot()
+            return
+        if not USE_DEBUGGER_TIMING_FIXES:
+            # Draw between the last two ticks, at the current moment
+            self.sprite_interpolation.apply(self.fixed_timestep.blend)
         self.sprite_lists.draw()
+        self.sprite_interpolation.restore()
         self.round_controller.draw()
         self.input_debug_hud.draw()
 
+    def draw_latest_snapshot(self):
+        previous, latest = self.simulation_thread.snapshots.latest()
+        # Draw between the last two snapshots, one tick behind the simulation
+        blend = min((time.perf_counter() - latest.time) / TICK_DURATION, 1)
+        self.snapshot_renderer.update(previous, latest, blend)
+        self.sprite_lists.walls.draw()
+        self.snapshot_renderer.draw()
+        # Text is drawn as of the snapshot, never read from the match mid-tick
+        round_text, debug_readout = latest.texts
+        self.round_controller.draw(round_text)
+        self.input_debug_hud.draw(debug_readout)
+
+    def on_close(self):
+        if self.simulation_thread is not None:
+            self.simulation_thread.stop()
+        super().on_close()
+
 
 def main():
     game = MyGame(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+from pyglet.window.key import KeyStateHandler
+
+from arena.arena import Arena
+from arena.arena_loader import load_arena_by_name
+from collision import (
+    end_ordnance_contacts,
+    ordnance_hits_vehicle,
+    ordnance_hits_wall,
+    vehicle_hits_vehicle,
+)
+from constants import ARENA, ROUND_UPDATE_RATE, TICK_DURATION
+from debug_patrol_loop import DebugPatrolLoop
+from ordnances.ordnance import update_ordnance
+from player_manager import PlayerManager
+from rounds.game_modes.stock import StockGameMode
+from rounds.round_controller import RoundController
+from simulation_thread import InputHandoff
+from sprite_lists import SpriteLists
+from system_scheduler import SystemScheduler
+from weapons.archetypes import get_archetypes
+
+
+class Match:
+    """
+    Everything simulated while playing: the arena, players and their vehicles,
+    ordnance, and rounds.
+
+    Knows nothing about windows, drawing, or sound output, so that it can be
+    played by `MyGame` or run headless by `HeadlessMatch`.
+    """
+
+    sprite_lists: SpriteLists
+    player_manager: PlayerManager
+    arena: Arena
+    round_controller: RoundController
+    debug_patrol_loop: DebugPatrolLoop
+    systems: SystemScheduler
+    """
+    Everything run each tick.  Others, such as HUDs, can add their own systems
+    after `setup`.
+    """
+    input_handoff: Optional[InputHandoff] = None
+    """
+    Where player input comes from when the match runs on a different thread than
+    the one that owns the input devices.  Otherwise they are read directly.
+    """
+
+    def __init__(
+        self, keyboard: KeyStateHandler, sprite_lists: Optional[SpriteLists] = None
+    ):
+        self.sprite_lists = sprite_lists or SpriteLists()
+        self.player_manager = PlayerManager(keyboard)
+        self.systems = SystemScheduler(1 / TICK_DURATION)
+
+    def setup(self, arena_name: str = ARENA, use_controllers: bool = True):
+        # Weapon stats are compiled once, before any weapon is created
+        get_archetypes()
+
+        # Arena
+        self.arena = load_arena_by_name(arena_name)
+        self.arena.init_for_drawing(self.sprite_lists)
+        self.sprite_lists.ordnance_lifetimes.kill_bounds = self.arena.bounds
+
+        # Walls never move, so they are binned for collision queries once
+        self.sprite_lists.collision_world.bake_walls(self.arena.distance_field)
+
+        # Players
+        self.player_manager.setup(self.sprite_lists, self.arena, use_controllers)
+
+        game_mode = StockGameMode(self.player_manager.players)
+        self.round_controller = RoundController(
+            game_mode, self.player_manager.players, self.arena, self.sprite_lists
+        )
+
+        # Debug thingie that puppeteers a player on a patrol loop
+        self.debug_patrol_loop = DebugPatrolLoop(self.player_manager, self.arena)
+
+        self._add_systems()
+
+    def _add_systems(self):
+        sprite_lists = self.sprite_lists
+        systems = self.systems
+        systems.add("inputs", self._update_inputs)
+        systems.add("players", self._update_players, after=("inputs",))
+        # Places the patrolling vehicle over wherever it drove itself
+        systems.add(
+            "debug_patrol_loop", self.debug_patrol_loop.update, after=("players",)
+        )
+        systems.add(
+            "vehicle_collisions",
+            lambda delta_time: vehicle_hits_vehicle(delta_time, sprite_lists),
+            after=("debug_patrol_loop",),
+        )
+        systems.add(
+            "collision_world",
+            lambda _: sprite_lists.collision_world.update(),
+            after=("vehicle_collisions",),
+        )
+        systems.add(
+            "ordnance",
+            lambda delta_time: update_ordnance(delta_time, sprite_lists),
+            after=("collision_world",),
+        )
+        systems.add(
+            "ordnance_hits_wall",
+            lambda _: ordnance_hits_wall(sprite_lists),
+            after=("ordnance",),
+        )
+        systems.add(
+            "ordnance_hits_vehicle",
+            lambda delta_time: ordnance_hits_vehicle(delta_time, sprite_lists),
+            after=("ordnance_hits_wall",),
+        )
+        systems.add(
+            "ordnance_contacts",
+            lambda _: end_ordnance_contacts(sprite_lists),
+            after=("ordnance_hits_vehicle",),
+        )
+        systems.add(
+            "rounds",
+            self.round_controller.update,
+            rate=ROUND_UPDATE_RATE,
+            after=("ordnance_contacts",),
+        )
+
+    def _update_inputs(self, delta_time: float):
+        if self.input_handoff is None:
+            self.player_manager.update_inputs()
+        else:
+            self.player_manager.update_inputs(self.input_handoff.latest())
+
+    def _update_players(self, delta_time: float):
+        for player in self.player_manager.players:
+            player.update(delta_time)
+
+    def update(self, delta_time: float):
+        """
+        Advance the match by one tick.
+        """
+        start = time.perf_counter()
+        self.systems.update(delta_time)
+        self.sprite_lists.frame_budget.record_tick(time.perf_counter() - start)
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 import arcade
 
 import constants
+from collision_layers import CollisionLayer
+from collision_world import TimeOfImpact
 from driving.create_drive_modes import create_drive_modes
 from player_input import PlayerInput
 
@@ -74,6 +76,10 @@ class MovementControls:
 
     def __init__(self, sprite: arcade.Sprite):
         self.shadow_sprite = sprite
+        # The shape used for movement collisions, relative to the vehicle's center
+        self.local_hit_box = [
+            (x * sprite.scale, y * sprite.scale) for x, y in sprite.get_hit_box()
+        ]
 
         self.debug_world_boundary_x = DEFAULT_WORLD_SIZE_X
         self.debug_world_boundary_y = DEFAULT_WORLD_SIZE_Y
@@ -94,6 +100,14 @@ class MovementControls:
             if self.drive_modes[self.index] is not None:
                 self.vehicle_type = self.drive_modes[self.index]
 
+    def reset_velocity(self):
+        """
+        Stop all motion, such as when respawning.
+        """
+        for drive_mode in self.drive_modes:
+            drive_mode.vehicle_velocity = (0, 0, 0)
+            drive_mode.external_velocity = (0, 0, 0)
+
     #   Drive input is called by the player and passed that player's input
     #   to set what the vehicle's velocity and rotation should be
     #   Does not change the vehicles position
@@ -113,28 +127,21 @@ class MovementControls:
             self.vehicle_type.drive_input(delta_time, vehicle, input)
 
     # called from the player to tell the vehicle to act on it's intended velocity and rotation
-    def move(
-        self,
-        delta_time: float,
-        vehicle: Vehicle,
-        walls: arcade.SpriteList,
-        cars: arcade.SpriteList,
-    ):
+    def move(self, delta_time: float, vehicle: Vehicle):
         if self.vehicle_type is not None:
-            self.vehicle_type.move(delta_time, vehicle, walls, cars)
-
-    def check_for_valid_movement(self, vehicle: Vehicle, velocity, walls, cars):
-        # the shadow sprite is used to simplify math and planning to deal with the arena not being an array
-
-        self.set_shadow_sprite_position(vehicle.location, velocity)
-
-        if len(arcade.check_for_collision_with_list(self.shadow_sprite, walls)) > 0:
-
-            return False
-        if len(arcade.check_for_collision_with_list(self.shadow_sprite, cars)) > 1:
-
-            return False
-        return True
+            self.vehicle_type.move(delta_time, vehicle)
+
+    def find_time_of_impact(self, vehicle: Vehicle, velocity) -> TimeOfImpact:
+        # the shadow sprite's shape is swept along the velocity in a single query
+        # returns how much of the velocity can be applied, and the normal of anything it would hit
+        # other vehicles do not block movement; collision.vehicle_hits_vehicle bounces them apart
+        return vehicle.sprite_lists.collision_world.cast_polygon(
+            self.local_hit_box,
+            vehicle.location,
+            velocity,
+            CollisionLayer.WALL,
+            vehicle.sprite,
+        )
 
     def set_shadow_sprite_position(self, location, vector):
 
@@ -151,6 +158,9 @@ class MovementControls:
         if self.vehicle_type is not None:
             self.vehicle_type.apply_external_force(vector)
 
+    def scale_vector3(self, vec, factor: float):
+        return (vec[0] * factor, vec[1] * factor, vec[2] * factor)
+
     def add_vector3(self, vec_a, vec_b):
         x = vec_a[0] + vec_b[0]
         y = vec_a[1] + vec_b[1]
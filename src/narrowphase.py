@@ -0,0 +1,694 @@
+from __future__ import annotations
+
+import math
+import weakref
+from typing import Callable, Optional, Sequence, Tuple
+
+import arcade
+
+from iron_math import add_vec, rotate_vec, scale_vec
+
+#
+# Exact intersection tests between simple primitive shapes.
+#
+# Every shape in the game is close enough to a rectangle that we can skip
+# arcade's generic polygon checks and use closed-form math instead.
+#
+
+
+class Obb:
+    """
+    Oriented bounding box: a rectangle with arbitrary position and rotation.
+    """
+
+    center: Tuple[float, float]
+    half_size: Tuple[float, float]
+    "(half_width, half_height)"
+    radians: float
+    axis_x: Tuple[float, float]
+    "Unit vector pointing along the box's local x axis"
+    axis_y: Tuple[float, float]
+    "Unit vector pointing along the box's local y axis"
+
+    def __init__(
+        self,
+        center: Tuple[float, float],
+        half_size: Tuple[float, float],
+        radians: float,
+    ):
+        self.center = center
+        self.half_size = half_size
+        self.radians = radians
+        c = math.cos(radians)
+        s = math.sin(radians)
+        self.axis_x = (c, s)
+        self.axis_y = (-s, c)
+
+    def get_corners(self):
+        """
+        Returns the four corners, wound counter-clockwise.
+        """
+        ex = scale_vec(self.axis_x, self.half_size[0])
+        ey = scale_vec(self.axis_y, self.half_size[1])
+        cx, cy = self.center
+        return [
+            (cx - ex[0] - ey[0], cy - ex[1] - ey[1]),
+            (cx + ex[0] - ey[0], cy + ex[1] - ey[1]),
+            (cx + ex[0] + ey[0], cy + ex[1] + ey[1]),
+            (cx - ex[0] + ey[0], cy - ex[1] + ey[1]),
+        ]
+
+
+class Contact:
+    """
+    How two overlapping shapes touch.
+    """
+
+    normal: Tuple[float, float]
+    "Unit vector pointing from the second shape toward the first"
+    depth: float
+    "How far the first shape must move along `normal` to stop overlapping"
+
+    def __init__(self, normal: Tuple[float, float], depth: float):
+        self.normal = normal
+        self.depth = depth
+
+    def flipped(self):
+        """
+        The same contact, seen from the second shape.
+        """
+        return Contact((-self.normal[0], -self.normal[1]), self.depth)
+
+
+class SeparatingAxis:
+    """
+    Warm start for repeated tests of the same pair of shapes.
+
+    Remembers the axis that last separated the pair.  Shapes barely move between
+    ticks, so the same axis usually still separates them, and testing it first
+    rejects the pair with a single projection instead of a full test.
+    """
+
+    axis: Optional[Tuple[float, float]] = None
+    "Unit vector, or `None` if the pair was touching last time"
+
+
+def get_sprite_obb(sprite: arcade.Sprite):
+    """
+    Build an `Obb` which tightly encloses a sprite's hit box.
+
+    Exact for rectangular sprites such as walls, bullets, and beams.
+    """
+    points = sprite.get_hit_box()
+    min_x = max_x = points[0][0]
+    min_y = max_y = points[0][1]
+    for x, y in points:
+        if x < min_x:
+            min_x = x
+        elif x > max_x:
+            max_x = x
+        if y < min_y:
+            min_y = y
+        elif y > max_y:
+            max_y = y
+    scale = sprite.scale
+    radians = sprite.radians
+    # Hit boxes are not always centered on the sprite's position
+    local_center = ((min_x + max_x) * 0.5 * scale, (min_y + max_y) * 0.5 * scale)
+    half_size = ((max_x - min_x) * 0.5 * scale, (max_y - min_y) * 0.5 * scale)
+    center = add_vec(sprite.position, rotate_vec(local_center, radians))
+    return Obb(center, half_size, radians)
+
+
+class ObbCache:
+    """
+    Remembers the `Obb` of each sprite, and only rebuilds it after the sprite moves,
+    turns, is rescaled, or changes hit box.
+
+    Walls never move, so their boxes are built once.  Entries are dropped
+    automatically when a sprite is garbage collected.
+    """
+
+    def __init__(self):
+        self._entries: weakref.WeakKeyDictionary[
+            arcade.Sprite, Tuple[tuple, Obb]
+        ] = weakref.WeakKeyDictionary()
+
+    def get(self, sprite: arcade.Sprite) -> Obb:
+        key = (sprite.position, sprite.radians, sprite.scale, sprite.get_hit_box())
+        entry = self._entries.get(sprite)
+        if entry is not None:
+            cached_key, obb = entry
+            # Hit boxes are stored as tuples, so an unchanged hit box is the same object
+            if (
+                cached_key[0] == key[0]
+                and cached_key[1] == key[1]
+                and cached_key[2] == key[2]
+                and cached_key[3] is key[3]
+            ):
+                return obb
+        obb = get_sprite_obb(sprite)
+        self._entries[sprite] = (key, obb)
+        return obb
+
+
+def raycast_obb(
+    origin: Tuple[float, float],
+    direction: Tuple[float, float],
+    max_distance: float,
+    obb: Obb,
+    radius: float = 0,
+) -> Optional[float]:
+    """
+    Slab test of a ray against an oriented box.
+
+    `direction` must be a unit vector.
+
+    A non-zero `radius` sweeps a thick ray, by growing the box on every side.
+
+    Returns distance from `origin` to the first point where the ray enters the box,
+    or `None` if the ray misses or the box is further than `max_distance`.  Returns
+    0 if `origin` is already inside the box.
+    """
+    clipped = _clip_ray_obb(origin, direction, max_distance, obb, radius)
+    if clipped is None:
+        return None
+    return clipped[0]
+
+
+def segment_obb_contact(
+    start: Tuple[float, float], end: Tuple[float, float], obb: Obb
+) -> Optional[Tuple[float, Contact]]:
+    """
+    Test a line segment, such as one tick of a bullet's motion, against an oriented
+    box.
+
+    Returns (fraction, contact) or `None` if the segment misses.  `fraction` is how
+    far from `start` to `end` the segment enters the box, from 0 to 1.  The contact
+    normal faces out of the side of the box that was entered, and depth is how far
+    `end` lies behind that side.
+    """
+    delta_x = end[0] - start[0]
+    delta_y = end[1] - start[1]
+    length = math.sqrt(delta_x * delta_x + delta_y * delta_y)
+    if length == 0:
+        contact = circle_obb_contact(start, 0, obb)
+        return None if contact is None else (0.0, contact)
+    direction = (delta_x / length, delta_y / length)
+    clipped = _clip_ray_obb(start, direction, length, obb, 0)
+    if clipped is None:
+        return None
+    distance, normal = clipped
+    if normal is None:
+        # Started inside; push out through the nearest side
+        return (0.0, circle_obb_contact(start, 0, obb))
+    entry = add_vec(start, scale_vec(direction, distance))
+    depth = (entry[0] - end[0]) * normal[0] + (entry[1] - end[1]) * normal[1]
+    return (distance / length, Contact(normal, max(depth, 0.0)))
+
+
+def _clip_ray_obb(
+    origin: Tuple[float, float],
+    direction: Tuple[float, float],
+    max_distance: float,
+    obb: Obb,
+    radius: float,
+):
+    """
+    Returns (distance, normal of the side entered) or `None` on a miss.  Normal is
+    `None` if the ray starts inside the box.
+    """
+    # Express the ray in the box's local coordinate space, where the box is
+    # axis-aligned and centered on the origin
+    offset = (origin[0] - obb.center[0], origin[1] - obb.center[1])
+    t_near = -math.inf
+    t_far = math.inf
+    normal = None
+    for axis, half in (
+        (obb.axis_x, obb.half_size[0] + radius),
+        (obb.axis_y, obb.half_size[1] + radius),
+    ):
+        local_origin = offset[0] * axis[0] + offset[1] * axis[1]
+        local_direction = direction[0] * axis[0] + direction[1] * axis[1]
+        if abs(local_direction) < 1e-9:
+            # Ray is parallel to this slab; it either always or never overlaps
+            if abs(local_origin) > half:
+                return None
+            continue
+        t1 = (-half - local_origin) / local_direction
+        t2 = (half - local_origin) / local_direction
+        if t1 > t2:
+            t1, t2 = t2, t1
+        if t1 > t_near:
+            t_near = t1
+            # We enter through the side facing against the ray
+            if local_direction > 0:
+                normal = (-axis[0], -axis[1])
+            else:
+                normal = axis
+        if t2 < t_far:
+            t_far = t2
+        if t_near > t_far:
+            return None
+    if t_far < 0:
+        # Box is behind the ray
+        return None
+    if t_near <= 0:
+        return (0.0, None)
+    if t_near > max_distance:
+        return None
+    return (t_near, normal)
+
+
+def raycast_polygon(
+    origin: Tuple[float, float],
+    direction: Tuple[float, float],
+    max_distance: float,
+    points: Sequence[Tuple[float, float]],
+    radius: float = 0,
+) -> Optional[float]:
+    """
+    Cyrus-Beck clipping of a ray against a convex polygon, such as a sprite's
+    adjusted hit box.
+
+    `direction` must be a unit vector.  `points` may be wound in either direction.
+
+    A non-zero `radius` sweeps a thick ray, by pushing every edge outward.
+
+    Returns the same as `raycast_obb`.
+    """
+    # Signed area tells us the winding, so we know which way edge normals face
+    winding = 0.0
+    previous = points[-1]
+    for point in points:
+        winding += previous[0] * point[1] - point[0] * previous[1]
+        previous = point
+    sign = 1 if winding > 0 else -1
+
+    t_near = 0.0
+    t_far = max_distance
+    previous = points[-1]
+    for point in points:
+        # Outward-facing edge normal
+        normal_x = (point[1] - previous[1]) * sign
+        normal_y = (previous[0] - point[0]) * sign
+        numerator = normal_x * (previous[0] - origin[0]) + normal_y * (
+            previous[1] - origin[1]
+        )
+        if radius:
+            numerator += radius * math.sqrt(normal_x * normal_x + normal_y * normal_y)
+        denominator = normal_x * direction[0] + normal_y * direction[1]
+        if denominator == 0:
+            # Parallel to this edge; miss if we start on the outside of it
+            if numerator < 0:
+                return None
+        else:
+            t = numerator / denominator
+            if denominator < 0:
+                # Entering this half-plane
+                if t > t_near:
+                    t_near = t
+            elif t < t_far:
+                # Exiting this half-plane
+                t_far = t
+            if t_near > t_far:
+                return None
+        previous = point
+    return t_near
+
+
+def point_polygon_distance(
+    point: Tuple[float, float], points: Sequence[Tuple[float, float]]
+) -> float:
+    """
+    Distance from a point to the nearest edge of a convex polygon, or 0 if the
+    point is inside.  `points` may be wound in either direction.
+    """
+    closest, inside = closest_point_on_polygon(point, points)
+    if inside:
+        return 0.0
+    return math.hypot(point[0] - closest[0], point[1] - closest[1])
+
+
+def circle_polygon_contact(
+    center: Tuple[float, float],
+    radius: float,
+    points: Sequence[Tuple[float, float]],
+    separating_axis: Optional[SeparatingAxis] = None,
+) -> Optional[Contact]:
+    """
+    Test a circle against a convex polygon, such as a vehicle's hit box.  The normal
+    points from the polygon toward the circle.
+
+    Returns `None` if they do not overlap.
+    """
+    closest, inside = closest_point_on_polygon(center, points)
+    offset_x = center[0] - closest[0]
+    offset_y = center[1] - closest[1]
+    distance = math.sqrt(offset_x * offset_x + offset_y * offset_y)
+    if inside:
+        # Push out through the nearest edge
+        if distance == 0:
+            return Contact((1.0, 0.0), radius)
+        return Contact((-offset_x / distance, -offset_y / distance), radius + distance)
+    normal = (offset_x / distance, offset_y / distance)
+    if distance >= radius:
+        if separating_axis is not None:
+            separating_axis.axis = normal
+        return None
+    return Contact(normal, radius - distance)
+
+
+def closest_point_on_polygon(
+    point: Tuple[float, float], points: Sequence[Tuple[float, float]]
+):
+    """
+    Returns (closest point on the polygon's edges, whether `point` is inside)
+    """
+    px, py = point
+    inside = True
+    side = 0.0
+    closest_squared = math.inf
+    closest = point
+    previous = points[-1]
+    for point in points:
+        edge_x = point[0] - previous[0]
+        edge_y = point[1] - previous[1]
+        to_point_x = px - previous[0]
+        to_point_y = py - previous[1]
+        # A point is inside a convex polygon iff it is on the same side of every edge
+        cross = edge_x * to_point_y - edge_y * to_point_x
+        if cross != 0:
+            if side == 0:
+                side = cross
+            elif (cross > 0) != (side > 0):
+                inside = False
+        # Closest point on this edge
+        length_squared = edge_x * edge_x + edge_y * edge_y
+        t = 0.0
+        if length_squared > 0:
+            t = (to_point_x * edge_x + to_point_y * edge_y) / length_squared
+            t = min(max(t, 0.0), 1.0)
+        dx = to_point_x - edge_x * t
+        dy = to_point_y - edge_y * t
+        distance_squared = dx * dx + dy * dy
+        if distance_squared < closest_squared:
+            closest_squared = distance_squared
+            closest = (previous[0] + edge_x * t, previous[1] + edge_y * t)
+        previous = point
+    return (closest, inside)
+
+
+def raycast_sprite(
+    origin: Tuple[float, float],
+    direction: Tuple[float, float],
+    max_distance: float,
+    sprite: arcade.Sprite,
+    radius: float = 0,
+    obbs: Optional[ObbCache] = None,
+) -> Optional[float]:
+    """
+    Cast a ray against a sprite's hit box.
+
+    Rectangular hit boxes, such as walls and beams, use the cheaper `raycast_obb`,
+    looking up the box in `obbs` if given.  Others, such as vehicles with their
+    trimmed corners, fall back to `raycast_polygon`.
+    """
+    if len(sprite.get_hit_box()) == 4:
+        obb = obbs.get(sprite) if obbs is not None else get_sprite_obb(sprite)
+        return raycast_obb(origin, direction, max_distance, obb, radius)
+    return raycast_polygon(
+        origin, direction, max_distance, sprite.get_adjusted_hit_box(), radius
+    )
+
+
+def polygon_contact(
+    points_a: Sequence[Tuple[float, float]],
+    points_b: Sequence[Tuple[float, float]],
+    separating_axis: Optional[SeparatingAxis] = None,
+) -> Optional[Contact]:
+    """
+    Separating axis test between two convex polygons, for shapes which are not
+    rectangles, such as vehicles.
+
+    The contact is the shortest push which separates the polygons.  Returns `None`
+    if the polygons do not overlap, and records the axis in `separating_axis`.
+    """
+    best_depth = math.inf
+    best_axis = None
+    for points in (points_a, points_b):
+        previous = points[-1]
+        for point in points:
+            axis_x = previous[1] - point[1]
+            axis_y = point[0] - previous[0]
+            length = math.sqrt(axis_x * axis_x + axis_y * axis_y)
+            previous = point
+            if length == 0:
+                continue
+            axis_x /= length
+            axis_y /= length
+            min_a, max_a = _project_polygon(points_a, axis_x, axis_y)
+            min_b, max_b = _project_polygon(points_b, axis_x, axis_y)
+            depth = min(max_a - min_b, max_b - min_a)
+            if depth <= 0:
+                # Found a separating axis
+                if separating_axis is not None:
+                    separating_axis.axis = (axis_x, axis_y)
+                return None
+            if depth < best_depth:
+                best_depth = depth
+                best_axis = (axis_x, axis_y)
+    if best_axis is None:
+        return None
+    # Point the normal from b toward a
+    center_a = _polygon_average(points_a)
+    center_b = _polygon_average(points_b)
+    if (center_a[0] - center_b[0]) * best_axis[0] + (
+        center_a[1] - center_b[1]
+    ) * best_axis[1] < 0:
+        best_axis = (-best_axis[0], -best_axis[1])
+    return Contact(best_axis, best_depth)
+
+
+def obb_obb_contact(
+    obb_a: Obb, obb_b: Obb, separating_axis: Optional[SeparatingAxis] = None
+) -> Optional[Contact]:
+    """
+    Separating axis test between two oriented boxes.  Only the four face axes need
+    testing, and each box's extent along an axis is closed-form.
+
+    Returns `None` if the boxes do not overlap, and records the axis in
+    `separating_axis`.
+    """
+    between_x = obb_a.center[0] - obb_b.center[0]
+    between_y = obb_a.center[1] - obb_b.center[1]
+    best_depth = math.inf
+    best_axis = None
+    for axis in (obb_a.axis_x, obb_a.axis_y, obb_b.axis_x, obb_b.axis_y):
+        extent = _obb_extent(obb_a, axis) + _obb_extent(obb_b, axis)
+        separation = between_x * axis[0] + between_y * axis[1]
+        depth = extent - abs(separation)
+        if depth <= 0:
+            # Found a separating axis
+            if separating_axis is not None:
+                separating_axis.axis = axis
+            return None
+        if depth < best_depth:
+            best_depth = depth
+            # Point the normal from b toward a
+            best_axis = axis if separation >= 0 else (-axis[0], -axis[1])
+    return Contact(best_axis, best_depth)
+
+
+def circle_obb_contact(
+    center: Tuple[float, float],
+    radius: float,
+    obb: Obb,
+    separating_axis: Optional[SeparatingAxis] = None,
+) -> Optional[Contact]:
+    """
+    Test a circle, such as an explosion, against an oriented box.  The normal points
+    from the box toward the circle.
+
+    Returns `None` if they do not overlap.
+    """
+    offset_x = center[0] - obb.center[0]
+    offset_y = center[1] - obb.center[1]
+    local_x = offset_x * obb.axis_x[0] + offset_y * obb.axis_x[1]
+    local_y = offset_x * obb.axis_y[0] + offset_y * obb.axis_y[1]
+    half_x, half_y = obb.half_size
+    if abs(local_x) <= half_x and abs(local_y) <= half_y:
+        # Center is inside the box; push out through the nearest side
+        gap_x = half_x - abs(local_x)
+        gap_y = half_y - abs(local_y)
+        if gap_x < gap_y:
+            axis = obb.axis_x if local_x >= 0 else scale_vec(obb.axis_x, -1)
+            return Contact(axis, gap_x + radius)
+        axis = obb.axis_y if local_y >= 0 else scale_vec(obb.axis_y, -1)
+        return Contact(axis, gap_y + radius)
+    # Closest point on the box, in local space
+    outside_x = local_x - min(max(local_x, -half_x), half_x)
+    outside_y = local_y - min(max(local_y, -half_y), half_y)
+    distance = math.sqrt(outside_x * outside_x + outside_y * outside_y)
+    outside_x /= distance
+    outside_y /= distance
+    normal = (
+        outside_x * obb.axis_x[0] + outside_y * obb.axis_y[0],
+        outside_x * obb.axis_x[1] + outside_y * obb.axis_y[1],
+    )
+    if distance >= radius:
+        if separating_axis is not None:
+            separating_axis.axis = normal
+        return None
+    return Contact(normal, radius - distance)
+
+
+def circle_circle_contact(
+    center_a: Tuple[float, float],
+    radius_a: float,
+    center_b: Tuple[float, float],
+    radius_b: float,
+    separating_axis: Optional[SeparatingAxis] = None,
+) -> Optional[Contact]:
+    """
+    Returns `None` if the circles do not overlap.
+    """
+    between_x = center_a[0] - center_b[0]
+    between_y = center_a[1] - center_b[1]
+    distance = math.sqrt(between_x * between_x + between_y * between_y)
+    depth = radius_a + radius_b - distance
+    if distance == 0:
+        # Concentric; any direction will do
+        normal = (1.0, 0.0)
+    else:
+        normal = (between_x / distance, between_y / distance)
+    if depth <= 0:
+        if separating_axis is not None:
+            separating_axis.axis = normal
+        return None
+    return Contact(normal, depth)
+
+
+def get_sprite_contact(
+    sprite_a: arcade.Sprite,
+    sprite_b: arcade.Sprite,
+    obbs: Optional[ObbCache] = None,
+    separating_axis: Optional[SeparatingAxis] = None,
+) -> Optional[Contact]:
+    """
+    Test two sprites using the cheapest exact test for their shapes:
+
+    - circle sprites, such as explosions, are circles
+    - sprites with four-point hit boxes, such as walls, bullets, and beams, are
+      oriented boxes
+    - anything else, such as vehicles, is a convex polygon
+
+    Boxes are looked up in `obbs`, if given, to avoid rebuilding them.  If given,
+    `separating_axis` is tried first, and updated with the result.
+
+    The contact normal points from `sprite_b` toward `sprite_a`.  Returns `None` if
+    they do not overlap.
+    """
+    get_obb = obbs.get if obbs is not None else get_sprite_obb
+    if separating_axis is not None and separating_axis.axis is not None:
+        axis = separating_axis.axis
+        min_a, max_a = _project_sprite(sprite_a, axis, get_obb)
+        min_b, max_b = _project_sprite(sprite_b, axis, get_obb)
+        if max_a <= min_b or max_b <= min_a:
+            return None
+    contact = _get_sprite_contact(sprite_a, sprite_b, get_obb, separating_axis)
+    if contact is not None and separating_axis is not None:
+        separating_axis.axis = None
+    return contact
+
+
+def _get_sprite_contact(
+    sprite_a: arcade.Sprite,
+    sprite_b: arcade.Sprite,
+    get_obb: Callable[[arcade.Sprite], Obb],
+    separating_axis: Optional[SeparatingAxis],
+):
+    circle_a = isinstance(sprite_a, arcade.SpriteCircle)
+    circle_b = isinstance(sprite_b, arcade.SpriteCircle)
+    if circle_a and circle_b:
+        return circle_circle_contact(
+            sprite_a.position,
+            sprite_a.width / 2,
+            sprite_b.position,
+            sprite_b.width / 2,
+            separating_axis,
+        )
+    if circle_a or circle_b:
+        circle, other = (sprite_a, sprite_b) if circle_a else (sprite_b, sprite_a)
+        if len(other.get_hit_box()) == 4:
+            contact = circle_obb_contact(
+                circle.position, circle.width / 2, get_obb(other), separating_axis
+            )
+        else:
+            contact = circle_polygon_contact(
+                circle.position,
+                circle.width / 2,
+                other.get_adjusted_hit_box(),
+                separating_axis,
+            )
+        # Normal points toward the circle
+        if contact is None or circle_a:
+            return contact
+        return contact.flipped()
+    if len(sprite_a.get_hit_box()) == 4 and len(sprite_b.get_hit_box()) == 4:
+        return obb_obb_contact(get_obb(sprite_a), get_obb(sprite_b), separating_axis)
+    return polygon_contact(
+        sprite_a.get_adjusted_hit_box(),
+        sprite_b.get_adjusted_hit_box(),
+        separating_axis,
+    )
+
+
+def _project_sprite(
+    sprite: arcade.Sprite,
+    axis: Tuple[float, float],
+    get_obb: Callable[[arcade.Sprite], Obb],
+):
+    """
+    Returns (min, max) of a sprite's shape projected onto `axis`.
+    """
+    if isinstance(sprite, arcade.SpriteCircle):
+        center = sprite.center_x * axis[0] + sprite.center_y * axis[1]
+        radius = sprite.width / 2
+        return (center - radius, center + radius)
+    if len(sprite.get_hit_box()) == 4:
+        obb = get_obb(sprite)
+        center = obb.center[0] * axis[0] + obb.center[1] * axis[1]
+        extent = _obb_extent(obb, axis)
+        return (center - extent, center + extent)
+    return _project_polygon(sprite.get_adjusted_hit_box(), axis[0], axis[1])
+
+
+def _obb_extent(obb: Obb, axis: Tuple[float, float]):
+    """
+    Half the length of an `Obb`'s shadow projected onto `axis`.
+    """
+    return obb.half_size[0] * abs(
+        obb.axis_x[0] * axis[0] + obb.axis_x[1] * axis[1]
+    ) + obb.half_size[1] * abs(obb.axis_y[0] * axis[0] + obb.axis_y[1] * axis[1])
+
+
+def _project_polygon(
+    points: Sequence[Tuple[float, float]], axis_x: float, axis_y: float
+):
+    low = high = points[0][0] * axis_x + points[0][1] * axis_y
+    for x, y in points:
+        projection = x * axis_x + y * axis_y
+        if projection < low:
+            low = projection
+        elif projection > high:
+            high = projection
+    return (low, high)
+
+
+def _polygon_average(points: Sequence[Tuple[float, float]]):
+    count = len(points)
+    return (
+        sum(point[0] for point in points) / count,
+        sum(point[1] for point in points) / count,
+    )
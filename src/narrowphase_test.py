@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import math
+from unittest import TestCase
+
+from narrowphase import (
+    Obb,
+    SeparatingAxis,
+    circle_circle_contact,
+    circle_obb_contact,
+    circle_polygon_contact,
+    obb_obb_contact,
+    polygon_contact,
+    raycast_obb,
+    raycast_polygon,
+    segment_obb_contact,
+)
+
+
+class TestRaycastObb(TestCase):
+    def test_axis_aligned_box(self):
+        box = Obb((10, 0), (2, 2), 0)
+
+        distance = raycast_obb((0, 0), (1, 0), 100, box)
+        self.assertAlmostEqual(distance, 8)
+
+        # Pointing away
+        self.assertIsNone(raycast_obb((0, 0), (-1, 0), 100, box))
+        # Out of range
+        self.assertIsNone(raycast_obb((0, 0), (1, 0), 5, box))
+        # Passes above
+        self.assertIsNone(raycast_obb((0, 3), (1, 0), 100, box))
+
+    def test_rotated_box(self):
+        # A square rotated 45 degrees presents a corner to the ray
+        box = Obb((10, 0), (1, 1), math.pi / 4)
+
+        distance = raycast_obb((0, 0), (1, 0), 100, box)
+        self.assertAlmostEqual(distance, 10 - math.sqrt(2))
+
+    def test_origin_inside_box(self):
+        box = Obb((0, 0), (5, 5), 0.3)
+
+        self.assertEqual(raycast_obb((1, 1), (0, 1), 100, box), 0)
+
+
+class TestRaycastPolygon(TestCase):
+    def test_matches_box(self):
+        square = [(9, -1), (11, -1), (11, 1), (9, 1)]
+
+        self.assertAlmostEqual(raycast_polygon((0, 0), (1, 0), 100, square), 9)
+        # Winding order does not matter
+        self.assertAlmostEqual(
+            raycast_polygon((0, 0), (1, 0), 100, list(reversed(square))), 9
+        )
+        self.assertIsNone(raycast_polygon((0, 0), (0, 1), 100, square))
+        self.assertIsNone(raycast_polygon((0, 0), (1, 0), 8, square))
+
+    def test_trimmed_corner(self):
+        # Box with its top-left corner cut off
+        octagon = [(9, -1), (11, -1), (11, 1), (10, 1), (9, 0)]
+
+        self.assertIsNone(raycast_polygon((0, 0.9), (1, 0), 9.2, octagon))
+        self.assertAlmostEqual(raycast_polygon((0, 0.5), (1, 0), 100, octagon), 9.5)
+
+
+class TestPolygonContact(TestCase):
+    def test_overlapping_squares(self):
+        square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+        shifted = [(x + 8, y + 1) for x, y in square]
+
+        contact = polygon_contact(shifted, square)
+        self.assertAlmostEqual(contact.normal[0], 1)
+        self.assertAlmostEqual(contact.normal[1], 0)
+        self.assertAlmostEqual(contact.depth, 2)
+
+        contact = polygon_contact(square, shifted)
+        self.assertAlmostEqual(contact.normal[0], -1)
+
+    def test_separated(self):
+        square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+        shifted = [(x + 11, y) for x, y in square]
+        self.assertIsNone(polygon_contact(square, shifted))
+
+
+class TestObbContact(TestCase):
+    def test_obb_obb(self):
+        box = Obb((0, 0), (5, 5), 0)
+        # Overlaps the right side by 1
+        contact = obb_obb_contact(Obb((9, 2), (5, 5), 0), box)
+        self.assertAlmostEqual(contact.normal[0], 1)
+        self.assertAlmostEqual(contact.normal[1], 0)
+        self.assertAlmostEqual(contact.depth, 1)
+
+        # Diamond whose corner pokes 1 unit into the top
+        diamond = Obb((0, 5 + math.sqrt(2) - 1), (1, 1), math.pi / 4)
+        contact = obb_obb_contact(diamond, box)
+        self.assertAlmostEqual(contact.normal[1], 1)
+        self.assertAlmostEqual(contact.depth, 1)
+
+        self.assertIsNone(obb_obb_contact(Obb((0, 7.5), (1, 1), math.pi / 4), box))
+
+    def test_circle_obb(self):
+        box = Obb((0, 0), (5, 5), math.pi / 2)
+
+        contact = circle_obb_contact((8, 0), 4, box)
+        self.assertAlmostEqual(contact.normal[0], 1)
+        self.assertAlmostEqual(contact.depth, 1)
+
+        # Near a corner, the normal points away from the corner
+        contact = circle_obb_contact((8, 9), 6, box)
+        self.assertAlmostEqual(contact.normal[0], 0.6)
+        self.assertAlmostEqual(contact.normal[1], 0.8)
+        self.assertAlmostEqual(contact.depth, 1)
+
+        self.assertIsNone(circle_obb_contact((8, 9), 4, box))
+
+    def test_circle_polygon(self):
+        # Box with its top-right corner cut off
+        octagon = [(-5, -5), (5, -5), (5, 0), (0, 5), (-5, 5)]
+
+        self.assertIsNone(circle_polygon_contact((5, 5), 3, octagon))
+        contact = circle_polygon_contact((5, 5), 4, octagon)
+        self.assertAlmostEqual(contact.normal[0], math.sqrt(0.5))
+        self.assertAlmostEqual(contact.depth, 4 - math.sqrt(12.5))
+
+    def test_circle_circle(self):
+        contact = circle_circle_contact((6, 8), 6, (0, 0), 6)
+        self.assertAlmostEqual(contact.normal[0], 0.6)
+        self.assertAlmostEqual(contact.normal[1], 0.8)
+        self.assertAlmostEqual(contact.depth, 2)
+
+        # Concentric, including circles with no radius
+        contact = circle_circle_contact((3, 3), 2, (3, 3), 1)
+        self.assertEqual(contact.normal, (1.0, 0.0))
+        self.assertAlmostEqual(contact.depth, 3)
+        warm_start = SeparatingAxis()
+        self.assertIsNone(circle_circle_contact((3, 3), 0, (3, 3), 0, warm_start))
+        self.assertEqual(warm_start.axis, (1.0, 0.0))
+
+    def test_segment_obb(self):
+        box = Obb((10, 0), (2, 2), 0)
+
+        fraction, contact = segment_obb_contact((0, 0), (10, 0), box)
+        self.assertAlmostEqual(fraction, 0.8)
+        self.assertAlmostEqual(contact.normal[0], -1)
+        self.assertAlmostEqual(contact.depth, 2)
+
+        self.assertIsNone(segment_obb_contact((0, 0), (7, 0), box))
+
+    def test_separating_axis_warm_start(self):
+        a = Obb((0, 0), (5, 5), 0)
+        b = Obb((20, 3), (5, 5), 0)
+        warm_start = SeparatingAxis()
+
+        self.assertIsNone(obb_obb_contact(a, b, warm_start))
+        self.assertEqual(warm_start.axis, (1, 0))
+        self.assertIsNone(circle_circle_contact((0, 0), 2, (0, 10), 3, warm_start))
+        self.assertAlmostEqual(abs(warm_start.axis[1]), 1)
@@ -1,17 +1,16 @@
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING, List, Optional, Tuple, cast
 
 import arcade
 
-from arena.wall import Wall
-from iron_math import (
-    add_vec,
-    move_sprite_polar,
-    polar_to_cartesian,
-    set_sprite_location,
-)
+from collision_layers import CollisionLayer
+from collision_world import RaycastHit
+from frame_budget import QualityTier
+from iron_math import move_sprite_polar, polar_to_cartesian, set_sprite_location
 from linked_sprite import LinkedSprite, LinkedSpriteCircle
+from narrowphase import raycast_sprite
 from ordnances.ordnance import Ordnance
 from sprite_lists import SpriteLists
 
@@ -19,6 +18,18 @@ from sprite_lists import SpriteLists
 if TYPE_CHECKING:
     from vehicle import Vehicle
 
+BEAM_COHERENCE_DISTANCE = 2
+"""
+How far, in pixels, the far end of a beam may drift from where walls were last
+traced before they are traced again.  Until then, the beam only re-checks the wall
+it hit last time, and vehicles.
+"""
+LOW_QUALITY_BEAM_COHERENCE_DISTANCE = 8
+"""
+`BEAM_COHERENCE_DISTANCE` while ticks run over budget, at `QualityTier.LOW` and
+below, trading how soon beams notice a nearer wall for fewer traces.
+"""
+
 
 class Beam(Ordnance):
     """
@@ -26,10 +37,20 @@ class Beam(Ordnance):
     When it collides with something, it shortens to stop at whatever it is colliding with
     """
 
+    collision_layer = CollisionLayer.BEAM
+    # Beams trace themselves against the CollisionWorld
+    queries_collision_world = True
+    # Beams exist for as long as the trigger is held
+    time_to_live = None
+
     dps: float
     beam_range: float
     muzzle_location: Tuple[float, float, float]
     hit_location: Tuple[float, float, float]
+    hit: Optional[RaycastHit]
+    "What the beam touched this tick, and where, for drawing sparks or decals"
+    wall_traces: int
+    "Total times walls were traced from scratch, instead of re-checked"
 
     def __init__(
         self,
@@ -42,47 +63,113 @@ class Beam(Ordnance):
         self.dps = dps
         self.beam_range = beam_range
         self.muzzle_location = (0, 0, 0)
+        self.hit = None
+        self.wall_traces = 0
+        self._wall_trace_location: Optional[Tuple[float, float, float]] = None
+        "Muzzle location when walls were last traced"
+        self._wall_hit: Optional[RaycastHit] = None
+        "First wall hit when walls were last traced"
 
     def update(self, delta_time: float):
-        self.sprite.width = self.beam_range
-        self._update_sprite_location()
-
-    def on_collision_with_wall(
-        self, walls_touching_projectile: list[LinkedSprite[Wall]]
-    ):
-        self._shorten_beam(walls_touching_projectile)
-
-    def on_collision_with_vehicle(
-        self,
-        delta_time: float,
-        vehicles_touching_projectile: list[LinkedSprite[Vehicle]],
-    ):
-        vehicle_sprite: LinkedSprite[Vehicle] = self._shorten_beam(
-            vehicles_touching_projectile
-        )
+        vehicle_sprite: Optional[LinkedSprite[Vehicle]] = self._trace_beam()
         if vehicle_sprite != None:
             vehicle_sprite.owner.apply_damage(self.dps * delta_time)
 
-    def _shorten_beam(self, collision_list: list[LinkedSprite]):
+    def _trace_beam(self):
         """
-        Given a list of sprites the beam collided with, stop the beam at the first sprite it hits.
-        Return that first sprite
+        Stop the beam at the first wall or vehicle it hits.
+        Return the vehicle sprite that was hit, if any
         """
-        collisions = arcade.SpriteList()
-        closest_collision: Optional[LinkedSprite] = None
-        for collision in collision_list:
-            collisions.append(collision)
-        point: Tuple[float, float] = self.muzzle_location[:2]
-        point_vec: Tuple[float, float] = polar_to_cartesian(1, self.sprite.radians)
-        for x in range(1, self.beam_range):
-            if arcade.get_sprites_at_point(point, collisions):
-                closest_collision = arcade.get_sprites_at_point(point, collisions)[0]
-                self.sprite.width = x
-                self.hit_location = (point[0], point[1], self.sprite.radians)
-                break
-            point = add_vec(point, point_vec)
+        origin: Tuple[float, float] = self.muzzle_location[:2]
+        direction: Tuple[float, float] = polar_to_cartesian(1, self.muzzle_location[2])
+        wall_hit = self._find_wall_hit(origin, direction)
+        # Vehicles move, so they are always traced, up to the wall
+        hit = self.sprite_lists.collision_world.raycast(
+            origin,
+            direction,
+            self.beam_range if wall_hit is None else wall_hit.distance,
+            self.collision_mask & ~CollisionLayer.WALL,
+            self.owner_sprite,
+        )
+        if hit is None:
+            hit = wall_hit
+        self.hit = hit
+        if hit is None:
+            self.sprite.width = self.beam_range
+            self._update_sprite_location()
+            return None
+        # Arcade rescales the hit box relative to the previous width, so the
+        # beam must never shrink all the way to zero
+        self.sprite.width = max(hit.distance, 1)
+        self.hit_location = (hit.point[0], hit.point[1], self.muzzle_location[2])
         self._update_sprite_location()
-        return closest_collision
+        # Beams touch the same thing tick after tick; only the first tick begins
+        contact = self.sprite_lists.collision_world.contacts.report(
+            self.sprite, hit.sprite
+        )
+        if contact.began:
+            self.on_collision_begin(hit.sprite)
+        if hit.layer == CollisionLayer.VEHICLE:
+            return hit.sprite
+        return None
+
+    def _find_wall_hit(
+        self, origin: Tuple[float, float], direction: Tuple[float, float]
+    ) -> Optional[RaycastHit]:
+        """
+        Find the first wall along the beam.  Walls never move, so while the muzzle
+        stays close to where walls were last traced, only the wall hit then is
+        checked again.
+        """
+        if not self.collision_mask & CollisionLayer.WALL:
+            return None
+        coherence_distance = (
+            LOW_QUALITY_BEAM_COHERENCE_DISTANCE
+            if self.sprite_lists.frame_budget.tier >= QualityTier.LOW
+            else BEAM_COHERENCE_DISTANCE
+        )
+        if self._get_drift() < coherence_distance:
+            wall_hit = self._wall_hit
+            if wall_hit is None:
+                # Nothing was in range, and the beam has barely moved
+                return None
+            distance = raycast_sprite(
+                origin, direction, self.beam_range, wall_hit.sprite
+            )
+            if (
+                distance is not None
+                and distance <= wall_hit.distance + coherence_distance
+            ):
+                return RaycastHit(
+                    distance,
+                    distance / self.beam_range,
+                    (
+                        origin[0] + direction[0] * distance,
+                        origin[1] + direction[1] * distance,
+                    ),
+                    wall_hit.sprite,
+                    wall_hit.layer,
+                )
+        self.wall_traces += 1
+        self._wall_trace_location = self.muzzle_location
+        self._wall_hit = self.sprite_lists.collision_world.raycast(
+            origin, direction, self.beam_range, CollisionLayer.WALL
+        )
+        return self._wall_hit
+
+    def _get_drift(self) -> float:
+        """
+        How far the far end of the beam has moved since walls were last traced,
+        at most.
+        """
+        if self._wall_trace_location is None:
+            return math.inf
+        x, y, radians = self._wall_trace_location
+        return math.hypot(
+            self.muzzle_location[0] - x, self.muzzle_location[1] - y
+        ) + self.beam_range * abs(
+            math.remainder(self.muzzle_location[2] - radians, math.tau)
+        )
 
     def _update_sprite_location(self):
         set_sprite_location(self.sprite, self.muzzle_location)
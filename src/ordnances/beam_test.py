@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+import arcade
+
+from linked_sprite import LinkedSpriteSolidColor
+from ordnances.beam import Beam
+from ordnances.ordnance import Ordnance
+from sprite_lists import SpriteLists
+from test_fakes import FakeVehicle
+
+
+class TestBeam(TestCase):
+    def setUp(self):
+        self.sprite_lists = SpriteLists()
+        wall = arcade.SpriteSolidColor(20, 200, arcade.color.BLACK)
+        wall.position = (210, 100)
+        self.sprite_lists.walls.append(wall)
+        self.sprite_lists.collision_world.bake_walls()
+        self.sprite_lists.collision_world.update()
+        self.beam = Beam(
+            LinkedSpriteSolidColor[Ordnance](400, 3, arcade.color.RED),
+            self.sprite_lists,
+            60,
+            400,
+        )
+        self.beam.append_sprite()
+        self.beam.muzzle_location = (0, 100, 0)
+
+    def test_rechecks_last_wall_while_barely_moving(self):
+        for tick in range(10):
+            self.beam.muzzle_location = (tick * 0.1, 100, 0)
+            self.beam.update(1 / 60)
+        self.assertEqual(self.beam.wall_traces, 1)
+        self.assertAlmostEqual(self.beam.hit.point[0], 200)
+        self.assertAlmostEqual(self.beam.hit.distance, 200 - 0.9)
+
+        self.beam.muzzle_location = (0, 150, 0)
+        self.beam.update(1 / 60)
+        self.assertEqual(self.beam.wall_traces, 2)
+
+    def test_always_traces_vehicles(self):
+        self.beam.update(1 / 60)
+        vehicle = FakeVehicle(self.sprite_lists, 100, 100)
+        self.sprite_lists.collision_world.update()
+        self.beam.update(1 / 60)
+        self.assertEqual(self.beam.wall_traces, 1)
+        self.assertIs(self.beam.hit.sprite, vehicle.sprite)
+        self.assertAlmostEqual(self.beam.hit.point[0], 90)
+        self.assertAlmostEqual(vehicle.damage_taken, 1)
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import math
-from typing import TYPE_CHECKING, List, Optional, Tuple, cast
+from typing import TYPE_CHECKING, List, Set, Tuple
 
 import arcade
 
-from arena.wall import Wall
-from iron_math import move_sprite_polar
+from collision_layers import CollisionLayer
 from linked_sprite import LinkedSprite, LinkedSpriteCircle
+from narrowphase import closest_point_on_polygon
 from ordnances.ordnance import Ordnance
 from sprite_lists import SpriteLists
 
@@ -15,13 +15,36 @@ from sprite_lists import SpriteLists
 if TYPE_CHECKING:
     from vehicle import Vehicle
 
+EXPLOSION_RAY_COUNT = 32
+"Directions in which walls are found when an explosion starts; 11.25 degrees apart"
+
 
 class Explosion(Ordnance):
+    """
+    A ring that expands from where it activates until it reaches `explosion_radius`,
+    damaging every vehicle it touches once.
+
+    Hits are computed from the center and current radius.  When the explosion
+    activates, a fan of rays finds how far the blast can travel in each direction
+    before a wall stops it.  Each tick after that costs one circle query, and a
+    lookup into the fan for each vehicle inside the circle.
+    """
+
+    collision_layer = CollisionLayer.EXPLOSION
+    # Explosions query the CollisionWorld themselves
+    queries_collision_world = True
+    # Explosions remove themselves once fully expanded, usually well within this
+    time_to_live = 2
+    # Rockets that explode too close hurt whoever fired them
+    hits_owner = True
+
     damage: float
     explosion_rate: float
     explosion_radius: float
     current_radius: float
-    vehicles_hit: list[Vehicle]
+    vehicles_hit: Set[Vehicle]
+    ray_reaches: List[float]
+    "How far the blast travels in each direction of the fan before hitting a wall"
 
     def __init__(
         self,
@@ -35,86 +58,88 @@ class Explosion(Ordnance):
             explosion_radius, color, soft=False
         )
         super().__init__(explosion_appearance, sprite_lists)
-        self.sprite.visible = False
         self.color = color
         self.damage = damage
         self.explosion_radius = explosion_radius
         self.explosion_rate = explosion_rate
         self.current_radius = 1
-        self.vehicles_hit = []
-        # Make a list of all directions in radians in pi/16 (11.25 degree) increments
-        directions = [x * (math.pi / 16) for x in range(-16, 16)]
-        for direction in directions:
-            self.payload_list.append(self.create_sub_explosion(direction))
-
-    def update(self, delta_time: float):
-        self.current_radius += delta_time * self.explosion_rate
-        if self.current_radius > self.explosion_radius:
-            for payload in self.payload_list:
-                if payload.exists:
-                    payload.remove_sprite()
-            self.remove_sprite()
+        self.vehicles_hit = set()
+        self.ray_reaches = [explosion_radius] * EXPLOSION_RAY_COUNT
 
-    def create_sub_explosion(self, direction: float):
-        sub_explosion_appearance = LinkedSpriteCircle[SubExplosion](
-            self.explosion_radius, self.color, soft=False
-        )
-        sub_explosion = SubExplosion(
-            sub_explosion_appearance,
-            self.sprite_lists,
-            self.damage,
-            self,
-            self.explosion_rate,
-            direction,
-        )
-        return sub_explosion
+    def reset(self):
+        super().reset()
+        self.current_radius = 1
+        self.vehicles_hit = set()
 
     def activate(self, start_location: Tuple[float, float, float]):
         super().activate(start_location)
-        self.activate_payload()
-
-
-class SubExplosion(Ordnance):
-    damage: float
-    explosion: Explosion
-    explosion_rate: float
-    direction: float
-
-    def __init__(
-        self,
-        sprite: LinkedSprite[Ordnance],
-        sprite_lists: SpriteLists,
-        damage: float,
-        explosion: Explosion,
-        explosion_rate: float,
-        direction: float,
-    ):
-        super().__init__(sprite, sprite_lists)
-        self.damage = damage
-        self.explosion = explosion
-        self.explosion_rate = explosion_rate
-        self.direction = direction
-        self.sprite.height = 1
-        self.sprite.width = 1
+        self._cast_ray_fan()
+        self._update_sprite_scale()
 
     def update(self, delta_time: float):
-        move_sprite_polar(
-            self.sprite, self.explosion_rate * 0.8 * delta_time, self.direction
+        self.current_radius += delta_time * self.explosion_rate
+        if self.current_radius > self.explosion_radius:
+            self.remove_sprite()
+            return
+        self._update_sprite_scale()
+        self._hit_vehicles()
+
+    def get_reach(self, radians: float) -> float:
+        """
+        How far the blast can travel in a direction before a wall stops it,
+        interpolated between the two nearest rays of the fan.
+        """
+        position = (radians / math.tau) * EXPLOSION_RAY_COUNT % EXPLOSION_RAY_COUNT
+        index = int(position) % EXPLOSION_RAY_COUNT
+        next_index = (index + 1) % EXPLOSION_RAY_COUNT
+        blend = position - int(position)
+        return (
+            self.ray_reaches[index] * (1 - blend) + self.ray_reaches[next_index] * blend
         )
-        self.sprite.height += self.explosion_rate * 2 * 0.2 * delta_time
-        self.sprite.width += self.explosion_rate * 2 * 0.2 * delta_time
-
-    def on_collision_with_wall(
-        self, walls_touching_projectile: list[LinkedSprite[Wall]]
-    ):
-        self.explosion_rate = 0
 
-    def on_collision_with_vehicle(
-        self,
-        delta_time: float,
-        vehicles_touching_projectile: list[LinkedSprite[Vehicle]],
-    ):
-        for vehicle_sprite in vehicles_touching_projectile:
-            if vehicle_sprite.owner not in self.explosion.vehicles_hit:
+    def _cast_ray_fan(self):
+        collision_world = self.sprite_lists.collision_world
+        origin = self.sprite.position
+        for index in range(EXPLOSION_RAY_COUNT):
+            radians = index * math.tau / EXPLOSION_RAY_COUNT
+            hit = collision_world.raycast(
+                origin,
+                (math.cos(radians), math.sin(radians)),
+                self.explosion_radius,
+                CollisionLayer.WALL,
+            )
+            self.ray_reaches[index] = (
+                self.explosion_radius if hit is None else hit.distance
+            )
+
+    def _hit_vehicles(self):
+        center = self.sprite.position
+        collision_world = self.sprite_lists.collision_world
+        vehicle_sprites = collision_world.overlap_circle(
+            center,
+            self.current_radius,
+            self.collision_mask & CollisionLayer.VEHICLE,
+            self.owner_sprite,
+        )
+        for vehicle_sprite in vehicle_sprites:
+            vehicle_sprite: LinkedSprite[Vehicle]
+            closest, inside = closest_point_on_polygon(
+                center, vehicle_sprite.get_adjusted_hit_box()
+            )
+            offset_x = closest[0] - center[0]
+            offset_y = closest[1] - center[1]
+            if not inside and math.hypot(offset_x, offset_y) > self.get_reach(
+                math.atan2(offset_y, offset_x)
+            ):
+                # Sheltered behind a wall
+                continue
+            if collision_world.contacts.report(self.sprite, vehicle_sprite).began:
+                self.on_collision_begin(vehicle_sprite)
+            if vehicle_sprite.owner not in self.vehicles_hit:
                 vehicle_sprite.owner.apply_damage(self.damage)
-                self.explosion.vehicles_hit.append(vehicle_sprite.owner)
+                self.vehicles_hit.add(vehicle_sprite.owner)
+
+    def _update_sprite_scale(self):
+        # Walls stop the blast, so the visual never grows past the farthest ray
+        radius = min(self.current_radius, max(self.ray_reaches))
+        self.sprite.scale = radius / self.explosion_radius
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+import arcade
+
+from linked_sprite import LinkedSpriteSolidColor
+from ordnances.explosion import Explosion
+from ordnances.ordnance import Ordnance
+from ordnances.projectile import Projectile
+from sprite_lists import SpriteLists
+from test_fakes import FakeVehicle
+
+
+class TestExplosion(TestCase):
+    def setUp(self):
+        self.sprite_lists = SpriteLists()
+        wall = arcade.SpriteSolidColor(10, 100, arcade.color.BLACK)
+        wall.position = (130, 100)
+        self.sprite_lists.walls.append(wall)
+        self.sprite_lists.collision_world.bake_walls()
+
+    def test_damages_each_vehicle_once_unless_sheltered(self):
+        exposed = FakeVehicle(self.sprite_lists, 100, 150)
+        sheltered = FakeVehicle(self.sprite_lists, 160, 100)
+        self.sprite_lists.collision_world.update()
+        explosion = Explosion(arcade.color.RED, self.sprite_lists, 50, 75, 200)
+        explosion.activate((100, 100, 0))
+
+        self.assertAlmostEqual(explosion.get_reach(0), 25)
+        while explosion.exists:
+            explosion.update(1 / 60)
+        self.assertEqual(exposed.damage_taken, 50)
+        self.assertEqual(sheltered.damage_taken, 0)
+
+    def test_damages_the_vehicle_that_fired_it(self):
+        shooter = FakeVehicle(self.sprite_lists, 90, 100)
+        self.sprite_lists.collision_world.update()
+        rocket = Projectile(
+            LinkedSpriteSolidColor[Ordnance](8, 3, arcade.color.RED),
+            self.sprite_lists,
+            0,
+            550,
+        )
+        rocket.owner_vehicle = shooter
+        rocket.payload_list.append(
+            Explosion(arcade.color.RED, self.sprite_lists, 50, 75, 200)
+        )
+        rocket.launch((100, 100, 0), 0)
+        # The rocket itself never hits its shooter, but its blast does
+        self.assertIsNotNone(rocket.owner_sprite)
+        explosion = rocket.payload_list[0]
+        rocket.activate_payload()
+        self.assertIsNone(explosion.owner_sprite)
+
+        while explosion.exists:
+            explosion.update(1 / 60)
+        self.assertEqual(shooter.damage_taken, 50)
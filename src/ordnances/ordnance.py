@@ -4,12 +4,17 @@ from typing import TYPE_CHECKING, List, Optional, Tuple, cast
 
 import arcade
 
+from collision_layers import CollisionLayer, get_collision_mask
 from iron_math import set_sprite_location
 from linked_sprite import LinkedSprite
 from sprite_lists import SpriteLists
 
+DEFAULT_TIME_TO_LIVE = 10
+"Seconds before ordnance is removed, unless it sets its own `time_to_live`"
+
 # This allows a circular import only for the purposes of type hints
 if TYPE_CHECKING:
+    from ordnances.ordnance_pool import OrdnancePool
     from vehicle import Vehicle
 
 
@@ -31,6 +36,30 @@ class Ordnance:
     """
     Ordnance is visible and can be collided with.  Used for long-lived projectile objects that are repeatedly added to/removed from the world over time, such as laser beams.
     """
+    collision_layer: CollisionLayer = CollisionLayer.NONE
+    "Which layer this ordnance belongs to"
+    queries_collision_world: bool = False
+    """
+    Ordnance that queries the `CollisionWorld` itself, such as beams and projectiles, is skipped by `collision.py`.
+    """
+    owner_vehicle: Optional[Vehicle]
+    """
+    Vehicle that fired this ordnance, which it does not collide with unless `hits_owner`.  Passed on to payloads when they activate.
+    """
+    hits_owner: bool = False
+    """
+    Ordnance can hit `owner_vehicle`.  Direct hits, such as projectiles and beams, never hit the vehicle that fired them, which their muzzle is inside of; blasts, such as explosions, do.
+    """
+    pool: Optional[OrdnancePool] = None
+    """
+    Pool this ordnance came from, and goes back to when its sprite is removed.  `None` for ordnance that is not recycled, such as beams.
+    """
+    in_pool: bool = False
+    "Ordnance is waiting in its pool to be acquired"
+    time_to_live: Optional[float] = DEFAULT_TIME_TO_LIVE
+    """
+    Seconds after appearing that `OrdnanceLifetimes` removes this ordnance, if nothing else has.  `None` for ordnance whose lifetime is managed by its weapon, such as beams, which also exempts it from the ordnance budget.
+    """
 
     def __init__(
         self,
@@ -43,6 +72,24 @@ class Ordnance:
         self.payload_list = []
         self.sprite_rotation_offset = 0
         self.exists = False
+        self.owner_vehicle = None
+
+    @property
+    def collision_mask(self) -> CollisionLayer:
+        """
+        Layers this ordnance collides with, according to the layer-pair matrix.
+        """
+        return get_collision_mask(self.collision_layer)
+
+    @property
+    def owner_sprite(self) -> Optional[arcade.Sprite]:
+        """
+        Sprite of `owner_vehicle`, to ignore in collision queries, or `None` if
+        there is nothing to ignore.
+        """
+        if self.owner_vehicle is None or self.hits_owner:
+            return None
+        return self.owner_vehicle.sprite
 
     @property
     def location(self) -> Tuple[float, float, float]:
@@ -52,16 +99,45 @@ class Ordnance:
             self.sprite.radians - self.sprite_rotation_offset,
         )
 
+    @property
+    def sprite_list(self) -> arcade.SpriteList:
+        """
+        Sprite list this ordnance is added to while it exists.
+        """
+        return self.sprite_lists.ordnance
+
     def append_sprite(self):
-        self.sprite_lists.ordnance.append(self.sprite)
+        self.sprite_list.append(self.sprite)
         self.exists = True
+        self.sprite_lists.ordnance_lifetimes.add(self)
 
     def remove_sprite(self):
-        self.sprite_lists.ordnance.remove(self.sprite)
+        self.sprite_list.remove(self.sprite)
         self.exists = False
+        self.sprite_lists.ordnance_lifetimes.remove(self)
+        if self.pool is not None:
+            self.pool.release(self)
+
+    def reset(self):
+        """
+        Reset hook, called when this ordnance is acquired from its pool.  Restore
+        anything that changed while it was last in use.
+        """
+        self.payload_list.clear()
+        self.owner_vehicle = None
+
+    def discard_payload(self):
+        """
+        Release payload that will never be activated back to its pools.
+        """
+        for payload in self.payload_list:
+            if payload.pool is not None:
+                payload.pool.release(payload)
+        self.payload_list.clear()
 
     def activate_payload(self):
         for payload in self.payload_list:
+            payload.owner_vehicle = self.owner_vehicle
             payload.activate(self.location)
 
     def activate(self, spawn_location: Tuple[float, float, float]):
@@ -71,6 +147,20 @@ class Ordnance:
     def update(self, delta_time: float):
         ...
 
+    def on_collision_begin(self, sprite: arcade.Sprite):
+        """
+        Called once when this ordnance starts touching a wall or vehicle, before
+        `on_collision_with_wall` or `on_collision_with_vehicle`.
+        """
+        ...
+
+    def on_collision_end(self, sprite: arcade.Sprite):
+        """
+        Called once when this ordnance stops touching a wall or vehicle, including
+        when the ordnance is removed.
+        """
+        ...
+
     def on_collision_with_wall(self, walls_touching_projectile: arcade.SpriteList):
         ...
 
@@ -86,6 +176,8 @@ def update_ordnance(
     delta_time: float,
     sprite_lists: SpriteLists,
 ):
+    sprite_lists.projectile_engine.update(delta_time)
     for ordnance_sprite in sprite_lists.ordnance:
         ordnance_sprite: LinkedSprite[Ordnance]
         ordnance_sprite.owner.update(delta_time)
+    sprite_lists.ordnance_lifetimes.update(delta_time, sprite_lists.vehicles)
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+from enum import Enum
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+import arcade
+import numpy as np
+
+from constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+# This allows a circular import only for the purposes of type hints
+if TYPE_CHECKING:
+    from ordnances.ordnance import Ordnance
+
+DEFAULT_ORDNANCE_BUDGET = 512
+"Most ordnance allowed to exist at once before the eviction policy kicks in"
+
+
+class EvictionPolicy(Enum):
+    OLDEST = "oldest"
+    "Evict the ordnance that was spawned first"
+    FARTHEST = "farthest"
+    "Evict the ordnance farthest from every vehicle, which matters least"
+
+
+class OrdnanceLifetimes:
+    """
+    Bounds how long, where, and how much ordnance can exist.
+
+    - Every ordnance with a `time_to_live` is removed once it expires.
+    - Projectiles that leave `kill_bounds` are removed by the `ProjectileEngine`.
+    - If more than `budget` ordnance exist at the end of a tick, the extras are
+      evicted according to `eviction_policy`.
+
+    Ordnance is tracked from `append_sprite` until `remove_sprite`.  Removed
+    ordnance never activates its payload.
+    """
+
+    kill_bounds: Tuple[float, float, float, float]
+    "(left, bottom, right, top) outside of which projectiles are removed"
+    budget: int
+    eviction_policy: EvictionPolicy
+    expired: int
+    "Total ordnance removed because its time to live ran out"
+    evicted: int
+    "Total ordnance removed to stay within `budget`"
+
+    def __init__(
+        self,
+        budget: int = DEFAULT_ORDNANCE_BUDGET,
+        eviction_policy: EvictionPolicy = EvictionPolicy.OLDEST,
+    ):
+        self.kill_bounds = (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.budget = budget
+        self.eviction_policy = eviction_policy
+        self.expired = 0
+        self.evicted = 0
+        self._time = 0.0
+        self._spawn_times: Dict[Ordnance, float] = {}
+        "Every tracked ordnance, oldest first"
+        self._expiry_heap: List[Tuple[float, int, Ordnance]] = []
+        "(expiry time, tiebreaker, ordnance), including ordnance already removed"
+        self._tiebreaker = itertools.count()
+
+    @property
+    def count(self) -> int:
+        return len(self._spawn_times)
+
+    def add(self, ordnance: Ordnance):
+        if ordnance.time_to_live is None:
+            return
+        self._spawn_times[ordnance] = self._time
+        heapq.heappush(
+            self._expiry_heap,
+            (self._time + ordnance.time_to_live, next(self._tiebreaker), ordnance),
+        )
+
+    def remove(self, ordnance: Ordnance):
+        # Its entry in the expiry heap is skipped when it comes up
+        self._spawn_times.pop(ordnance, None)
+
+    def update(self, delta_time: float, vehicles: arcade.SpriteList):
+        """
+        Call once per tick, after ordnance has updated.
+        """
+        self._time += delta_time
+        self._remove_expired()
+        excess = len(self._spawn_times) - self.budget
+        if excess > 0:
+            for ordnance in self._choose_evictions(excess, vehicles):
+                self.evicted += 1
+                self._kill(ordnance)
+
+    def _remove_expired(self):
+        heap = self._expiry_heap
+        while len(heap) > 0 and heap[0][0] <= self._time:
+            expiry, _, ordnance = heapq.heappop(heap)
+            spawn_time = self._spawn_times.get(ordnance)
+            # Skip entries for ordnance that was removed, or removed and respawned
+            if spawn_time is None or spawn_time + ordnance.time_to_live != expiry:
+                continue
+            self.expired += 1
+            self._kill(ordnance)
+
+    def _choose_evictions(
+        self, count: int, vehicles: arcade.SpriteList
+    ) -> List[Ordnance]:
+        tracked = list(self._spawn_times)
+        if self.eviction_policy == EvictionPolicy.OLDEST or len(vehicles) == 0:
+            return tracked[:count]
+        positions = np.array([ordnance.sprite.position for ordnance in tracked])
+        vehicle_positions = np.array([vehicle.position for vehicle in vehicles])
+        offsets = positions[:, np.newaxis, :] - vehicle_positions[np.newaxis, :, :]
+        distances = np.einsum("nvk,nvk->nv", offsets, offsets).min(axis=1)
+        farthest = np.argpartition(-distances, count - 1)[:count]
+        return [tracked[index] for index in farthest.tolist()]
+
+    def _kill(self, ordnance: Ordnance):
+        ordnance.discard_payload()
+        ordnance.remove_sprite()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+import arcade
+
+from linked_sprite import LinkedSpriteSolidColor
+from ordnances.ordnance import Ordnance
+from ordnances.ordnance_lifetimes import EvictionPolicy
+from sprite_lists import SpriteLists
+
+
+class TestOrdnanceLifetimes(TestCase):
+    def setUp(self):
+        self.sprite_lists = SpriteLists()
+        self.lifetimes = self.sprite_lists.ordnance_lifetimes
+
+    def spawn(self, x: float, time_to_live: float = 10):
+        ordnance = Ordnance(
+            LinkedSpriteSolidColor[Ordnance](4, 4, arcade.color.RED),
+            self.sprite_lists,
+        )
+        ordnance.time_to_live = time_to_live
+        ordnance.activate((x, 0, 0))
+        return ordnance
+
+    def test_time_to_live(self):
+        short = self.spawn(0, 0.5)
+        long = self.spawn(0, 2)
+        self.lifetimes.update(0.4, self.sprite_lists.vehicles)
+        self.assertTrue(short.exists)
+        self.lifetimes.update(0.2, self.sprite_lists.vehicles)
+        self.assertFalse(short.exists)
+        self.assertTrue(long.exists)
+        self.assertEqual(self.lifetimes.expired, 1)
+
+        # Removed early and respawned: the old expiry no longer applies
+        long.remove_sprite()
+        long.activate((0, 0, 0))
+        self.lifetimes.update(1.5, self.sprite_lists.vehicles)
+        self.assertTrue(long.exists)
+
+    def test_evicts_oldest(self):
+        self.lifetimes.budget = 2
+        first, second, third = self.spawn(0), self.spawn(0), self.spawn(0)
+        self.lifetimes.update(0.1, self.sprite_lists.vehicles)
+        self.assertFalse(first.exists)
+        self.assertTrue(second.exists and third.exists)
+        self.assertEqual(self.lifetimes.evicted, 1)
+
+    def test_evicts_farthest(self):
+        vehicle = arcade.SpriteSolidColor(10, 10, arcade.color.BLUE)
+        self.sprite_lists.vehicles.append(vehicle)
+        self.lifetimes.budget = 2
+        self.lifetimes.eviction_policy = EvictionPolicy.FARTHEST
+        near, far, middle = self.spawn(10), self.spawn(300), self.spawn(100)
+        self.lifetimes.update(0.1, self.sprite_lists.vehicles)
+        self.assertFalse(far.exists)
+        self.assertTrue(near.exists and middle.exists)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+# This allows a circular import only for the purposes of type hints
+if TYPE_CHECKING:
+    from ordnances.ordnance import Ordnance
+    from weapons.archetypes import OrdnanceArchetype
+
+T = TypeVar("T", bound="Ordnance")
+
+
+class OrdnancePool(Generic[T]):
+    """
+    Preallocated ordnance of one archetype, such as machine gun bullets, recycled
+    instead of allocated on every shot.
+
+    `acquire` hands out a free ordnance, after calling its `reset` hook.  Ordnance
+    goes back to its pool by itself when its sprite is removed.
+
+    If every ordnance is in use, `acquire` creates another and counts the pool as
+    exhausted.  Only `capacity` ordnance are kept when released; the extras are
+    left to the garbage collector.  Raise `capacity` if pools are exhausted during
+    normal play.
+    """
+
+    name: str
+    capacity: int
+    "How many ordnance are preallocated and kept for reuse"
+    created: int
+    "Total ordnance ever created by this pool, including preallocated ones"
+    in_use: int
+    "Ordnance acquired and not yet released"
+    peak_in_use: int
+    exhausted: int
+    "How many times `acquire` found no free ordnance and had to create one"
+
+    def __init__(self, name: str, create: Callable[[], T], capacity: int):
+        self.name = name
+        self.capacity = capacity
+        self.created = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.exhausted = 0
+        self._create = create
+        self._free: List[T] = [self._create_ordnance() for _ in range(capacity)]
+
+    @property
+    def free(self) -> int:
+        return len(self._free)
+
+    def acquire(self) -> T:
+        if len(self._free) > 0:
+            ordnance = self._free.pop()
+        else:
+            self.exhausted += 1
+            ordnance = self._create_ordnance()
+        ordnance.in_pool = False
+        ordnance.reset()
+        self.in_use += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+        return ordnance
+
+    def release(self, ordnance: T):
+        """
+        Return ordnance to the pool.  Releasing ordnance that is already released
+        does nothing.
+        """
+        if ordnance.in_pool:
+            return
+        ordnance.in_pool = True
+        self.in_use -= 1
+        if len(self._free) < self.capacity:
+            self._free.append(ordnance)
+
+    def get_readout(self) -> str:
+        return (
+            f"{self.name}: {self.in_use} in use, {self.free} free, "
+            f"peak {self.peak_in_use}/{self.capacity}, exhausted {self.exhausted}"
+        )
+
+    def _create_ordnance(self) -> T:
+        ordnance = self._create()
+        ordnance.pool = self
+        ordnance.in_pool = True
+        self.created += 1
+        return ordnance
+
+
+class OrdnancePools:
+    """
+    Every `OrdnancePool`, by archetype name, so that all weapons of the same kind
+    share one pool.
+    """
+
+    def __init__(self):
+        self._pools: Dict[str, OrdnancePool] = {}
+        self._archetypes: Dict[str, Optional[OrdnanceArchetype]] = {}
+        "Archetype each pool's ordnance was created from"
+
+    def get(
+        self,
+        name: str,
+        create: Callable[[], T],
+        capacity: int,
+        archetype: Optional[OrdnanceArchetype] = None,
+    ) -> OrdnancePool[T]:
+        """
+        Get the pool named `name`, creating and filling it on first use.
+
+        Ordnance copies its stats from its archetype when it is created.  If
+        `archetype` differs from the one the pool was created for, such as after
+        `set_archetypes`, the pool is replaced with one filled by `create`.
+        Ordnance from the old pool still goes back to the old pool.
+        """
+        pool = self._pools.get(name)
+        if pool is None or self._archetypes[name] != archetype:
+            pool = OrdnancePool(name, create, capacity)
+            self._pools[name] = pool
+            self._archetypes[name] = archetype
+        return pool
+
+    def __iter__(self) -> Iterator[OrdnancePool]:
+        return iter(self._pools.values())
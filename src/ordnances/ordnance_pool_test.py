@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from unittest import TestCase
+
+import arcade
+
+from linked_sprite import LinkedSpriteSolidColor
+from ordnances.ordnance import Ordnance
+from ordnances.ordnance_pool import OrdnancePools
+from sprite_lists import SpriteLists
+from weapons.archetypes import ProjectileArchetype
+
+
+class TestOrdnancePool(TestCase):
+    def setUp(self):
+        self.sprite_lists = SpriteLists()
+        self.pools = OrdnancePools()
+
+    def create_ordnance(self):
+        return Ordnance(
+            LinkedSpriteSolidColor[Ordnance](4, 4, arcade.color.RED),
+            self.sprite_lists,
+        )
+
+    def test_recycles_released_ordnance(self):
+        pool = self.pools.get("bullet", self.create_ordnance, 2)
+        self.assertIs(self.pools.get("bullet", self.create_ordnance, 2), pool)
+        self.assertEqual(pool.created, 2)
+
+        ordnance = pool.acquire()
+        ordnance.payload_list.append(self.create_ordnance())
+        ordnance.activate((0, 0, 0))
+        self.assertEqual(pool.in_use, 1)
+        ordnance.remove_sprite()
+        # Releasing twice must not count twice
+        pool.release(ordnance)
+        self.assertEqual(pool.in_use, 0)
+
+        self.assertIs(pool.acquire(), ordnance)
+        self.assertEqual(ordnance.payload_list, [])
+        self.assertEqual(pool.created, 2)
+
+    def test_counts_exhaustion(self):
+        pool = self.pools.get("rocket", self.create_ordnance, 1)
+        first = pool.acquire()
+        second = pool.acquire()
+        self.assertEqual(pool.exhausted, 1)
+        self.assertEqual(pool.peak_in_use, 2)
+
+        first.activate((0, 0, 0))
+        second.activate((0, 0, 0))
+        first.remove_sprite()
+        second.remove_sprite()
+        # Only `capacity` ordnance are kept
+        self.assertEqual(pool.free, 1)
+
+    def test_replaces_pool_when_archetype_changes(self):
+        archetype = ProjectileArchetype("bullet", damage=10, speed=800, pool_capacity=2)
+        old_pool = self.pools.get("bullet", self.create_ordnance, 2, archetype)
+        in_flight = old_pool.acquire()
+        in_flight.activate((0, 0, 0))
+
+        archetype = replace(archetype, damage=5)
+        pool = self.pools.get("bullet", self.create_ordnance, 2, archetype)
+        self.assertIsNot(pool, old_pool)
+        self.assertIs(
+            self.pools.get("bullet", self.create_ordnance, 2, archetype), pool
+        )
+        self.assertEqual(list(self.pools), [pool])
+
+        in_flight.remove_sprite()
+        self.assertEqual(old_pool.free, 2)
+        self.assertEqual(pool.free, 2)
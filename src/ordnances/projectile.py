@@ -4,7 +4,8 @@ from typing import TYPE_CHECKING, List, Optional, Tuple, cast
 
 import arcade
 
-from iron_math import move_sprite_polar, set_sprite_location, sprite_in_bounds
+from collision_layers import CollisionLayer
+from iron_math import polar_to_cartesian, set_sprite_location
 from linked_sprite import LinkedSprite
 from ordnances.ordnance import Ordnance
 from sprite_lists import SpriteLists
@@ -18,36 +19,114 @@ class Projectile(Ordnance):
     """
     A Projectile is a type of Ordncance that is created by a weapon with a direction and speed, and then forgotten about by the weapon.
     When it collides with something, it activates its payload and is removed
+
+    Once launched, projectiles are moved by the `ProjectileEngine`, not by `update`
     """
 
+    collision_layer = CollisionLayer.PROJECTILE
+    # Projectiles sweep their own path against the CollisionWorld
+    queries_collision_world = True
+    # Even the slowest projectile crosses the arena well within this
+    time_to_live = 5
+
     damage: float
     speed: float
     angle_of_motion: float
+    launch_time: float = 0
+    "Seconds into the tick it was fired, used by the `ProjectileEngine` on its first tick"
+    engine_slot: Optional[int] = None
+    "Row of this projectile in the `ProjectileEngine`'s arrays, while launched"
+    time_of_impact: Optional[float] = None
+    """
+    When the projectile hits something, how far through its final tick of movement
+    the impact happened, from 0 to 1
+    """
 
     def __init__(
         self,
         sprite: LinkedSprite[Ordnance],
         sprite_lists: SpriteLists,
         damage: float,
-        muzzle_location: Tuple[float, float, float],
         speed: float,
-        angle_of_motion: float,
         sprite_rotation_offet: float = 0,
     ):
         super().__init__(sprite, sprite_lists)
         self.damage = damage
         self.speed = speed
-        self.angle_of_motion = angle_of_motion
+        self.angle_of_motion = 0
         self.sprite_rotation_offset = sprite_rotation_offet
+
+    def launch(
+        self,
+        muzzle_location: Tuple[float, float, float],
+        angle_of_motion: float,
+        launch_time: float = 0,
+    ):
+        """
+        Place the projectile at the muzzle and send it on its way.
+
+        `launch_time` is when it was fired, in seconds from the start of the
+        current tick.  It only travels for the rest of the tick.
+        """
+        self.angle_of_motion = angle_of_motion
+        self.launch_time = launch_time
         set_sprite_location(self.sprite, muzzle_location)
         self.sprite.radians += self.sprite_rotation_offset
         self.append_sprite()
 
-    def update(self, delta_time: float):
-        move_sprite_polar(self.sprite, self.speed * delta_time, self.angle_of_motion)
-        # check if the projectile left the screen
-        if not sprite_in_bounds(self.sprite):
-            self.remove_sprite()
+    def reset(self):
+        super().reset()
+        self.time_of_impact = None
+
+    @property
+    def sprite_list(self) -> arcade.SpriteList:
+        return self.sprite_lists.projectiles
+
+    def append_sprite(self):
+        super().append_sprite()
+        self.sprite_lists.projectile_engine.add(self)
+
+    def remove_sprite(self):
+        self.sprite_lists.projectile_engine.remove(self)
+        super().remove_sprite()
+
+    def sweep(self, travel_time: float, previous_position: Tuple[float, float]):
+        """
+        Called by the `ProjectileEngine` for projectiles that passed near a wall or
+        vehicle this tick.  `travel_time` is how long it moved for this tick.
+
+        Continuous collision detection.  Test the whole path travelled this tick,
+        not only the end position, so that fast projectiles cannot tunnel through
+        thin walls or the corners of vehicles.
+
+        On impact, moves the projectile to the point of impact and returns True.
+        """
+        direction = polar_to_cartesian(1, self.angle_of_motion)
+        # Sprite's position is its center; extend the sweep to reach its nose
+        sweep_distance = self.speed * travel_time + self.sprite.width / 2
+        hit = self.sprite_lists.collision_world.raycast(
+            previous_position,
+            direction,
+            sweep_distance,
+            self.collision_mask,
+            self.owner_sprite,
+            radius=min(self.sprite.width, self.sprite.height) / 2,
+            moving=True,
+        )
+        if hit is None:
+            return False
+        self.time_of_impact = hit.fraction
+        self.sprite.position = hit.point
+        contact = self.sprite_lists.collision_world.contacts.report(
+            self.sprite, hit.sprite
+        )
+        if contact.began:
+            self.on_collision_begin(hit.sprite)
+        if hit.layer == CollisionLayer.WALL:
+            self.on_collision_with_wall([hit.sprite])
+        else:
+            self.on_collision_with_vehicle(travel_time, [hit.sprite])
+        return True
 
     def on_collision_with_wall(self, walls_touching_projectile: arcade.SpriteList):
         self.remove_sprite()
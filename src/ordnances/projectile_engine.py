@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, List, Optional
+
+import numpy as np
+
+from collision_world import CollisionWorld
+from ordnances.ordnance_lifetimes import OrdnanceLifetimes
+
+# This allows a circular import only for the purposes of type hints
+if TYPE_CHECKING:
+    from ordnances.projectile import Projectile
+
+INITIAL_PROJECTILE_CAPACITY = 256
+"Projectile slots allocated up front.  Doubles whenever it runs out."
+
+
+class ProjectileEngine:
+    """
+    Moves every launched `Projectile` in one vectorized step.
+
+    Projectiles fly in a straight line at a constant speed, so their state is kept
+    as a structure of NumPy arrays, one row per projectile, instead of being
+    recomputed by each projectile every tick.
+
+    Each tick, the engine:
+
+    - integrates every position at once
+    - culls projectiles that left the arena with a mask
+    - culls projectiles nowhere near a wall or vehicle, using the wall distance
+      field and vehicle bounding circles
+    - runs the exact `Projectile.sweep` only for the few projectiles left
+    - copies positions back to sprites, for drawing
+    """
+
+    def __init__(
+        self,
+        collision_world: CollisionWorld,
+        lifetimes: OrdnanceLifetimes,
+        capacity: int = INITIAL_PROJECTILE_CAPACITY,
+    ):
+        self._collision_world = collision_world
+        self._lifetimes = lifetimes
+        self._projectiles: List[Optional[Projectile]] = [None] * capacity
+        self._active = np.zeros(capacity, dtype=bool)
+        self._positions = np.zeros((capacity, 2))
+        self._directions = np.zeros((capacity, 2))
+        "Unit vector of each projectile's direction of motion"
+        self._speeds = np.zeros(capacity)
+        self._half_lengths = np.zeros(capacity)
+        "Distance from center to nose, along the direction of motion"
+        self._radii = np.zeros(capacity)
+        self._launch_times = np.zeros(capacity)
+        "How far into the tick each new projectile was fired.  Zeroed after a tick."
+        self._owners = np.full(capacity, None, dtype=object)
+        "Sprite of the vehicle that fired each projectile, which it never hits"
+        self._free_slots = list(reversed(range(capacity)))
+
+    @property
+    def count(self) -> int:
+        return len(self._projectiles) - len(self._free_slots)
+
+    def add(self, projectile: Projectile):
+        """
+        Start moving a projectile, from its sprite's current position.
+        """
+        if len(self._free_slots) == 0:
+            self._grow()
+        slot = self._free_slots.pop()
+        projectile.engine_slot = slot
+        self._projectiles[slot] = projectile
+        self._active[slot] = True
+        sprite = projectile.sprite
+        self._positions[slot] = sprite.position
+        self._directions[slot] = (
+            math.cos(projectile.angle_of_motion),
+            math.sin(projectile.angle_of_motion),
+        )
+        self._speeds[slot] = projectile.speed
+        self._half_lengths[slot] = sprite.width / 2
+        self._radii[slot] = min(sprite.width, sprite.height) / 2
+        self._launch_times[slot] = projectile.launch_time
+        self._owners[slot] = projectile.owner_sprite
+
+    def remove(self, projectile: Projectile):
+        slot = projectile.engine_slot
+        if slot is None:
+            return
+        projectile.engine_slot = None
+        self._projectiles[slot] = None
+        self._active[slot] = False
+        self._owners[slot] = None
+        self._free_slots.append(slot)
+
+    def update(self, delta_time: float):
+        slots = np.flatnonzero(self._active)
+        if len(slots) == 0:
+            return
+        directions = self._directions[slots]
+        # Projectiles fired partway through the tick only travel for the rest of it
+        travel_times = np.maximum(delta_time - self._launch_times[slots], 0)
+        self._launch_times[slots] = 0
+        distances = self._speeds[slots] * travel_times
+        previous_positions = self._positions[slots]
+        positions = previous_positions + directions * distances[:, np.newaxis]
+        self._positions[slots] = positions
+
+        # Exactly sweep only projectiles that might reach something this tick
+        sweep_distances = distances + self._half_lengths[slots]
+        candidates = self._find_near_walls(
+            previous_positions, sweep_distances + self._radii[slots]
+        ) | self._find_near_vehicles(
+            slots, previous_positions, directions, sweep_distances
+        )
+        projectiles = self._projectiles
+        for index in np.flatnonzero(candidates).tolist():
+            projectile = projectiles[slots[index]]
+            projectile.sweep(
+                travel_times[index], tuple(previous_positions[index].tolist())
+            )
+
+        # Projectiles that hit something have already removed themselves
+        left, bottom, right, top = self._lifetimes.kill_bounds
+        out_of_bounds = (
+            (positions[:, 0] < left)
+            | (positions[:, 0] > right)
+            | (positions[:, 1] < bottom)
+            | (positions[:, 1] > top)
+        )
+        for slot in slots[out_of_bounds & self._active[slots]].tolist():
+            projectile = projectiles[slot]
+            projectile.discard_payload()
+            projectile.remove_sprite()
+
+        still_active = self._active[slots]
+        for slot, position in zip(
+            slots[still_active].tolist(), positions[still_active].tolist()
+        ):
+            projectiles[slot].sprite.position = (position[0], position[1])
+
+    def _find_near_walls(
+        self, positions: np.ndarray, reaches: np.ndarray
+    ) -> np.ndarray:
+        """
+        Mask of positions within `reaches` of a wall.
+        """
+        distance_field = self._collision_world.wall_distance_field
+        if distance_field is None:
+            return np.ones(len(positions), dtype=bool)
+        left, bottom, right, top = distance_field.get_bounds()
+        clamped = np.clip(positions, (left, bottom), (right, top))
+        # Interpolating between samples can overestimate by up to one cell diagonal,
+        # and clamping to the grid by the distance clamped
+        error = distance_field.cell_size * math.sqrt(2) + np.hypot(
+            *(positions - clamped).T
+        )
+        return distance_field.sample_many(clamped) - error < reaches
+
+    def _find_near_vehicles(
+        self,
+        slots: np.ndarray,
+        positions: np.ndarray,
+        directions: np.ndarray,
+        sweep_distances: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Mask of projectiles whose path this tick passes near a vehicle other than
+        their owner.
+        """
+        (
+            vehicles,
+            centers,
+            vehicle_radii,
+        ) = self._collision_world.get_vehicle_bounding_circles()
+        if len(vehicles) == 0:
+            return np.zeros(len(slots), dtype=bool)
+        # Closest point on each path to each vehicle center, shaped (N, V, 2)
+        offsets = centers[np.newaxis, :, :] - positions[:, np.newaxis, :]
+        along = np.einsum("nvk,nk->nv", offsets, directions)
+        along = np.clip(along, 0, sweep_distances[:, np.newaxis])
+        closest = offsets - along[:, :, np.newaxis] * directions[:, np.newaxis, :]
+        distances_squared = np.einsum("nvk,nvk->nv", closest, closest)
+        reaches = vehicle_radii[np.newaxis, :] + self._radii[slots, np.newaxis]
+        near = distances_squared < reaches * reaches
+        vehicle_array = np.empty(len(vehicles), dtype=object)
+        vehicle_array[:] = vehicles
+        near &= self._owners[slots, np.newaxis] != vehicle_array[np.newaxis, :]
+        return near.any(axis=1)
+
+    def _grow(self):
+        capacity = len(self._projectiles)
+        self._projectiles.extend([None] * capacity)
+        self._active = np.concatenate([self._active, np.zeros(capacity, dtype=bool)])
+        self._positions = np.concatenate([self._positions, np.zeros((capacity, 2))])
+        self._directions = np.concatenate([self._directions, np.zeros((capacity, 2))])
+        self._speeds = np.concatenate([self._speeds, np.zeros(capacity)])
+        self._half_lengths = np.concatenate([self._half_lengths, np.zeros(capacity)])
+        self._radii = np.concatenate([self._radii, np.zeros(capacity)])
+        self._launch_times = np.concatenate([self._launch_times, np.zeros(capacity)])
+        self._owners = np.concatenate(
+            [self._owners, np.full(capacity, None, dtype=object)]
+        )
+        self._free_slots.extend(reversed(range(capacity, capacity * 2)))
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import math
+from unittest import TestCase
+
+import arcade
+
+from arena.distance_field import bake_distance_field
+from linked_sprite import LinkedSpriteSolidColor
+from ordnances.ordnance import Ordnance
+from ordnances.projectile import Projectile
+from sprite_lists import SpriteLists
+
+
+class TestProjectileEngine(TestCase):
+    def setUp(self):
+        self.sprite_lists = SpriteLists()
+        self.wall = arcade.SpriteSolidColor(20, 200, arcade.color.BLACK)
+        self.wall.position = (300, 300)
+        self.sprite_lists.walls.append(self.wall)
+        self.sprite_lists.collision_world.bake_walls(
+            bake_distance_field([((300, 300, 0), (20, 200))], (0, 0, 800, 600))
+        )
+        self.sprite_lists.collision_world.update()
+        self.engine = self.sprite_lists.projectile_engine
+
+    def launch(self, x: float, y: float, radians: float, launch_time: float = 0):
+        projectile = Projectile(
+            LinkedSpriteSolidColor[Ordnance](8, 3, arcade.color.RED),
+            self.sprite_lists,
+            10,
+            600,
+        )
+        projectile.launch((x, y, radians), radians, launch_time)
+        return projectile
+
+    def test_moves_and_stops_at_walls(self):
+        toward_wall = self.launch(200, 300, 0)
+        away = self.launch(200, 200, math.pi)
+        self.assertEqual(self.engine.count, 2)
+
+        self.engine.update(0.1)
+        self.assertAlmostEqual(away.sprite.center_x, 140)
+        self.assertTrue(toward_wall.exists)
+        self.engine.update(0.1)
+        # Stopped at the face of the wall, even though it moved past it
+        self.assertFalse(toward_wall.exists)
+        self.assertAlmostEqual(toward_wall.sprite.center_x, 290 - 1.5)
+        self.assertEqual(self.engine.count, 1)
+
+    def test_culls_out_of_bounds(self):
+        projectiles = [self.launch(100, 100 + index, math.pi) for index in range(300)]
+        self.engine.update(0.1)
+        self.assertTrue(all(projectile.exists for projectile in projectiles))
+        self.engine.update(0.2)
+        self.assertFalse(any(projectile.exists for projectile in projectiles))
+        self.assertEqual(len(self.sprite_lists.projectiles), 0)
+        self.assertEqual(self.engine.count, 0)
+
+    def test_launched_partway_through_tick(self):
+        projectile = self.launch(300, 500, math.pi)
+        late = self.launch(300, 550, math.pi, 0.075)
+        self.engine.update(0.1)
+        self.assertAlmostEqual(late.sprite.center_x, 300 - 600 * 0.025)
+        self.engine.update(0.1)
+        self.assertAlmostEqual(late.sprite.center_x, 300 - 600 * 0.125)
+        self.assertAlmostEqual(projectile.sprite.center_x, 300 - 600 * 0.2)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import arcade
+
+from iron_math import move_sprite_polar
+from linked_sprite import LinkedSpriteSolidColor
+from ordnances.ordnance import Ordnance
+from sprite_lists import SpriteLists
+
+TRACER_DURATION = 0.08
+"Seconds a tracer stays on screen"
+TRACER_WIDTH = 2
+
+
+class Tracer(Ordnance):
+    """
+    A streak drawn along a hitscan ray for a moment after it is fired, from the
+    muzzle to whatever the ray hit, so that shots that hit instantly can be seen.
+
+    Purely visual: collides with nothing, and is removed by `OrdnanceLifetimes`.
+    """
+
+    time_to_live = TRACER_DURATION
+
+    def __init__(self, color: arcade.Color, sprite_lists: SpriteLists):
+        super().__init__(
+            LinkedSpriteSolidColor[Ordnance](1, TRACER_WIDTH, color), sprite_lists
+        )
+
+    def show(self, origin: Tuple[float, float, float], length: float):
+        """
+        Draw the tracer from `origin` (x, y, radians) for `length` along its angle.
+        """
+        # Arcade rescales the hit box relative to the previous width, so the
+        # tracer must never shrink all the way to zero
+        self.sprite.width = max(length, 1)
+        self.activate(origin)
+        move_sprite_polar(self.sprite, self.sprite.width / 2, origin[2])
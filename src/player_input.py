@@ -10,12 +10,33 @@ hardcoded gamepad IDs, etc.
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Optional, Tuple, Union
 
 import arcade
 from pyglet.input import Controller
 from pyglet.window.key import KeyStateHandler
 
+CONTROLS = (
+    "x_axis",
+    "y_axis",
+    "rx_axis",
+    "ry_axis",
+    "accelerate_axis",
+    "brake_axis",
+    "primary_fire_button",
+    "secondary_fire_button",
+    "swap_weapons_button",
+    "reload_button",
+    "debug_1",
+    "debug_2",
+    "debug_3",
+    "debug_4",
+)
+"Name of every control of a `PlayerInput`"
+
+InputSample = Tuple[Union[float, bool], ...]
+"Value of each control in `CONTROLS`, read from the input devices at one moment"
+
 
 class PlayerInput:
     def __init__(self, keys: KeyStateHandler, controller: Controller) -> None:
@@ -46,15 +67,23 @@ class PlayerInput:
         self.debug_3 = VirtualButton(keys, controller)
         self.debug_4 = VirtualButton(keys, controller)
 
-    def update(self):
-        self.primary_fire_button._update()
-        self.secondary_fire_button._update()
-        self.swap_weapons_button._update()
-        self.reload_button._update()
-        self.debug_1._update()
-        self.debug_2._update()
-        self.debug_3._update()
-        self.debug_4._update()
+    def sample(self) -> InputSample:
+        """
+        Read every control from the keyboard and controller.  Only the thread that
+        owns the window and controllers may call this.
+        """
+        return tuple(getattr(self, control)._get_value() for control in CONTROLS)
+
+    def update(self, sample: Optional[InputSample] = None):
+        """
+        Call once per tick, before gameplay reads any control.  Takes controls from
+        `sample`, if given, instead of reading the input devices, so that a tick
+        can run on a different thread than the one that owns them.
+        """
+        if sample is None:
+            sample = self.sample()
+        for control, value in zip(CONTROLS, sample):
+            getattr(self, control)._update(value)
 
 
 class VirtualAxis:
@@ -70,9 +99,14 @@ class VirtualAxis:
         self.button_positive: Optional[int] = None
         self.button_negative: Optional[int] = None
         self.axis: Optional[str] = None
+        self._value: float = 0
 
     @property
     def value(self) -> float:
+        "As of the last `PlayerInput.update`"
+        return self._value
+
+    def _get_value(self) -> float:
         neg_pressed = (
             self.key_negative is not None and self._keys[self.key_negative]
         ) or (
@@ -102,6 +136,9 @@ class VirtualAxis:
         # Combine keyboard/button/stick values, and clamp
         return min(max(axis_value_from_analog + axis_value_from_buttons, -1), 1)
 
+    def _update(self, value: Optional[float] = None):
+        self._value = self._get_value() if value is None else value
+
 
 class VirtualButton:
     def __init__(self, keys: KeyStateHandler, controller: Controller):
@@ -148,9 +185,11 @@ class VirtualButton:
         )
         return key_pressed or button_pressed
 
-    def _update(self):
+    def _update(self, value: Optional[bool] = None):
         value_last_frame = self._value_last_frame = self._value
-        value_this_frame = self._value = self._get_value()
+        if value is None:
+            value = self._get_value()
+        value_this_frame = self._value = value
         self._pressed = False
         self._released = False
         if value_this_frame and not value_last_frame:
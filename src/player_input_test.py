@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+from arcade import key
+from pyglet.window.key import KeyStateHandler
+
+from player_input import CONTROLS, PlayerInput, bind_to_keyboard
+
+
+class TestPlayerInput(TestCase):
+    def setUp(self):
+        self.keys = KeyStateHandler()
+        self.device_input = PlayerInput(self.keys, None)
+        bind_to_keyboard(self.device_input)
+
+    def test_updates_from_devices(self):
+        self.keys.on_key_press(key.W, 0)
+        self.keys.on_key_press(key.SPACE, 0)
+        # Nothing is read from the devices until the update
+        self.assertEqual(self.device_input.accelerate_axis.value, 0)
+        self.device_input.update()
+        self.assertEqual(self.device_input.accelerate_axis.value, 1)
+        self.assertTrue(self.device_input.primary_fire_button.pressed)
+
+        self.keys.on_key_release(key.W, 0)
+        self.assertEqual(self.device_input.accelerate_axis.value, 1)
+        self.device_input.update()
+        self.assertEqual(self.device_input.accelerate_axis.value, 0)
+
+    def test_updates_from_samples(self):
+        # As if the devices were only readable from another thread
+        sampled_input = PlayerInput(KeyStateHandler(), None)
+        self.keys.on_key_press(key.A, 0)
+        self.keys.on_key_press(key.SPACE, 0)
+        sample = self.device_input.sample()
+        self.assertEqual(len(sample), len(CONTROLS))
+
+        sampled_input.update(sample)
+        self.assertEqual(sampled_input.x_axis.value, -1)
+        self.assertTrue(sampled_input.primary_fire_button.value)
+        self.assertTrue(sampled_input.primary_fire_button.pressed)
+
+        # The same sample again, as when ticks outpace frames
+        sampled_input.update(sample)
+        self.assertTrue(sampled_input.primary_fire_button.value)
+        self.assertFalse(sampled_input.primary_fire_button.pressed)
+
+        self.keys.on_key_release(key.SPACE, 0)
+        sampled_input.update(self.device_input.sample())
+        self.assertTrue(sampled_input.primary_fire_button.released)
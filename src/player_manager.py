@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional, Sequence
 
 import arcade
 from pyglet.input import ControllerManager
@@ -15,7 +15,12 @@ from constants import (
 )
 from iron_math import set_sprite_location
 from player import Player
-from player_input import PlayerInput, bind_to_keyboard, set_controller_layout
+from player_input import (
+    InputSample,
+    PlayerInput,
+    bind_to_keyboard,
+    set_controller_layout,
+)
 from sprite_lists import SpriteLists
 
 
@@ -47,15 +52,22 @@ class PlayerManager:
         self,
         sprite_lists: SpriteLists,
         arena: Arena,
+        use_controllers: bool = True,
     ):
+        """
+        `use_controllers` false skips looking for controllers, for running without
+        input devices.
+        """
         if self._did_setup:
             raise Exception("Already setup; cannot setup twice")
         self._did_setup = True
 
-        _controller_manager = ControllerManager()
-        controllers = _controller_manager.get_controllers()
-        if not controllers:
-            controllers = []
+        controllers = []
+        if use_controllers:
+            _controller_manager = ControllerManager()
+            controllers = _controller_manager.get_controllers()
+            if not controllers:
+                controllers = []
 
         for player_index in range(0, 4):
             controller = None
@@ -81,13 +93,23 @@ class PlayerManager:
             )
             self.players.append(player)
 
-    def update_inputs(self):
+    def sample_inputs(self) -> List[InputSample]:
+        """
+        Read every player's controls from the input devices, to be passed to
+        `update_inputs` on another thread.
+        """
+        return [player.input.sample() for player in self.players]
+
+    def update_inputs(self, samples: Optional[Sequence[InputSample]] = None):
         """
         Must be called at the *start* of every frame, before calling other
         gameplay logic.  Does internal input-handling bookkeeping.
+
+        Uses `samples` from `sample_inputs`, if given, instead of reading the input
+        devices.
         """
-        for player in self.players:
-            player.input.update()
+        for index, player in enumerate(self.players):
+            player.input.update(None if samples is None else samples[index])
             if player.input.debug_2.pressed or player.input.debug_2.released:
                 # xor
                 alternate = (
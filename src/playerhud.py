@@ -3,6 +3,7 @@ from __future__ import annotations
 import arcade
 
 from player import Player
+from texture_cache import get_solid_color_texture
 from textures import RESPAWN_COUNTDOWN
 
 
@@ -32,9 +33,11 @@ class PlayerHud:
         self.player_respawn_countdown_sprite.center_x = hud_x + respawn_counter_x_offset
         self.player_respawn_countdown_sprite.center_y = hud_y - below_health_bar_offset
 
-        self.background_sprite = arcade.SpriteSolidColor(
-            self.width, self.height, self.background_color
+        self.background_sprite = arcade.Sprite(
+            texture=get_solid_color_texture(self.background_color)
         )
+        self.background_sprite.width = self.width
+        self.background_sprite.height = self.height
         self.background_sprite.center_x = hud_x
         self.background_sprite.center_y = hud_y
 
@@ -42,9 +45,11 @@ class PlayerHud:
         self.player_hud_avatar.center_x = hud_x
         self.player_hud_avatar.center_y = hud_y - below_health_bar_offset
 
-        self.health_sprite = arcade.SpriteSolidColor(
-            self.width, self.height, self.full_color
+        self.health_sprite = arcade.Sprite(
+            texture=get_solid_color_texture(self.full_color)
         )
+        self.health_sprite.width = self.width
+        self.health_sprite.height = self.height
         self.health_sprite.center_x = hud_x
         self.health_sprite.center_y = hud_y
 
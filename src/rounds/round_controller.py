@@ -3,7 +3,7 @@ from __future__ import annotations
 import math
 from enum import Enum
 from math import radians
-from typing import TYPE_CHECKING, Generator, cast
+from typing import TYPE_CHECKING, Generator, Optional, cast
 
 from arcade import Text
 
@@ -66,22 +66,9 @@ class RoundController:
         self._arena = arena
         self._sprite_lists = sprite_lists
 
-        hud_rotation_deg = 0
-        # Arcade has pesky requirements about the x/y of a Text element
-        (hud_x, hud_y) = add_vec(
-            (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2),
-            polar_to_cartesian(-SCREEN_WIDTH / 2, radians(hud_rotation_deg)),
-        )
-        self._hud = Text(
-            "",
-            hud_x,
-            hud_y,
-            width=SCREEN_WIDTH,
-            font_size=32,
-            align="center",
-            rotation=hud_rotation_deg,
-            bold=True,
-        )
+        self._hud_text = ""
+        self._hud: Optional[Text] = None
+        "Created on first draw, so that rounds can be played without a window"
 
         self._state = State.INIT
 
@@ -92,7 +79,7 @@ class RoundController:
 
         if self._state == State.INIT:
             self._countdown_time = COUNTDOWN_SECONDS
-            self._hud.text = ""
+            self._hud_text = ""
 
             # Init for new round and reset from the previous round
             for player in self._players:
@@ -109,12 +96,12 @@ class RoundController:
 
             if self._countdown_time > 0:
                 display_countdown_number = math.ceil(self._countdown_time)
-                self._hud.text = display_countdown_number
+                self._hud_text = str(display_countdown_number)
 
             else:
                 # Timer reached zero
                 # Start the game
-                self._hud.text = "GO"
+                self._hud_text = "GO"
                 for player in self._players:
                     player.controls_active = True
                 self.game_mode.on_round_start()
@@ -129,13 +116,13 @@ class RoundController:
             if self._countdown_time > -GO_DISPLAY_DURATION:
                 self._countdown_time -= delta_time
                 if self._countdown_time <= -GO_DISPLAY_DURATION:
-                    self._hud.text = ""
+                    self._hud_text = ""
 
             winner = self.game_mode.get_winner()
             if winner:
                 # We have a winner
                 # Display a banner and give them time for a victory lap
-                self._hud.text = f"Player {winner.player_index + 1} Wins!"
+                self._hud_text = f"Player {winner.player_index + 1} Wins!"
                 self._victory_lap_countdown = VICTORY_LAP_DURATION
 
                 self._state = State.VICTORY_LAP
@@ -150,5 +137,38 @@ class RoundController:
 
         self.game_mode.update(delta_time)
 
-    def draw(self):
+    @property
+    def hud_text(self) -> str:
+        "Banner shown over the arena, such as the countdown or the winner"
+        return self._hud_text
+
+    def draw(self, hud_text: Optional[str] = None):
+        """
+        Draw `hud_text`, such as one captured in a `WorldSnapshot`, or else the
+        current banner.
+        """
+        if hud_text is None:
+            hud_text = self._hud_text
+        if self._hud is None:
+            self._hud = self._create_hud()
+        if self._hud.text != hud_text:
+            self._hud.text = hud_text
         self._hud.draw()
+
+    def _create_hud(self) -> Text:
+        hud_rotation_deg = 0
+        # Arcade has pesky requirements about the x/y of a Text element
+        (hud_x, hud_y) = add_vec(
+            (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2),
+            polar_to_cartesian(-SCREEN_WIDTH / 2, radians(hud_rotation_deg)),
+        )
+        return Text(
+            "",
+            hud_x,
+            hud_y,
+            width=SCREEN_WIDTH,
+            font_size=32,
+            align="center",
+            rotation=hud_rotation_deg,
+            bold=True,
+        )
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, List, Optional
+
+from fixed_timestep import FixedTimestep
+from player_input import InputSample
+from world_snapshot import SnapshotBuffer, WorldSnapshot
+
+
+class InputHandoff:
+    """
+    Hands input sampled on the main thread, which owns the window and controllers,
+    to the simulation thread.
+
+    Only the latest samples are kept.  Every tick reuses them until newer ones are
+    published, so a button pressed in one frame is only pressed on the first tick.
+    """
+
+    def __init__(self):
+        self._samples: Optional[List[InputSample]] = None
+        self._lock = threading.Lock()
+
+    def publish(self, samples: List[InputSample]):
+        with self._lock:
+            self._samples = samples
+
+    def latest(self) -> Optional[List[InputSample]]:
+        """
+        Every player's latest `InputSample`, or `None` until any are published.
+        """
+        with self._lock:
+            return self._samples
+
+
+class SimulationThread:
+    """
+    Runs the simulation on its own thread, in fixed ticks against the wall clock,
+    publishing a snapshot of the world to `snapshots` after each batch of ticks.
+
+    Drawing then never waits on a slow tick: it draws the latest snapshot instead.
+    Nothing else may touch the simulated world while this is running.  Input goes
+    the other way, through an `InputHandoff`.
+
+    Errors raised by a tick stop the thread, and are raised again on the main thread
+    by `check`.
+    """
+
+    snapshots: SnapshotBuffer
+    ticks: int
+    "Ticks simulated so far"
+    error: Optional[BaseException]
+    "Raised by a tick, stopping the thread"
+
+    def __init__(
+        self,
+        update: Callable[[float], None],
+        capture: Callable[[int], WorldSnapshot],
+        fixed_timestep: FixedTimestep,
+        snapshots: Optional[SnapshotBuffer] = None,
+    ):
+        self._update = update
+        self._capture = capture
+        self._fixed_timestep = fixed_timestep
+        self.snapshots = snapshots or SnapshotBuffer()
+        self.ticks = 0
+        self.error = None
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="simulation", daemon=True
+        )
+
+    def start(self):
+        # Drawing has something to show before the first tick finishes
+        self.snapshots.publish(self._capture(self.ticks))
+        self._thread.start()
+
+    def stop(self):
+        self._stopping.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def check(self):
+        """
+        Raise any error that stopped the simulation.
+        """
+        if self.error is not None:
+            raise self.error
+
+    def _run(self):
+        fixed_timestep = self._fixed_timestep
+        tick_duration = fixed_timestep.tick_duration
+        last_time = time.perf_counter()
+        try:
+            while not self._stopping.is_set():
+                now = time.perf_counter()
+                ticks = fixed_timestep.advance(now - last_time)
+                last_time = now
+                for _ in range(ticks):
+                    self._update(tick_duration)
+                self.ticks += ticks
+                if ticks:
+                    self.snapshots.publish(self._capture(self.ticks))
+                # Sleep until the next tick is owed
+                self._stopping.wait(tick_duration - fixed_timestep.accumulated_time)
+        except BaseException as error:
+            self.error = error
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import time
+from unittest import TestCase
+
+from fixed_timestep import FixedTimestep
+from simulation_thread import InputHandoff, SimulationThread
+from world_snapshot import WorldSnapshot
+
+
+class TestSimulationThread(TestCase):
+    def capture(self, tick: int) -> WorldSnapshot:
+        return WorldSnapshot(tick, time.perf_counter(), ())
+
+    def test_ticks_and_publishes_snapshots(self):
+        delta_times = []
+        thread = SimulationThread(
+            delta_times.append, self.capture, FixedTimestep(0.001, 4)
+        )
+        thread.start()
+        time.sleep(0.05)
+        thread.stop()
+
+        thread.check()
+        self.assertGreater(thread.ticks, 0)
+        self.assertEqual(len(delta_times), thread.ticks)
+        self.assertTrue(all(delta_time == 0.001 for delta_time in delta_times))
+        _, latest = thread.snapshots.latest()
+        self.assertEqual(latest.tick, thread.ticks)
+
+    def test_raises_tick_errors_on_check(self):
+        def update(delta_time: float):
+            raise ValueError("tick failed")
+
+        thread = SimulationThread(update, self.capture, FixedTimestep(0.001, 4))
+        thread.start()
+        time.sleep(0.05)
+        with self.assertRaises(ValueError):
+            thread.check()
+        thread.stop()
+
+
+class TestInputHandoff(TestCase):
+    def test_keeps_latest_samples(self):
+        handoff = InputHandoff()
+        self.assertIsNone(handoff.latest())
+        handoff.publish([(0.5, True)])
+        handoff.publish([(1.0, False)])
+        self.assertEqual(handoff.latest(), [(1.0, False)])
+        # Reused until replaced
+        self.assertEqual(handoff.latest(), [(1.0, False)])
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+import arcade
+
+from sprite_interpolation import blend_transforms
+from world_snapshot import WorldSnapshot
+
+
+class SnapshotRenderer:
+    """
+    Draws `WorldSnapshot`s using sprites of its own, so that simulated sprites are
+    never read while another thread changes them.
+
+    Sprites are drawn partway between the last two snapshots, like
+    `SpriteInterpolation` does between ticks.
+    """
+
+    def __init__(self, layer_count: int):
+        self._layers = [arcade.SpriteList() for _ in range(layer_count)]
+        self._proxies: List[Dict[arcade.Sprite, arcade.Sprite]] = [
+            {} for _ in range(layer_count)
+        ]
+        "Drawn sprite for each simulated sprite, per layer"
+
+    def update(
+        self,
+        previous: Optional[WorldSnapshot],
+        latest: WorldSnapshot,
+        blend: float,
+    ):
+        """
+        Match drawn sprites to `latest`, moved `blend` of the way there from
+        `previous`, from 0 to 1.
+        """
+        for index, states in enumerate(latest.layers):
+            sprite_list = self._layers[index]
+            proxies = self._proxies[index]
+            previous_states = (
+                {state.sprite: state for state in previous.layers[index]}
+                if previous is not None
+                else {}
+            )
+            for state in states:
+                proxy = proxies.get(state.sprite)
+                if proxy is None:
+                    proxy = arcade.Sprite(texture=state.texture)
+                    proxies[state.sprite] = proxy
+                    sprite_list.append(proxy)
+                else:
+                    proxy.texture = state.texture
+                x, y, angle = state.center_x, state.center_y, state.angle
+                previous_state = previous_states.get(state.sprite)
+                if previous_state is not None:
+                    x, y, angle = blend_transforms(
+                        (
+                            previous_state.center_x,
+                            previous_state.center_y,
+                            previous_state.angle,
+                        ),
+                        (x, y, angle),
+                        blend,
+                    )
+                proxy.position = (x, y)
+                proxy.angle = angle
+                proxy.width = state.width
+                proxy.height = state.height
+                proxy.color = state.color
+                proxy.alpha = state.alpha
+            if len(proxies) > len(states):
+                for sprite in proxies.keys() - {state.sprite for state in states}:
+                    sprite_list.remove(proxies.pop(sprite))
+
+    def draw(self):
+        for sprite_list in self._layers:
+            sprite_list.draw()
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+import arcade
+
+from snapshot_renderer import SnapshotRenderer
+from world_snapshot import capture_snapshot
+
+
+class TestSnapshotRenderer(TestCase):
+    def setUp(self):
+        self.sprites = arcade.SpriteList()
+        self.sprite = arcade.SpriteSolidColor(10, 10, arcade.color.RED)
+        self.sprites.append(self.sprite)
+        self.renderer = SnapshotRenderer(1)
+
+    def drawn_sprites(self):
+        return list(self.renderer._layers[0])
+
+    def test_draws_between_snapshots(self):
+        self.sprite.position = (0, 0)
+        previous = capture_snapshot(0, [self.sprites])
+        self.sprite.position = (10, 20)
+        self.sprite.alpha = 100
+        latest = capture_snapshot(1, [self.sprites])
+
+        self.renderer.update(previous, latest, 0.25)
+        (drawn,) = self.drawn_sprites()
+        self.assertIsNot(drawn, self.sprite)
+        self.assertEqual(drawn.position, (2.5, 5))
+        self.assertEqual(drawn.alpha, 100)
+
+    def test_follows_sprites_added_and_removed(self):
+        self.renderer.update(None, capture_snapshot(0, [self.sprites]), 0)
+        (first,) = self.drawn_sprites()
+
+        other = arcade.SpriteSolidColor(4, 4, arcade.color.BLUE)
+        self.sprites.append(other)
+        self.renderer.update(None, capture_snapshot(1, [self.sprites]), 0)
+        self.assertEqual(len(self.drawn_sprites()), 2)
+        self.assertIn(first, self.drawn_sprites())
+
+        self.sprites.remove(self.sprite)
+        self.renderer.update(None, capture_snapshot(2, [self.sprites]), 0)
+        (drawn,) = self.drawn_sprites()
+        self.assertIsNot(drawn, first)
+        self.assertEqual((drawn.width, drawn.height), (4, 4))
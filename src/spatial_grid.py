@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import arcade
+
+DEFAULT_CELL_SIZE = 64
+"Width and height of a single grid cell, measured in pixels"
+
+
+def get_sprite_bounds(sprite: arcade.Sprite):
+    """
+    Return the axis-aligned bounding box of a sprite's hit box, accounting for
+    position, rotation, and scale.
+
+    Returns (left, bottom, right, top)
+    """
+    points = sprite.get_adjusted_hit_box()
+    left = right = points[0][0]
+    bottom = top = points[0][1]
+    for x, y in points:
+        if x < left:
+            left = x
+        elif x > right:
+            right = x
+        if y < bottom:
+            bottom = y
+        elif y > top:
+            top = y
+    return (left, bottom, right, top)
+
+
+class SpatialGrid:
+    """
+    Uniform grid broadphase.
+
+    Each sprite is binned into every cell overlapped by its bounding box.  Collision
+    checks ask the grid for candidates, and only run precise polygon checks against
+    sprites that share a cell.
+
+    Static sprites, such as walls, can be inserted once.  Dynamic sprites, such as
+    vehicles, should be rebuilt every tick.
+    """
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[arcade.Sprite]] = {}
+        self._occupied_bounds: Optional[Tuple[int, int, int, int]] = None
+
+    @property
+    def occupied_bounds(self):
+        """
+        Range of cells containing at least one sprite, or `None` if the grid is empty.
+
+        Returns (min_cell_x, min_cell_y, max_cell_x, max_cell_y)
+        """
+        return self._occupied_bounds
+
+    def clear(self):
+        self._cells.clear()
+        self._occupied_bounds = None
+
+    def insert(self, sprite: arcade.Sprite):
+        cells = self._cells
+        bounds = get_sprite_bounds(sprite)
+        self._grow_occupied_bounds(bounds)
+        for cell in self._cells_overlapping(*bounds):
+            bucket = cells.get(cell)
+            if bucket is None:
+                cells[cell] = [sprite]
+            else:
+                bucket.append(sprite)
+
+    def insert_all(self, sprites: Iterable[arcade.Sprite]):
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def rebuild(self, sprites: Iterable[arcade.Sprite]):
+        """
+        Discard all binned sprites and bin the given sprites.  Call once per tick
+        for sprites that move.
+        """
+        self.clear()
+        self.insert_all(sprites)
+
+    def query_bounds(
+        self, left: float, bottom: float, right: float, top: float
+    ) -> List[arcade.Sprite]:
+        """
+        Return every sprite sharing a cell with the given bounding box, without
+        duplicates.  Returned sprites are candidates; they might not actually touch
+        the bounding box.
+        """
+        cells = self._cells
+        # dict preserves insertion order and dedupes sprites spanning multiple cells
+        candidates: Dict[arcade.Sprite, None] = {}
+        for cell in self._cells_overlapping(left, bottom, right, top):
+            bucket = cells.get(cell)
+            if bucket is not None:
+                for sprite in bucket:
+                    candidates[sprite] = None
+        return list(candidates)
+
+    def query(self, sprite: arcade.Sprite) -> List[arcade.Sprite]:
+        """
+        Return every sprite sharing a cell with `sprite`.
+        """
+        return self.query_bounds(*get_sprite_bounds(sprite))
+
+    def get_cell(self, cell: Tuple[int, int]) -> Sequence[arcade.Sprite]:
+        """
+        Sprites binned into a single cell.
+        """
+        return self._cells.get(cell, ())
+
+    def get_cell_containing(self, point: Tuple[float, float]):
+        cell_size = self.cell_size
+        return (math.floor(point[0] / cell_size), math.floor(point[1] / cell_size))
+
+    def cells_in_ring(self, center: Tuple[int, int], radius: int):
+        """
+        Yield the cells forming a square ring `radius` cells away from `center`.
+        Radius 0 is the center cell itself.
+        """
+        cx, cy = center
+        if radius == 0:
+            yield center
+            return
+        for x in range(cx - radius, cx + radius + 1):
+            yield (x, cy - radius)
+            yield (x, cy + radius)
+        for y in range(cy - radius + 1, cy + radius):
+            yield (cx - radius, y)
+            yield (cx + radius, y)
+
+    def cells_along_segment(self, start: Tuple[float, float], end: Tuple[float, float]):
+        """
+        Walk the cells crossed by a line segment, in order from `start` to `end`.
+
+        Yields (fraction, cell) where fraction is how far along the segment, from 0
+        to 1, the segment enters that cell.
+        """
+        cell_size = self.cell_size
+        cell_x, cell_y = self.get_cell_containing(start)
+        end_x, end_y = self.get_cell_containing(end)
+        delta_x = end[0] - start[0]
+        delta_y = end[1] - start[1]
+        # Amanatides & Woo voxel traversal
+        step_x = 1 if delta_x > 0 else -1
+        step_y = 1 if delta_y > 0 else -1
+        if delta_x != 0:
+            next_boundary_x = (cell_x + (1 if delta_x > 0 else 0)) * cell_size
+            t_max_x = (next_boundary_x - start[0]) / delta_x
+            t_delta_x = cell_size / abs(delta_x)
+        else:
+            t_max_x = t_delta_x = math.inf
+        if delta_y != 0:
+            next_boundary_y = (cell_y + (1 if delta_y > 0 else 0)) * cell_size
+            t_max_y = (next_boundary_y - start[1]) / delta_y
+            t_delta_y = cell_size / abs(delta_y)
+        else:
+            t_max_y = t_delta_y = math.inf
+
+        yield (0.0, (cell_x, cell_y))
+        while cell_x != end_x or cell_y != end_y:
+            if t_max_x < t_max_y:
+                fraction = t_max_x
+                cell_x += step_x
+                t_max_x += t_delta_x
+            else:
+                fraction = t_max_y
+                cell_y += step_y
+                t_max_y += t_delta_y
+            if fraction > 1:
+                # Guard against floating point error overshooting the end cell
+                return
+            yield (fraction, (cell_x, cell_y))
+
+    def _grow_occupied_bounds(self, bounds: Tuple[float, float, float, float]):
+        min_x, min_y = self.get_cell_containing(bounds[:2])
+        max_x, max_y = self.get_cell_containing(bounds[2:])
+        if self._occupied_bounds is not None:
+            old_min_x, old_min_y, old_max_x, old_max_y = self._occupied_bounds
+            min_x = min(min_x, old_min_x)
+            min_y = min(min_y, old_min_y)
+            max_x = max(max_x, old_max_x)
+            max_y = max(max_y, old_max_y)
+        self._occupied_bounds = (min_x, min_y, max_x, max_y)
+
+    def _cells_overlapping(self, left: float, bottom: float, right: float, top: float):
+        cell_size = self.cell_size
+        min_x = math.floor(left / cell_size)
+        max_x = math.floor(right / cell_size)
+        min_y = math.floor(bottom / cell_size)
+        max_y = math.floor(top / cell_size)
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                yield (cell_x, cell_y)
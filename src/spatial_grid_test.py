@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+import arcade
+
+from spatial_grid import SpatialGrid
+
+
+class TestSpatialGrid(TestCase):
+    def test_query_returns_only_nearby_sprites(self):
+        near = arcade.SpriteSolidColor(10, 10, arcade.color.BLACK)
+        near.position = (20, 20)
+        far = arcade.SpriteSolidColor(10, 10, arcade.color.BLACK)
+        far.position = (500, 500)
+        grid = SpatialGrid(64)
+        grid.insert_all([near, far])
+
+        self.assertEqual(grid.query_bounds(0, 0, 30, 30), [near])
+        self.assertEqual(grid.query_bounds(200, 200, 210, 210), [])
+
+    def test_sprite_spanning_cells_is_returned_once(self):
+        long_wall = arcade.SpriteSolidColor(400, 10, arcade.color.BLACK)
+        long_wall.position = (200, 5)
+        grid = SpatialGrid(64)
+        grid.insert(long_wall)
+
+        self.assertEqual(grid.query_bounds(0, 0, 400, 10), [long_wall])
+
+        grid.rebuild([])
+        self.assertEqual(grid.query_bounds(0, 0, 400, 10), [])
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import Dict, List, Sequence, Tuple
+
+import arcade
+
+SNAP_DISTANCE = 100
+"""
+Sprites that moved farther than this in one tick, such as vehicles respawning, are
+drawn where they are instead of sliding across the screen.
+"""
+
+Transform = Tuple[float, float, float]
+"(center_x, center_y, angle in degrees)"
+
+
+def blend_transforms(
+    previous: Transform, current: Transform, blend: float
+) -> Transform:
+    """
+    The transform `blend` of the way from `previous` to `current`, from 0 to 1,
+    turning the short way around.  Sprites that moved farther than `SNAP_DISTANCE`
+    stay at `current`.
+    """
+    x, y, angle = previous
+    delta_x = current[0] - x
+    delta_y = current[1] - y
+    if delta_x * delta_x + delta_y * delta_y > SNAP_DISTANCE**2:
+        return current
+    delta_angle = (current[2] - angle + 180) % 360 - 180
+    return (x + delta_x * blend, y + delta_y * blend, angle + delta_angle * blend)
+
+
+class SpriteInterpolation:
+    """
+    Draws sprites partway between their transforms from the last two simulation
+    ticks, so that motion looks smooth when frames and ticks don't line up.
+
+    Call `save_previous` before the last tick of a frame, then wrap drawing in
+    `apply` and `restore`.  Sprites that did not exist before that tick are drawn
+    where they are.
+    """
+
+    def __init__(self, sprite_lists: Sequence[arcade.SpriteList]):
+        self._sprite_lists = sprite_lists
+        self._previous: Dict[arcade.Sprite, Transform] = {}
+        self._current: List[Tuple[arcade.Sprite, Transform]] = []
+
+    def save_previous(self):
+        self._previous = {
+            sprite: (sprite.center_x, sprite.center_y, sprite.angle)
+            for sprite_list in self._sprite_lists
+            for sprite in sprite_list
+        }
+
+    def apply(self, blend: float):
+        """
+        Move sprites `blend` of the way from their previous transform to their
+        current one, from 0 to 1.  Call `restore` after drawing.
+        """
+        previous = self._previous
+        current = self._current
+        for sprite_list in self._sprite_lists:
+            for sprite in sprite_list:
+                previous_transform = previous.get(sprite)
+                if previous_transform is None:
+                    continue
+                transform = (sprite.center_x, sprite.center_y, sprite.angle)
+                if transform == previous_transform:
+                    continue
+                x, y, angle = blend_transforms(previous_transform, transform, blend)
+                current.append((sprite, transform))
+                sprite.position = (x, y)
+                sprite.angle = angle
+
+    def restore(self):
+        """
+        Put sprites back where the simulation left them.
+        """
+        for sprite, (x, y, angle) in self._current:
+            sprite.position = (x, y)
+            sprite.angle = angle
+        self._current.clear()
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+import arcade
+
+from sprite_interpolation import SpriteInterpolation
+
+
+class TestSpriteInterpolation(TestCase):
+    def setUp(self):
+        self.sprites = arcade.SpriteList()
+        self.sprite = arcade.SpriteSolidColor(10, 10, arcade.color.RED)
+        self.sprites.append(self.sprite)
+        self.interpolation = SpriteInterpolation([self.sprites])
+
+    def test_draws_between_ticks(self):
+        self.sprite.position = (0, 0)
+        self.sprite.angle = 350
+        self.interpolation.save_previous()
+        self.sprite.position = (10, 20)
+        self.sprite.angle = 10
+
+        self.interpolation.apply(0.25)
+        self.assertEqual(self.sprite.position, (2.5, 5))
+        self.assertAlmostEqual(self.sprite.angle, 355)
+        self.interpolation.restore()
+        self.assertEqual(self.sprite.position, (10, 20))
+        self.assertEqual(self.sprite.angle, 10)
+
+    def test_snaps_new_and_teleported_sprites(self):
+        new_sprite = arcade.SpriteSolidColor(10, 10, arcade.color.RED)
+        self.interpolation.save_previous()
+        self.sprites.append(new_sprite)
+        new_sprite.position = (50, 50)
+        self.sprite.position = (500, 500)
+
+        self.interpolation.apply(0.5)
+        self.assertEqual(new_sprite.position, (50, 50))
+        self.assertEqual(self.sprite.position, (500, 500))
+        self.interpolation.restore()
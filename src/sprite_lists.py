@@ -2,6 +2,13 @@ from __future__ import annotations
 
 import arcade
 
+from collision_world import CollisionWorld
+from constants import TICK_BUDGET
+from frame_budget import FrameBudgetGovernor
+from ordnances.ordnance_lifetimes import OrdnanceLifetimes
+from ordnances.ordnance_pool import OrdnancePools
+from ordnances.projectile_engine import ProjectileEngine
+
 
 class SpriteLists:
     """
@@ -11,19 +18,44 @@ class SpriteLists:
     vehicles: arcade.SpriteList
     vehicle_attachments: arcade.SpriteList
     ordnance: arcade.SpriteList
+    projectiles: arcade.SpriteList
+    "Projectiles, which are moved by `projectile_engine` instead of updated one by one"
     walls: arcade.SpriteList
     huds: arcade.SpriteList
+    collision_world: CollisionWorld
+    "Spatial index of walls and vehicles, for collision queries"
+    ordnance_pools: OrdnancePools
+    "Recycled ordnance, shared by every weapon"
+    ordnance_lifetimes: OrdnanceLifetimes
+    "Removes ordnance that expired or left the arena, and enforces the ordnance budget"
+    projectile_engine: ProjectileEngine
+    "Moves every projectile at once"
+    frame_budget: FrameBudgetGovernor
+    "Lowers cosmetic quality while ticks run over budget"
 
-    def __init__(self):
-        self.vehicles = arcade.SpriteList()
-        self.vehicle_attachments = arcade.SpriteList()
-        self.ordnance = arcade.SpriteList()
-        self.walls = arcade.SpriteList()
-        self.huds = arcade.SpriteList()
+    def __init__(self, lazy: bool = False):
+        """
+        `lazy` sprite lists don't touch the GPU until first drawn, so that they can
+        be changed off the main thread as long as they are never drawn.
+        """
+        self.vehicles = arcade.SpriteList(lazy=lazy)
+        self.vehicle_attachments = arcade.SpriteList(lazy=lazy)
+        self.ordnance = arcade.SpriteList(lazy=lazy)
+        self.projectiles = arcade.SpriteList(lazy=lazy)
+        self.walls = arcade.SpriteList(lazy=lazy)
+        self.huds = arcade.SpriteList(lazy=lazy)
+        self.collision_world = CollisionWorld(self.walls, self.vehicles)
+        self.ordnance_pools = OrdnancePools()
+        self.ordnance_lifetimes = OrdnanceLifetimes()
+        self.projectile_engine = ProjectileEngine(
+            self.collision_world, self.ordnance_lifetimes
+        )
+        self.frame_budget = FrameBudgetGovernor(TICK_BUDGET)
 
     def draw(self):
         self.walls.draw()
         self.vehicles.draw()
         self.vehicle_attachments.draw()
         self.ordnance.draw()
+        self.projectiles.draw()
         self.huds.draw()
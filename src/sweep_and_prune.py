@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple
+
+import arcade
+
+from spatial_grid import get_sprite_bounds
+
+
+class SweepAndPrune:
+    """
+    Broadphase which finds every pair of sprites whose bounding boxes overlap.
+
+    Sprites are kept sorted by the left edge of their bounding box.  Sweeping that
+    list left to right, a sprite can only overlap the sprites whose right edge has
+    not yet been passed.
+
+    Sprites barely move between ticks, so the order from the previous tick is
+    almost sorted already, and re-sorting it with an insertion sort is close to
+    linear.  Cost grows with the number of sprites plus the number of nearby pairs,
+    rather than the square of the number of sprites.
+    """
+
+    def __init__(self):
+        self._order: List[arcade.Sprite] = []
+
+    def find_pairs(
+        self, sprites: Iterable[arcade.Sprite]
+    ) -> List[Tuple[arcade.Sprite, arcade.Sprite]]:
+        """
+        Return every pair of sprites whose bounding boxes overlap, each pair once.
+        """
+        bounds: Dict[arcade.Sprite, Tuple[float, float, float, float]] = {
+            sprite: get_sprite_bounds(sprite) for sprite in sprites
+        }
+        # Keep last tick's order, dropping removed sprites and appending new ones
+        order = [sprite for sprite in self._order if sprite in bounds]
+        if len(order) != len(bounds):
+            known = set(order)
+            order.extend(sprite for sprite in bounds if sprite not in known)
+        _insertion_sort(order, bounds)
+        self._order = order
+
+        pairs: List[Tuple[arcade.Sprite, arcade.Sprite]] = []
+        active: List[arcade.Sprite] = []
+        for sprite in order:
+            left, bottom, right, top = bounds[sprite]
+            # Anything whose right edge is behind our left edge can never touch us
+            # or anything after us
+            active = [other for other in active if bounds[other][2] >= left]
+            for other in active:
+                other_bounds = bounds[other]
+                if other_bounds[1] <= top and bottom <= other_bounds[3]:
+                    pairs.append((other, sprite))
+            active.append(sprite)
+        return pairs
+
+
+def _insertion_sort(
+    order: List[arcade.Sprite],
+    bounds: Dict[arcade.Sprite, Tuple[float, float, float, float]],
+):
+    """
+    Sort by left edge in place.  Fast when `order` is nearly sorted already.
+    """
+    for index in range(1, len(order)):
+        sprite = order[index]
+        left = bounds[sprite][0]
+        position = index
+        while position > 0 and bounds[order[position - 1]][0] > left:
+            order[position] = order[position - 1]
+            position -= 1
+        order[position] = sprite
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+import arcade
+
+from sweep_and_prune import SweepAndPrune
+
+
+def make_box(x: float, y: float):
+    sprite = arcade.SpriteSolidColor(20, 20, arcade.color.BLACK)
+    sprite.position = (x, y)
+    return sprite
+
+
+class TestSweepAndPrune(TestCase):
+    def test_finds_overlapping_pairs(self):
+        a = make_box(0, 0)
+        b = make_box(15, 5)
+        # Overlaps `a` along x, but not along y
+        c = make_box(5, 100)
+        d = make_box(200, 0)
+        pairs = SweepAndPrune().find_pairs([d, c, b, a])
+        self.assertEqual(len(pairs), 1)
+        self.assertEqual(set(pairs[0]), {a, b})
+
+    def test_follows_sprites_across_ticks(self):
+        a = make_box(0, 0)
+        b = make_box(100, 0)
+        sweep = SweepAndPrune()
+        self.assertEqual(sweep.find_pairs([a, b]), [])
+
+        # Swap sides, so the remembered order is now wrong
+        a.center_x = 110
+        b.center_x = 95
+        pairs = sweep.find_pairs([a, b])
+        self.assertEqual(pairs, [(b, a)])
+
+        c = make_box(120, 0)
+        pairs = sweep.find_pairs([b, c])
+        self.assertEqual(pairs, [])
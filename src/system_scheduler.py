@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import math
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+MAX_PHASE_HORIZON = 600
+"Most ticks looked ahead when choosing the least busy phase for a system"
+
+
+class System:
+    """
+    One update function registered with a `SystemScheduler`.
+    """
+
+    name: str
+    update: Callable[[float], None]
+    "Called with the time passed since the system last ran"
+    interval: int
+    "Runs once every `interval` ticks"
+    phase: int
+    "Runs on ticks where `tick % interval == phase`"
+    after: Sequence[str]
+    before: Sequence[str]
+    elapsed: float
+    "Time passed since the system last ran"
+    enabled: bool
+    "Disabled systems don't run, but time still passes for them"
+    throttle: int
+    "Runs only one in every `throttle` times it is due, to shed load"
+
+    def __init__(
+        self,
+        name: str,
+        update: Callable[[float], None],
+        interval: int,
+        phase: int,
+        after: Sequence[str],
+        before: Sequence[str],
+    ):
+        self.name = name
+        self.update = update
+        self.interval = interval
+        self.phase = phase
+        self.after = after
+        self.before = before
+        self.elapsed = 0.0
+        self.enabled = True
+        self.throttle = 1
+
+    def is_due(self, tick: int) -> bool:
+        return (
+            tick % self.interval == self.phase
+            and tick // self.interval % self.throttle == 0
+        )
+
+
+class SystemScheduler:
+    """
+    Runs each system of the game loop at its own rate, in an order that respects
+    their dependencies.
+
+    Systems that don't need to run every tick, such as HUDs and round state, run
+    every few ticks instead, with the time that passed since they last ran.
+    Unless given a phase, such systems are offset onto the ticks that the fewest
+    other low-rate systems run on, so that they don't all land on the same tick.
+
+    Order is decided by `after` and `before`, naming other systems.  Systems not
+    constrained relative to each other run in the order they were added.
+    """
+
+    tick_rate: float
+    "Ticks per second"
+    tick: int
+    "Ticks run so far"
+
+    def __init__(self, tick_rate: float):
+        self.tick_rate = tick_rate
+        self.tick = 0
+        self._systems: List[System] = []
+        self._order: Optional[List[System]] = None
+
+    def add(
+        self,
+        name: str,
+        update: Callable[[float], None],
+        rate: Optional[float] = None,
+        phase: Optional[int] = None,
+        after: Sequence[str] = (),
+        before: Sequence[str] = (),
+    ) -> System:
+        """
+        Register a system to run `rate` times per second, or every tick if `rate`
+        is `None`.  Rates are rounded to a whole number of ticks.
+
+        `phase` offsets which ticks it runs on, from 0 to its interval in ticks.
+        """
+        if any(system.name == name for system in self._systems):
+            raise Exception(f"A system named {name} was already added")
+        interval = 1 if rate is None else max(1, round(self.tick_rate / rate))
+        if phase is None:
+            phase = self._find_quietest_phase(interval)
+        elif not 0 <= phase < interval:
+            raise Exception(f"Phase of {name} must be from 0 to {interval - 1}")
+        system = System(name, update, interval, phase, after, before)
+        self._systems.append(system)
+        self._order = None
+        return system
+
+    def get(self, name: str) -> System:
+        for system in self._systems:
+            if system.name == name:
+                return system
+        raise Exception(f"No system named {name}")
+
+    def update(self, delta_time: float):
+        """
+        Run one tick: every system that is due, in order.
+        """
+        if self._order is None:
+            self._order = self._sort()
+        tick = self.tick
+        for system in self._order:
+            system.elapsed += delta_time
+            if system.enabled and system.is_due(tick):
+                elapsed = system.elapsed
+                system.elapsed = 0.0
+                system.update(elapsed)
+        self.tick = tick + 1
+
+    def _find_quietest_phase(self, interval: int) -> int:
+        if interval == 1:
+            return 0
+        spread = [system for system in self._systems if system.interval > 1]
+        horizon = interval
+        for system in spread:
+            horizon = min(math.lcm(horizon, system.interval), MAX_PHASE_HORIZON)
+        best_phase = 0
+        best_load: Optional[Tuple[int, int]] = None
+        for phase in range(interval):
+            # The busiest tick this phase would share, then how busy they are overall
+            loads = [
+                sum(1 for system in spread if system.is_due(tick))
+                for tick in range(phase, max(horizon, interval), interval)
+            ]
+            load = (max(loads), sum(loads))
+            if best_load is None or load < best_load:
+                best_load = load
+                best_phase = phase
+        return best_phase
+
+    def _sort(self) -> List[System]:
+        """
+        Order systems so that each runs after everything it depends on.
+        """
+        by_name: Dict[str, System] = {system.name: system for system in self._systems}
+        dependencies: Dict[str, List[str]] = {name: [] for name in by_name}
+        for system in self._systems:
+            for other in system.after:
+                if other not in by_name:
+                    raise Exception(f"{system.name} runs after unknown system {other}")
+                dependencies[system.name].append(other)
+            for other in system.before:
+                if other not in by_name:
+                    raise Exception(f"{system.name} runs before unknown system {other}")
+                dependencies[other].append(system.name)
+        order: List[System] = []
+        visiting = set()
+        visited = set()
+
+        def visit(name: str):
+            if name in visited:
+                return
+            if name in visiting:
+                raise Exception(f"Systems depend on each other in a cycle at {name}")
+            visiting.add(name)
+            for dependency in dependencies[name]:
+                visit(dependency)
+            visiting.remove(name)
+            visited.add(name)
+            order.append(by_name[name])
+
+        for system in self._systems:
+            visit(system.name)
+        return order
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import unittest
+
+from system_scheduler import SystemScheduler
+
+
+class SystemSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = SystemScheduler(60)
+        self.calls = []
+
+    def add(self, name: str, **kwargs):
+        return self.scheduler.add(
+            name, lambda delta_time: self.calls.append((name, delta_time)), **kwargs
+        )
+
+    def run_ticks(self, ticks: int):
+        for _ in range(ticks):
+            self.scheduler.update(1 / 60)
+
+    def names(self):
+        return [name for name, _ in self.calls]
+
+    def test_runs_each_system_at_its_rate(self):
+        self.add("every_tick")
+        self.add("twenty_hz", rate=20)
+        self.run_ticks(60)
+        self.assertEqual(self.names().count("every_tick"), 60)
+        self.assertEqual(self.names().count("twenty_hz"), 20)
+
+    def test_passes_time_since_last_run(self):
+        self.add("ten_hz", rate=10)
+        self.run_ticks(12)
+        self.assertEqual(len(self.calls), 2)
+        for _, delta_time in self.calls[1:]:
+            self.assertAlmostEqual(delta_time, 0.1)
+
+    def test_spreads_low_rate_systems_across_ticks(self):
+        first = self.add("first", rate=20)
+        second = self.add("second", rate=20)
+        third = self.add("third", rate=20)
+        self.assertEqual(sorted([first.phase, second.phase, third.phase]), [0, 1, 2])
+        slower = self.add("slower", rate=10)
+        self.assertEqual(slower.interval, 6)
+
+        busiest = 0
+        for _ in range(60):
+            self.calls.clear()
+            self.run_ticks(1)
+            busiest = max(busiest, len(self.calls))
+        self.assertEqual(busiest, 2)
+
+    def test_respects_explicit_phase(self):
+        system = self.add("late", rate=20, phase=2)
+        self.run_ticks(3)
+        self.assertEqual(system.phase, 2)
+        self.assertEqual(len(self.calls), 1)
+        self.assertAlmostEqual(self.calls[0][1], 3 / 60)
+        with self.assertRaises(Exception):
+            self.add("too_late", rate=20, phase=3)
+
+    def test_orders_by_dependencies(self):
+        self.add("draw_prep", after=("physics",))
+        self.add("physics", after=("input",))
+        self.add("audio")
+        self.add("input", before=("audio",))
+        self.run_ticks(1)
+        names = self.names()
+        self.assertLess(names.index("input"), names.index("physics"))
+        self.assertLess(names.index("physics"), names.index("draw_prep"))
+        self.assertLess(names.index("input"), names.index("audio"))
+
+    def test_keeps_registration_order_when_unconstrained(self):
+        for name in ["a", "b", "c"]:
+            self.add(name)
+        self.run_ticks(1)
+        self.assertEqual(self.names(), ["a", "b", "c"])
+
+    def test_rejects_bad_dependencies(self):
+        self.add("a", after=("b",))
+        self.add("b", after=("a",))
+        with self.assertRaises(Exception):
+            self.run_ticks(1)
+
+        scheduler = SystemScheduler(60)
+        scheduler.add("a", lambda _: None, after=("missing",))
+        with self.assertRaises(Exception):
+            scheduler.update(1 / 60)
+        with self.assertRaises(Exception):
+            scheduler.add("a", lambda _: None)
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import arcade
+from pyglet.window.key import KeyStateHandler
+
+from linked_sprite import LinkedSpriteSolidColor
+from player_input import PlayerInput
+from sprite_lists import SpriteLists
+
+
+class FakeVehicle:
+    """
+    Stands in for a `Vehicle` in tests: a square sprite in `vehicles` that adds up
+    the damage it takes.
+    """
+
+    def __init__(self, sprite_lists: SpriteLists, x: float, y: float):
+        self.damage_taken = 0
+        self.sprite = LinkedSpriteSolidColor[FakeVehicle](20, 20, arcade.color.BLUE)
+        self.sprite.owner = self
+        self.sprite.position = (x, y)
+        sprite_lists.vehicles.append(self.sprite)
+
+    def apply_damage(self, damage: float):
+        self.damage_taken += damage
+
+
+class FakePlayer:
+    """
+    Just enough of a `Player` to build and drive a real `Vehicle`.  Bind keys on
+    `input`, press them on `keys`, then call `input.update`.
+    """
+
+    def __init__(self):
+        self.keys = KeyStateHandler()
+        self.input = PlayerInput(self.keys, None)
+        self.input.update()
+        self.alive = True
+        self.controls_active = True
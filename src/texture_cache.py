@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+import arcade
+
+SOLID_COLOR_TEXTURE_SIZE = 8
+"""
+Width and height of the texture shared by every solid-color rectangle of one color.
+Sprites stretch it to their own size, which loses nothing for a solid color.
+"""
+
+Color = Tuple[int, int, int, int]
+
+_textures: Dict[Tuple[str, int, Color], arcade.Texture] = {}
+"Generated textures, keyed by (shape, size, color)"
+
+
+def get_solid_color_texture(color: arcade.Color) -> arcade.Texture:
+    """
+    Texture for a solid-color rectangle.  Stretch it to any width and height.
+    """
+    return _get_texture("solid", SOLID_COLOR_TEXTURE_SIZE, color)
+
+
+def get_circle_texture(
+    radius: float, color: arcade.Color, soft: bool = False
+) -> arcade.Texture:
+    """
+    Texture for a circle, optionally fading out toward its edge.
+    """
+    return _get_texture("soft_circle" if soft else "circle", int(radius * 2), color)
+
+
+def get_texture_cache_size() -> int:
+    """
+    How many distinct textures have been generated.
+    """
+    return len(_textures)
+
+
+def _get_texture(shape: str, size: int, color: arcade.Color) -> arcade.Texture:
+    rgba = _to_rgba(color)
+    key = (shape, size, rgba)
+    texture = _textures.get(key)
+    if texture is None:
+        # Texture names identify images in the texture atlas, so they must be unique
+        name = f"generated:{shape}:{size}:{rgba}"
+        if shape == "solid":
+            texture = arcade.Texture.create_filled(name, (size, size), rgba)
+        elif shape == "circle":
+            texture = arcade.make_circle_texture(size, rgba, name)
+        elif shape == "soft_circle":
+            texture = arcade.make_soft_circle_texture(size, rgba, name=name)
+        else:
+            raise Exception(f"Unknown generated texture shape: {shape}")
+        _textures[key] = texture
+    return texture
+
+
+def _to_rgba(color: arcade.Color) -> Color:
+    if len(color) == 3:
+        return (color[0], color[1], color[2], 255)
+    return (color[0], color[1], color[2], color[3])
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+import arcade
+
+from linked_sprite import LinkedSpriteCircle, LinkedSpriteSolidColor
+from texture_cache import get_circle_texture, get_solid_color_texture
+
+
+class TestTextureCache(TestCase):
+    def test_shares_textures(self):
+        self.assertIs(
+            get_solid_color_texture(arcade.color.RED),
+            get_solid_color_texture((255, 0, 0, 255)),
+        )
+        self.assertIsNot(
+            get_solid_color_texture(arcade.color.RED),
+            get_solid_color_texture((255, 0, 0, 128)),
+        )
+        self.assertIsNot(
+            get_circle_texture(10, arcade.color.RED),
+            get_circle_texture(10, arcade.color.RED, soft=True),
+        )
+
+    def test_solid_color_sprites_stretch_shared_texture(self):
+        bullet = LinkedSpriteSolidColor(8, 3, arcade.color.RED)
+        wall = LinkedSpriteSolidColor(200, 20, arcade.color.RED)
+        self.assertIs(bullet.texture, wall.texture)
+        self.assertEqual((wall.width, wall.height), (200, 20))
+        xs = [point[0] for point in wall.get_adjusted_hit_box()]
+        ys = [point[1] for point in wall.get_adjusted_hit_box()]
+        self.assertEqual((min(xs), max(xs), min(ys), max(ys)), (-100, 100, -10, 10))
+
+    def test_circle_sprites(self):
+        circle = LinkedSpriteCircle(10, arcade.color.RED)
+        self.assertIsInstance(circle, arcade.SpriteCircle)
+        self.assertEqual(circle.width, 20)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 import arcade
 
@@ -13,11 +13,14 @@ from iron_math import (
 )
 from linked_sprite import LinkedSprite
 from movement_controls import MovementControls
+from player_input import VirtualButton
 from sprite_lists import SpriteLists
 from textures import FIRE, VEHICLES
 from weapons.laser_beam import LaserBeam
 from weapons.machine_gun import MachineGun
+from weapons.rifle import Rifle
 from weapons.rocket_launcher import RocketLauncher
+from weapons.shotgun import Shotgun
 from weapons.weapon import Weapon
 
 if TYPE_CHECKING:
@@ -41,8 +44,12 @@ class Vehicle:
             LaserBeam,
             RocketLauncher,
             MachineGun,
+            Shotgun,
+            Rifle,
         ]
         self.weapon_index: int = 0
+        self.weapon_instances: List[Optional[Weapon]] = [None] * len(self.weapons_list)
+        "Weapon created for each entry of `weapons_list`, reused across swaps"
         self.primary_weapon: Weapon
         self.secondary_weapon: Weapon
         self.primary_weapon_sprite: arcade.Sprite
@@ -63,9 +70,7 @@ class Vehicle:
         # Driving and movement
         if self.player.controls_active:
             self.movement.drive_input(delta_time, self, self.player.input)
-        self.movement.move(
-            delta_time, self, self.sprite_lists.walls, self.sprite_lists.vehicles
-        )
+        self.movement.move(delta_time, self)
 
         # Weapons
 
@@ -73,6 +78,13 @@ class Vehicle:
             self.movement.drive_input(delta_time, self, self.player.input)
             self.primary_weapon.update(delta_time)
             self.secondary_weapon.update(delta_time)
+            for weapon in self.weapon_instances:
+                if (
+                    weapon is not None
+                    and weapon is not self.primary_weapon
+                    and weapon is not self.secondary_weapon
+                ):
+                    weapon.update_swapped_out(delta_time)
             if self.player.input.swap_weapons_button.pressed:
                 self._swap_weapons()
 
@@ -129,20 +141,40 @@ class Vehicle:
         self.secondary_weapon.swap_out()
 
     def _swap_in_weapons(self):
-        self.primary_weapon = self.weapons_list[self.weapon_index](
-            self.sprite_lists,
+        self.primary_weapon = self._get_weapon(
+            self.weapon_index,
             self.player.input.primary_fire_button,
             self.primary_weapon_transform,
         )
         self.weapon_index += 1
         if self.weapon_index >= len(self.weapons_list):
             self.weapon_index = 0
-        self.secondary_weapon = self.weapons_list[self.weapon_index](
-            self.sprite_lists,
+        self.secondary_weapon = self._get_weapon(
+            self.weapon_index,
             self.player.input.secondary_fire_button,
             self.secondary_weapon_transform,
         )
 
+    def _get_weapon(
+        self,
+        index: int,
+        input_button: VirtualButton,
+        weapon_transform: Tuple[float, float, float],
+    ) -> Weapon:
+        """
+        Swap in the weapon for an entry of `weapons_list`, creating it the first
+        time only.
+        """
+        weapon = self.weapon_instances[index]
+        if weapon is None:
+            weapon = self.weapons_list[index](
+                self, self.sprite_lists, input_button, weapon_transform
+            )
+            self.weapon_instances[index] = weapon
+        else:
+            weapon.swap_in(input_button, weapon_transform)
+        return weapon
+
     def _update_vehicle_attachment_locations(self):
         move_sprite_relative_to_parent(
             self.primary_weapon.weapon_sprite,
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+from pyglet.window import key
+
+from audio import disable_audio
+from sprite_lists import SpriteLists
+from test_fakes import FakePlayer
+from vehicle import Vehicle
+
+TICK = 1 / 60
+
+
+class TestVehicleWeapons(TestCase):
+    def setUp(self):
+        disable_audio()
+        self.sprite_lists = SpriteLists()
+        self.sprite_lists.collision_world.bake_walls()
+        self.player = FakePlayer()
+        self.player.input.swap_weapons_button.key = key.Q
+        self.vehicle = Vehicle(self.player, self.sprite_lists, 0)
+        self.vehicle.location = (100, 100, 0)
+        self.ticks = 0
+
+    def tick(self, swap: bool = False):
+        if swap:
+            self.player.keys.on_key_press(key.Q, 0)
+        else:
+            self.player.keys.on_key_release(key.Q, 0)
+        self.player.input.update()
+        self.vehicle.update(TICK)
+        self.ticks += 1
+
+    def swap(self, times: int = 1):
+        for _ in range(times):
+            self.tick(swap=True)
+            self.tick()
+
+    def test_swapping_back_reuses_the_same_weapon(self):
+        first = self.vehicle.primary_weapon
+        weapon_count = len(self.vehicle.weapons_list)
+
+        self.swap()
+        self.assertIsNot(self.vehicle.primary_weapon, first)
+        self.assertIsNot(self.vehicle.secondary_weapon, first)
+        self.assertIs(self.vehicle.weapon_instances[0], first)
+
+        # All the way around the rotation
+        self.swap(weapon_count - 1)
+        self.assertIs(self.vehicle.primary_weapon, first)
+        self.assertTrue(first.weapon_sprite.visible)
+        instances = list(self.vehicle.weapon_instances)
+        self.assertNotIn(None, instances)
+
+        # No weapon is ever created twice
+        self.swap(weapon_count)
+        for weapon, instance in zip(self.vehicle.weapon_instances, instances):
+            self.assertIs(weapon, instance)
+
+    def test_cooldown_carries_over_swaps(self):
+        # The laser beam has no cooldown, so use the rocket launcher
+        rocket_launcher = self.vehicle.secondary_weapon
+        fire_schedule = rocket_launcher.fire_schedule
+        # As if it had just fired a slow shot
+        fire_schedule.next_shot_time = 1.0
+
+        self.swap(len(self.vehicle.weapons_list))
+        self.assertIs(self.vehicle.secondary_weapon, rocket_launcher)
+        self.assertIs(rocket_launcher.fire_schedule, fire_schedule)
+        self.assertAlmostEqual(fire_schedule.next_shot_time, 1.0 - self.ticks * TICK)
+
+    def test_cooldown_runs_while_holstered(self):
+        rocket_launcher = self.vehicle.secondary_weapon
+        fire_schedule = rocket_launcher.fire_schedule
+        fire_schedule.next_shot_time = 1.0
+        self.swap(2)
+        self.assertNotIn(
+            rocket_launcher,
+            (self.vehicle.primary_weapon, self.vehicle.secondary_weapon),
+        )
+        self.assertFalse(rocket_launcher.weapon_sprite.visible)
+
+        for _ in range(30):
+            self.tick()
+        self.assertAlmostEqual(fire_schedule.next_shot_time, 1.0 - self.ticks * TICK)
+
+        # Ready to fire, but with no shots saved up
+        for _ in range(60):
+            self.tick()
+        self.assertEqual(fire_schedule.next_shot_time, 0)
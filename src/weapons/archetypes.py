@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+ARCHETYPES_FILE = Path(__file__).parent / "archetypes.json"
+"Stats of every weapon and ordnance archetype, used unless another table is set"
+
+
+@dataclass(frozen=True)
+class ExplosionArchetype:
+    name: str
+    damage: float
+    radius: float
+    rate: float
+    "How fast the explosion expands, in pixels per second"
+    pool_capacity: int
+
+
+@dataclass(frozen=True)
+class ProjectileArchetype:
+    name: str
+    damage: float
+    "Damage on impact, not including the payload"
+    speed: float
+    pool_capacity: int
+    payload: Optional[ExplosionArchetype] = None
+    "Activated where the projectile hits something"
+
+
+@dataclass(frozen=True)
+class BeamArchetype:
+    name: str
+    dps: float
+    range: float
+
+
+@dataclass(frozen=True)
+class HitscanArchetype:
+    name: str
+    damage: float
+    "Damage of each ray"
+    range: float
+    ray_count: int = 1
+    spread: float = 0
+    "Angle between the outermost rays, in degrees"
+
+
+OrdnanceArchetype = Union[
+    ProjectileArchetype, ExplosionArchetype, BeamArchetype, HitscanArchetype
+]
+
+
+@dataclass(frozen=True)
+class WeaponArchetype:
+    name: str
+    ordnance: OrdnanceArchetype
+    muzzle_transform: Tuple[float, float, float]
+    "Where ordnance leaves the weapon, relative to the weapon sprite"
+    fire_rate: Optional[float] = None
+    "Shots per second, for weapons that fire discrete shots"
+
+
+class ArchetypeTable:
+    """
+    Every weapon and ordnance archetype, by name.
+
+    Compiled once from data and never changed afterwards, so that every weapon of
+    a kind shares one archetype instead of copying its stats.  To try different
+    stats, compile another table and `set_archetypes` before weapons are created.
+    """
+
+    weapons: Mapping[str, WeaponArchetype]
+    ordnance: Mapping[str, OrdnanceArchetype]
+
+    def __init__(
+        self,
+        weapons: Dict[str, WeaponArchetype],
+        ordnance: Dict[str, OrdnanceArchetype],
+    ):
+        self.weapons = MappingProxyType(weapons)
+        self.ordnance = MappingProxyType(ordnance)
+
+
+_ORDNANCE_KINDS = {
+    "explosion": ExplosionArchetype,
+    "projectile": ProjectileArchetype,
+    "beam": BeamArchetype,
+    "hitscan": HitscanArchetype,
+}
+
+_archetypes: Optional[ArchetypeTable] = None
+"Table used by weapons, loaded from `ARCHETYPES_FILE` on first use"
+
+
+def get_archetypes() -> ArchetypeTable:
+    global _archetypes
+    if _archetypes is None:
+        _archetypes = load_archetypes(ARCHETYPES_FILE)
+    return _archetypes
+
+
+def set_archetypes(archetypes: ArchetypeTable):
+    """
+    Replace the table used by weapons created from now on.
+    """
+    global _archetypes
+    _archetypes = archetypes
+
+
+def load_archetypes(file_name: Union[str, Path]) -> ArchetypeTable:
+    with open(file_name) as file:
+        return compile_archetypes(json.load(file))
+
+
+def compile_archetypes(data: Mapping[str, Any]) -> ArchetypeTable:
+    """
+    Build an `ArchetypeTable` from data shaped like `archetypes.json`, resolving
+    references between archetypes by name.
+    """
+    ordnance_data: Mapping[str, Any] = data.get("ordnance", {})
+    ordnance: Dict[str, OrdnanceArchetype] = {}
+    for name in ordnance_data:
+        _compile_ordnance(name, ordnance_data, ordnance)
+    weapons: Dict[str, WeaponArchetype] = {}
+    for name, fields in data.get("weapons", {}).items():
+        fields = dict(fields)
+        fields["ordnance"] = _get_reference(ordnance, name, fields.get("ordnance"))
+        fields["muzzle_transform"] = tuple(fields.get("muzzle_transform", (0, 0, 0)))
+        weapons[name] = _create(WeaponArchetype, name, fields)
+    return ArchetypeTable(weapons, ordnance)
+
+
+def _compile_ordnance(
+    name: str,
+    ordnance_data: Mapping[str, Any],
+    ordnance: Dict[str, OrdnanceArchetype],
+) -> OrdnanceArchetype:
+    if name in ordnance:
+        return ordnance[name]
+    fields = dict(ordnance_data[name])
+    kind = fields.pop("kind", None)
+    archetype_type = _ORDNANCE_KINDS.get(kind)
+    if archetype_type is None:
+        raise Exception(f"Ordnance archetype {name} has unknown kind: {kind}")
+    payload = fields.get("payload")
+    if payload is not None:
+        if payload not in ordnance_data:
+            raise Exception(f"Archetype {name} references unknown ordnance: {payload}")
+        if ordnance_data[payload].get("kind") != "explosion":
+            raise Exception(f"Payload of archetype {name} must be an explosion")
+        fields["payload"] = _compile_ordnance(payload, ordnance_data, ordnance)
+    archetype = _create(archetype_type, name, fields)
+    ordnance[name] = archetype
+    return archetype
+
+
+def _get_reference(
+    ordnance: Dict[str, OrdnanceArchetype], name: str, reference: Optional[str]
+) -> OrdnanceArchetype:
+    archetype = ordnance.get(reference)
+    if archetype is None:
+        raise Exception(f"Archetype {name} references unknown ordnance: {reference}")
+    return archetype
+
+
+def _create(archetype_type: type, name: str, fields: Dict[str, Any]):
+    try:
+        return archetype_type(name=name, **fields)
+    except TypeError as error:
+        raise Exception(f"Archetype {name} is invalid: {error}")
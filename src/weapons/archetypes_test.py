@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+from dataclasses import FrozenInstanceError
+from unittest import TestCase
+
+from audio import disable_audio
+from ordnances.explosion import Explosion
+from ordnances.projectile import Projectile
+from sprite_lists import SpriteLists
+from test_fakes import FakeVehicle
+from weapons.archetypes import (
+    ARCHETYPES_FILE,
+    ExplosionArchetype,
+    compile_archetypes,
+    get_archetypes,
+    load_archetypes,
+    set_archetypes,
+)
+from weapons.machine_gun import MachineGun
+from weapons.rocket_launcher import RocketLauncher
+
+ROCKET_DATA = {
+    "ordnance": {
+        "rocket": {
+            "kind": "projectile",
+            "damage": 0,
+            "speed": 550,
+            "pool_capacity": 8,
+            "payload": "blast",
+        },
+        "blast": {
+            "kind": "explosion",
+            "damage": 80,
+            "radius": 75,
+            "rate": 200,
+            "pool_capacity": 8,
+        },
+    },
+    "weapons": {
+        "launcher": {
+            "ordnance": "rocket",
+            "fire_rate": 0.5,
+            "muzzle_transform": [12, 0, 0],
+        }
+    },
+}
+
+
+class TestArchetypes(TestCase):
+    def test_resolves_references(self):
+        table = compile_archetypes(ROCKET_DATA)
+        launcher = table.weapons["launcher"]
+        self.assertIs(launcher.ordnance, table.ordnance["rocket"])
+        self.assertIs(launcher.ordnance.payload, table.ordnance["blast"])
+        self.assertIsInstance(launcher.ordnance.payload, ExplosionArchetype)
+        self.assertEqual(launcher.muzzle_transform, (12, 0, 0))
+
+    def test_immutable(self):
+        table = compile_archetypes(ROCKET_DATA)
+        with self.assertRaises(FrozenInstanceError):
+            table.weapons["launcher"].fire_rate = 100
+        with self.assertRaises(TypeError):
+            table.weapons["cannon"] = table.weapons["launcher"]
+
+    def test_rejects_bad_data(self):
+        with self.assertRaises(Exception):
+            compile_archetypes({"weapons": {"launcher": {"ordnance": "missing"}}})
+        with self.assertRaises(Exception):
+            compile_archetypes({"ordnance": {"laser": {"kind": "beam", "dps": 20}}})
+        with self.assertRaises(Exception):
+            compile_archetypes(
+                {
+                    "ordnance": {
+                        "rocket": {
+                            "kind": "projectile",
+                            "damage": 0,
+                            "speed": 550,
+                            "pool_capacity": 8,
+                            "payload": "rocket",
+                        }
+                    }
+                }
+            )
+
+    def test_shipped_table(self):
+        table = load_archetypes(ARCHETYPES_FILE)
+        for name in ("machine_gun", "rocket_launcher", "laser_beam"):
+            self.assertIn(name, table.weapons)
+
+    def test_weapons_fire_ordnance_from_the_table_set_last(self):
+        disable_audio()
+        self.addCleanup(set_archetypes, get_archetypes())
+        sprite_lists = SpriteLists()
+        vehicle = FakeVehicle(sprite_lists, 100, 100)
+
+        def fire(weapon_type):
+            weapon = weapon_type(vehicle, sprite_lists, None, (0, 0, 0))
+            weapon.shoot()
+            return sprite_lists.projectiles[-1].owner
+
+        # Pools are filled from the shipped table
+        bullet: Projectile = fire(MachineGun)
+        rocket: Projectile = fire(RocketLauncher)
+        self.assertEqual(bullet.damage, 10)
+        self.assertEqual(rocket.payload_list[0].damage, 80)
+
+        with open(ARCHETYPES_FILE) as file:
+            data = json.load(file)
+        data["ordnance"]["machine_gun_bullet"].update(damage=3, speed=200)
+        data["ordnance"]["rocket"]["speed"] = 100
+        data["ordnance"]["rocket_explosion"].update(damage=5, radius=20)
+        set_archetypes(compile_archetypes(data))
+
+        bullet = fire(MachineGun)
+        self.assertEqual((bullet.damage, bullet.speed), (3, 200))
+        rocket = fire(RocketLauncher)
+        self.assertEqual(rocket.speed, 100)
+        explosion: Explosion = rocket.payload_list[0]
+        self.assertEqual((explosion.damage, explosion.explosion_radius), (5, 20))
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import List
+
+
+class FireSchedule:
+    """
+    Decides when a weapon fires, to a fraction of a tick.
+
+    Remembers how long until the weapon can fire again, including the part of a
+    tick left over after the last shot.  Fire rate then does not depend on tick
+    rate, and several shots can fire in one tick when the fire rate is higher than
+    the tick rate.
+    """
+
+    next_shot_time: float
+    "Seconds from the start of the current tick until the weapon can fire again"
+
+    def __init__(self):
+        self.next_shot_time = 0
+
+    def schedule_shots(
+        self, delta_time: float, fire_rate: float, trigger: bool
+    ) -> List[float]:
+        """
+        Call once per tick.  Returns the exact times, in seconds from the start of
+        this tick, at which the weapon fires this tick, if `trigger` is held.
+        """
+        shot_times: List[float] = []
+        if trigger:
+            interval = 1 / fire_rate
+            while self.next_shot_time < delta_time:
+                shot_times.append(self.next_shot_time)
+                self.next_shot_time += interval
+        self.advance(delta_time)
+        return shot_times
+
+    def advance(self, delta_time: float):
+        """
+        Let time pass without firing, such as while the weapon is swapped out.
+        """
+        # An idle weapon is ready to fire, but cannot save up shots
+        self.next_shot_time = max(self.next_shot_time - delta_time, 0)
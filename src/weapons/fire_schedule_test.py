@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+from weapons.fire_schedule import FireSchedule
+
+
+class TestFireSchedule(TestCase):
+    def setUp(self):
+        self.schedule = FireSchedule()
+
+    def test_carries_remainder_between_ticks(self):
+        shot_times = []
+        for tick in range(60):
+            shot_times += self.schedule.schedule_shots(1 / 60, 8, True)
+        # Exactly 8 shots per second, not one every 8 ticks
+        self.assertEqual(len(shot_times), 8)
+        self.assertAlmostEqual(shot_times[1], 0.125 - 7 / 60)
+
+    def test_several_shots_per_tick(self):
+        self.assertEqual(
+            self.schedule.schedule_shots(0.1, 30, True), [0, 1 / 30, 2 / 30]
+        )
+
+    def test_cannot_save_up_shots(self):
+        self.assertEqual(len(self.schedule.schedule_shots(0.1, 10, True)), 1)
+        self.assertEqual(self.schedule.schedule_shots(1, 10, False), [])
+        self.assertEqual(self.schedule.schedule_shots(0.05, 10, True), [0])
+
+    def test_cooldown_runs_while_swapped_out(self):
+        self.assertEqual(self.schedule.schedule_shots(0.1, 0.5, True), [0])
+        self.schedule.advance(1.5)
+        self.assertEqual(self.schedule.schedule_shots(0.1, 0.5, True), [])
+        self.schedule.advance(0.25)
+        shot_times = self.schedule.schedule_shots(0.1, 0.5, True)
+        self.assertEqual(len(shot_times), 1)
+        self.assertAlmostEqual(shot_times[0], 0.05)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import math
+from typing import List, Optional
+
+import arcade
+import numpy as np
+
+from collision_layers import CollisionLayer, get_collision_mask
+from collision_world import RaycastHit
+from frame_budget import QualityTier
+from iron_math import get_transformed_location
+from ordnances.ordnance_pool import OrdnancePool
+from ordnances.tracer import Tracer
+from weapons.archetypes import HitscanArchetype
+from weapons.weapon import Weapon
+
+
+class HitscanWeapon(Weapon):
+    """
+    Fires rays that hit instantly, instead of ordnance that travels.
+
+    Every ray of a shot, such as each pellet of a shotgun, is resolved by one
+    batched raycast, so a shot costs no sprites and nothing to update afterwards.
+    """
+
+    shot: HitscanArchetype
+    ray_angles: np.ndarray
+    "Angle of each ray relative to the weapon, in radians"
+    hits: List[Optional[RaycastHit]]
+    "What each ray of the last shot hit, or `None` for rays that hit nothing in range"
+    tracer_color: arcade.Color = arcade.color.YELLOW
+    tracer_pool: OrdnancePool[Tracer]
+
+    def setup(self):
+        self.shot = self.archetype.ordnance
+        spread = math.radians(self.shot.spread)
+        self.ray_angles = np.linspace(-spread / 2, spread / 2, self.shot.ray_count)
+        self.hits = []
+        # Enough tracers for a couple of shots on screen at once
+        self.tracer_pool = self.sprite_lists.ordnance_pools.get(
+            f"{self.shot.name}_tracer",
+            self.create_tracer,
+            2 * self.shot.ray_count,
+            self.shot,
+        )
+        self.twisted_sound.select(self.twisted_sound.MACHINE_GUN1)
+
+    def update(self, delta_time: float):
+        for _ in self.fire_schedule.schedule_shots(
+            delta_time, self.archetype.fire_rate, self.input_button.pressed
+        ):
+            self.shoot()
+
+    def shoot(self):
+        muzzle_location = get_transformed_location(
+            self.weapon_sprite, self.muzzle_transform
+        )
+        angles = muzzle_location[2] + self.ray_angles
+        hits = self.sprite_lists.collision_world.raycast_many(
+            muzzle_location[:2],
+            np.column_stack((np.cos(angles), np.sin(angles))),
+            self.shot.range,
+            get_collision_mask(CollisionLayer.PROJECTILE),
+            self.vehicle.sprite,
+        )
+        self.hits = hits
+        tracer_spacing = self._get_tracer_spacing()
+        for index, (angle, hit) in enumerate(zip(angles, hits)):
+            if hit is not None and hit.layer == CollisionLayer.VEHICLE:
+                hit.sprite.owner.apply_damage(self.shot.damage)
+            if tracer_spacing is not None and index % tracer_spacing == 0:
+                self.tracer_pool.acquire().show(
+                    (muzzle_location[0], muzzle_location[1], angle),
+                    self.shot.range if hit is None else hit.distance,
+                )
+        self.twisted_sound.play()
+
+    def _get_tracer_spacing(self) -> Optional[int]:
+        """
+        Draw a tracer for one in every this many rays, or none at all.  Tracers are
+        ordnance, updated every tick, so they are thinned out while ticks run over
+        budget.
+        """
+        tier = self.sprite_lists.frame_budget.tier
+        if tier >= QualityTier.LOW:
+            return None
+        if tier == QualityTier.REDUCED:
+            return 2
+        return 1
+
+    def create_tracer(self):
+        return Tracer(self.tracer_color, self.sprite_lists)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+import arcade
+
+from audio import disable_audio
+from collision_layers import CollisionLayer
+from frame_budget import QualityTier
+from ordnances.tracer import TRACER_DURATION, Tracer
+from sprite_lists import SpriteLists
+from test_fakes import FakeVehicle
+from weapons.shotgun import Shotgun
+
+
+class FakeButton:
+    def __init__(self):
+        self.pressed = False
+        self.value = False
+
+
+class TestHitscanWeapon(TestCase):
+    def setUp(self):
+        disable_audio()
+        self.sprite_lists = SpriteLists()
+        self.shooter = FakeVehicle(self.sprite_lists, 100, 100)
+        self.button = FakeButton()
+        self.shotgun = Shotgun(self.shooter, self.sprite_lists, self.button, (0, 0, 0))
+        self.shotgun.weapon_sprite.position = (100, 100)
+        self.shotgun.weapon_sprite.angle = 0
+
+    def bake(self):
+        self.sprite_lists.collision_world.bake_walls()
+        self.sprite_lists.collision_world.update()
+
+    def test_sums_pellets_that_hit_the_same_vehicle(self):
+        # Far enough that the outer pellets spread past it
+        target = FakeVehicle(self.sprite_lists, 200, 100)
+        self.bake()
+        self.shotgun.shoot()
+
+        pellets = [
+            hit
+            for hit in self.shotgun.hits
+            if hit is not None and hit.sprite is target.sprite
+        ]
+        self.assertGreater(len(pellets), 1)
+        self.assertLess(len(pellets), self.shotgun.shot.ray_count)
+        self.assertEqual(target.damage_taken, len(pellets) * self.shotgun.shot.damage)
+
+    def test_ignores_shooter(self):
+        # The muzzle is inside the shooter's own sprite
+        self.bake()
+        self.shotgun.shoot()
+        self.assertEqual(self.shooter.damage_taken, 0)
+        self.assertTrue(all(hit is None for hit in self.shotgun.hits))
+
+    def test_walls_block_pellets(self):
+        wall = arcade.SpriteSolidColor(10, 200, arcade.color.BLACK)
+        wall.position = (125, 100)
+        self.sprite_lists.walls.append(wall)
+        target = FakeVehicle(self.sprite_lists, 150, 100)
+        self.bake()
+        self.shotgun.shoot()
+
+        self.assertEqual(target.damage_taken, 0)
+        self.assertTrue(
+            all(hit.layer == CollisionLayer.WALL for hit in self.shotgun.hits)
+        )
+
+    def test_fires_once_per_press(self):
+        target = FakeVehicle(self.sprite_lists, 150, 100)
+        self.bake()
+        self.button.pressed = True
+        self.button.value = True
+        self.shotgun.update(1 / 60)
+        damage_per_shot = target.damage_taken
+        self.assertGreater(damage_per_shot, 0)
+
+        # Held well past the cooldown
+        self.button.pressed = False
+        for _ in range(120):
+            self.shotgun.update(1 / 60)
+        self.assertEqual(target.damage_taken, damage_per_shot)
+
+        self.button.pressed = True
+        self.shotgun.update(1 / 60)
+        self.assertEqual(target.damage_taken, 2 * damage_per_shot)
+
+    def test_draws_fading_tracers(self):
+        target = FakeVehicle(self.sprite_lists, 150, 100)
+        self.bake()
+        self.shotgun.shoot()
+
+        tracers = [
+            sprite.owner
+            for sprite in self.sprite_lists.ordnance
+            if isinstance(sprite.owner, Tracer)
+        ]
+        self.assertEqual(len(tracers), self.shotgun.shot.ray_count)
+        center = next(
+            tracer
+            for tracer, hit in zip(tracers, self.shotgun.hits)
+            if hit is not None and hit.sprite is target.sprite
+        )
+        self.assertLess(center.sprite.width, 50)
+
+        self.sprite_lists.ordnance_lifetimes.update(
+            TRACER_DURATION * 2, self.sprite_lists.vehicles
+        )
+        self.assertEqual(len(self.sprite_lists.ordnance), 0)
+
+    def test_thins_tracers_while_over_budget(self):
+        self.bake()
+        frame_budget = self.sprite_lists.frame_budget
+        frame_budget.set_tier(QualityTier.REDUCED)
+        self.shotgun.shoot()
+        self.assertEqual(
+            len(self.sprite_lists.ordnance), (self.shotgun.shot.ray_count + 1) // 2
+        )
+
+        frame_budget.set_tier(QualityTier.LOW)
+        self.sprite_lists.ordnance_lifetimes.update(
+            TRACER_DURATION * 2, self.sprite_lists.vehicles
+        )
+        self.shotgun.shoot()
+        self.assertEqual(len(self.sprite_lists.ordnance), 0)
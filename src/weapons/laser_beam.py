@@ -7,6 +7,7 @@ from linked_sprite import LinkedSpriteSolidColor
 from ordnances.beam import Beam
 from ordnances.ordnance import Ordnance
 from textures import LASER_PISTOL
+from weapons.archetypes import BeamArchetype
 from weapons.weapon import Weapon
 
 
@@ -16,15 +17,13 @@ class LaserBeam(Weapon):
     """
 
     beam: Beam
-    beam_range: float
-    dps: float
+    beam_archetype: BeamArchetype
     # Is a class attribute, not instance attribute
     weapon_icon = LASER_PISTOL
+    archetype_name = "laser_beam"
 
     def setup(self):
-        self.beam_range = 400
-        self.dps = 20
-        self.muzzle_transform = (7, 2, 0)
+        self.beam_archetype = self.archetype.ordnance
         self.create_beam()
 
     def update(self, delta_time: float):
@@ -50,9 +49,15 @@ class LaserBeam(Weapon):
 
     def create_beam(self):
         beam_appearance = LinkedSpriteSolidColor[Ordnance](
-            self.beam_range, 3, arcade.color.RED
+            self.beam_archetype.range, 3, arcade.color.RED
         )
-        self.beam = Beam(beam_appearance, self.sprite_lists, self.dps, self.beam_range)
+        self.beam = Beam(
+            beam_appearance,
+            self.sprite_lists,
+            self.beam_archetype.dps,
+            self.beam_archetype.range,
+        )
+        self.beam.owner_vehicle = self.vehicle
 
     def aim_beam(self):
         if self.beam.exists:
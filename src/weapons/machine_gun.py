@@ -5,8 +5,10 @@ import arcade
 from iron_math import get_transformed_location, move_sprite_relative_to_parent
 from linked_sprite import LinkedSpriteSolidColor
 from ordnances.ordnance import Ordnance
+from ordnances.ordnance_pool import OrdnancePool
 from ordnances.projectile import Projectile
 from textures import MACHINE_GUN
+from weapons.archetypes import ProjectileArchetype
 from weapons.weapon import Weapon
 
 
@@ -15,32 +17,39 @@ class MachineGun(Weapon):
     Fires many projectiles that move idependently from each other at a given fire rate
     """
 
-    bullet_speed: float
-    bullet_damage: float
-    fire_rate: float
+    bullet: ProjectileArchetype
+    bullet_pool: OrdnancePool[Projectile]
     weapon_icon = MACHINE_GUN
+    archetype_name = "machine_gun"
 
     def setup(self):
-        self.bullet_speed = 800
-        self.bullet_damage = 10
-        self.fire_rate = 8
-        self.muzzle_transform = (7, 2, 0)
+        self.bullet = self.archetype.ordnance
         self.twisted_sound.select(self.twisted_sound.MACHINE_GUN1)
+        self.bullet_pool = self.sprite_lists.ordnance_pools.get(
+            self.bullet.name,
+            self.create_bullet,
+            self.bullet.pool_capacity,
+            self.bullet,
+        )
 
     def update(self, delta_time: float):
-        if self.input_button.value and self.time_since_shoot > 1 / self.fire_rate:
-            self.shoot()
-        self.time_since_shoot += delta_time
-
-    def shoot(self):
-        bullet_appearance = LinkedSpriteSolidColor[Ordnance](8, 3, arcade.color.RED)
-        bullet = Projectile(
-            bullet_appearance,
-            self.sprite_lists,
-            self.bullet_damage,
+        for shot_time in self.fire_schedule.schedule_shots(
+            delta_time, self.archetype.fire_rate, self.input_button.value
+        ):
+            self.shoot(shot_time)
+
+    def shoot(self, shot_time: float = 0):
+        bullet = self.bullet_pool.acquire()
+        bullet.owner_vehicle = self.vehicle
+        bullet.launch(
             get_transformed_location(self.weapon_sprite, self.muzzle_transform),
-            self.bullet_speed,
             self.weapon_sprite.radians,
+            shot_time,
         )
         self.twisted_sound.play()
-        self.time_since_shoot = 0
+
+    def create_bullet(self):
+        bullet_appearance = LinkedSpriteSolidColor[Ordnance](8, 3, arcade.color.RED)
+        return Projectile(
+            bullet_appearance, self.sprite_lists, self.bullet.damage, self.bullet.speed
+        )
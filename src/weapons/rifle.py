@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from textures import RIFLE
+from weapons.hitscan_weapon import HitscanWeapon
+
+
+class Rifle(HitscanWeapon):
+    """
+    Fires a single long-range shot that hits instantly
+    """
+
+    weapon_icon = RIFLE
+    archetype_name = "rifle"
@@ -8,8 +8,10 @@ from iron_math import get_transformed_location, move_sprite_relative_to_parent
 from linked_sprite import LinkedSprite
 from ordnances.explosion import Explosion
 from ordnances.ordnance import Ordnance
+from ordnances.ordnance_pool import OrdnancePool
 from ordnances.projectile import Projectile
 from textures import ROCKET, ROCKET_LAUNCHER
+from weapons.archetypes import ExplosionArchetype, ProjectileArchetype
 from weapons.weapon import Weapon
 
 
@@ -18,49 +20,59 @@ class RocketLauncher(Weapon):
     Fires a projectile that is now independent of the ship and travels unil it reaches a designated distance
     """
 
-    rocket_speed: float
-    impact_damage: float
-    explosion_damage: float
-    fire_rate: float
-    explosion_radius: float
-    explosion_rate: float
+    rocket: ProjectileArchetype
+    explosion: ExplosionArchetype
+    rocket_pool: OrdnancePool[Projectile]
+    explosion_pool: OrdnancePool[Explosion]
     weapon_icon = ROCKET_LAUNCHER
+    archetype_name = "rocket_launcher"
 
     def setup(self):
-        self.rocket_speed = 550
-        self.impact_damage = 0
-        self.explosion_damage = 80
-        self.fire_rate = 0.5
-        self.muzzle_transform = (12, 0, 0)
-        self.explosion_radius = 75
-        self.explosion_rate = 200
+        self.rocket = self.archetype.ordnance
+        self.explosion = self.rocket.payload
+        self.rocket_pool = self.sprite_lists.ordnance_pools.get(
+            self.rocket.name, self.create_rocket, self.rocket.pool_capacity, self.rocket
+        )
+        self.explosion_pool = self.sprite_lists.ordnance_pools.get(
+            self.explosion.name,
+            self.create_explosion,
+            self.explosion.pool_capacity,
+            self.explosion,
+        )
 
     def update(self, delta_time: float):
-        if self.input_button.pressed:
-            if self.time_since_shoot > 1 / self.fire_rate:
-                self.shoot()
-        self.time_since_shoot += delta_time
+        for shot_time in self.fire_schedule.schedule_shots(
+            delta_time, self.archetype.fire_rate, self.input_button.pressed
+        ):
+            self.shoot(shot_time)
 
-    def shoot(self):
-        # Create the explosion that will be stored in the payload of the rocket
-        explosion = Explosion(
-            arcade.color.ORANGE_RED,
-            self.sprite_lists,
-            self.explosion_damage,
-            self.explosion_radius,
-            self.explosion_rate,
+    def shoot(self, shot_time: float = 0):
+        # The explosion is stored in the payload of the rocket
+        rocket = self.rocket_pool.acquire()
+        rocket.owner_vehicle = self.vehicle
+        rocket.payload_list.append(self.explosion_pool.acquire())
+        rocket.launch(
+            get_transformed_location(self.weapon_sprite, self.muzzle_transform),
+            self.weapon_sprite.radians,
+            shot_time,
         )
-        # Create the rocket
+
+    def create_rocket(self):
         rocket_appearance = LinkedSprite[Ordnance](texture=ROCKET, scale=1)
-        rocket = Projectile(
+        # ROCKET texture appears at 45 degree angle. Sprite_rotation_offset compensates for this
+        return Projectile(
             rocket_appearance,
             self.sprite_lists,
-            self.impact_damage,
-            get_transformed_location(self.weapon_sprite, self.muzzle_transform),
-            self.rocket_speed,
-            self.weapon_sprite.radians,
+            self.rocket.damage,
+            self.rocket.speed,
             sprite_rotation_offet=math.radians(-45),
         )
-        rocket.payload_list.append(explosion)
-        # ROCKET texture appears at 45 degree angle. Sprite_rotation_offset compensates for this
-        self.time_since_shoot = 0
+
+    def create_explosion(self):
+        return Explosion(
+            arcade.color.ORANGE_RED,
+            self.sprite_lists,
+            self.explosion.damage,
+            self.explosion.radius,
+            self.explosion.rate,
+        )
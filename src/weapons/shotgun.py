@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from textures import SHOTGUN
+from weapons.hitscan_weapon import HitscanWeapon
+
+
+class Shotgun(HitscanWeapon):
+    """
+    Fires a spread of pellets that hit instantly
+    """
+
+    weapon_icon = SHOTGUN
+    archetype_name = "shotgun"
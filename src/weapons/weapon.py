@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
 
 import arcade
 
+from audio import TwistedSound
 from player_input import VirtualButton
 from sprite_lists import SpriteLists
-from audio import TwistedSound
+from weapons.archetypes import WeaponArchetype, get_archetypes
+from weapons.fire_schedule import FireSchedule
+
+# This allows a circular import only for the purposes of type hints
+if TYPE_CHECKING:
+    from vehicle import Vehicle
 
 
 class Weapon:
@@ -14,27 +20,43 @@ class Weapon:
     Slotted into a vehicle and behaves according to it's subclass weapon type
     """
 
+    vehicle: Vehicle
+    """
+    Vehicle this weapon is slotted into.  Its ordnance never hits this vehicle, except
+    for blasts such as explosions.
+    """
     input_button: VirtualButton
     sprite_lists: SpriteLists
-    time_since_shoot: float
+    fire_schedule: FireSchedule
+    "When to fire, to a fraction of a tick"
     weapon_icon: arcade.texture
-    muzzle_transform: Tuple[float, float, float]
+    archetype_name: str
+    "Name of this weapon's entry in the archetype table"
+    archetype: WeaponArchetype
+    "Stats shared by every weapon of this kind"
 
     def __init__(
         self,
+        vehicle: Vehicle,
         sprite_lists: SpriteLists,
         input_button: VirtualButton,
         weapon_transform: Tuple[float, float, float],
     ):
+        self.vehicle = vehicle
+        self.archetype = get_archetypes().weapons[self.archetype_name]
         self.input_button = input_button
         self.sprite_lists = sprite_lists
         self.weapon_transform = weapon_transform
-        self.time_since_shoot = 100
+        self.fire_schedule = FireSchedule()
         self.weapon_sprite = arcade.Sprite(texture=self.weapon_icon, scale=1)
         self.sprite_lists.vehicle_attachments.append(self.weapon_sprite)
         self.twisted_sound = TwistedSound()
         self.setup()
 
+    @property
+    def muzzle_transform(self) -> Tuple[float, float, float]:
+        return self.archetype.muzzle_transform
+
     def setup(self):
         """
         Override this method if you want to add initialization logic without
@@ -46,8 +68,32 @@ class Weapon:
     def update(self):
         ...
 
+    def swap_in(
+        self,
+        input_button: VirtualButton,
+        weapon_transform: Tuple[float, float, float],
+    ):
+        """
+        Slot a weapon that was swapped out back into the vehicle, possibly into a
+        different slot than before.
+        """
+        self.input_button = input_button
+        self.weapon_transform = weapon_transform
+        self.weapon_sprite.visible = True
+
     def swap_out(self):
-        self.sprite_lists.vehicle_attachments.remove(self.weapon_sprite)
+        """
+        The weapon is kept by its vehicle while swapped out, to be swapped in
+        again later.
+        """
+        self.weapon_sprite.visible = False
+
+    def update_swapped_out(self, delta_time: float):
+        """
+        Called every tick instead of `update` while swapped out, so that cooldowns
+        keep running.
+        """
+        self.fire_schedule.advance(delta_time)
 
     def deactivate(self):
         ...
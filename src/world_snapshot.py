@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Deque, NamedTuple, Optional, Sequence, Tuple
+
+import arcade
+
+
+class SpriteState(NamedTuple):
+    """
+    Everything needed to draw one sprite, copied out of the simulation.
+    """
+
+    sprite: arcade.Sprite
+    "The simulated sprite, only used to tell sprites apart; never read while drawing"
+    texture: arcade.Texture
+    center_x: float
+    center_y: float
+    angle: float
+    width: float
+    height: float
+    color: Tuple[int, int, int]
+    alpha: int
+
+
+class WorldSnapshot(NamedTuple):
+    """
+    Immutable copy of every drawable sprite and HUD text at the end of a tick, so
+    that it can be drawn on one thread while the next tick is simulated on another.
+    """
+
+    tick: int
+    "Ticks simulated when captured"
+    time: float
+    "`time.perf_counter()` when captured"
+    layers: Tuple[Tuple[SpriteState, ...], ...]
+    "Sprites of each sprite list, in drawing order"
+    texts: Tuple[str, ...] = ()
+    "Text of each HUD that draws text, such as the round banner"
+
+
+def capture_snapshot(
+    tick: int, sprite_lists: Sequence[arcade.SpriteList], texts: Sequence[str] = ()
+) -> WorldSnapshot:
+    return WorldSnapshot(
+        tick,
+        time.perf_counter(),
+        tuple(
+            tuple(
+                SpriteState(
+                    sprite,
+                    sprite.texture,
+                    sprite.center_x,
+                    sprite.center_y,
+                    sprite.angle,
+                    sprite.width,
+                    sprite.height,
+                    sprite.color,
+                    sprite.alpha,
+                )
+                for sprite in sprite_list
+            )
+            for sprite_list in sprite_lists
+        ),
+        tuple(texts),
+    )
+
+
+class SnapshotBuffer:
+    """
+    Hands snapshots from the simulation thread to the drawing thread.
+
+    Keeps the last few snapshots published, so that the simulation never waits for
+    drawing to finish with one: it publishes into the next slot while drawing reads
+    the two before it.
+    """
+
+    def __init__(self, capacity: int = 3):
+        if capacity < 2:
+            raise Exception("Drawing needs the last two snapshots to interpolate")
+        self._snapshots: Deque[WorldSnapshot] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def publish(self, snapshot: WorldSnapshot):
+        with self._lock:
+            self._snapshots.append(snapshot)
+
+    def latest(self) -> Tuple[Optional[WorldSnapshot], Optional[WorldSnapshot]]:
+        """
+        The two most recent snapshots, `(previous, latest)`.  Either is `None` until
+        enough have been published.
+        """
+        with self._lock:
+            snapshots = self._snapshots
+            if not snapshots:
+                return None, None
+            if len(snapshots) == 1:
+                return None, snapshots[-1]
+            return snapshots[-2], snapshots[-1]
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from unittest import TestCase
+
+import arcade
+
+from world_snapshot import SnapshotBuffer, capture_snapshot
+
+
+class TestWorldSnapshot(TestCase):
+    def setUp(self):
+        self.sprites = arcade.SpriteList()
+        self.sprite = arcade.SpriteSolidColor(10, 10, arcade.color.RED)
+        self.sprites.append(self.sprite)
+
+    def test_captures_sprites_by_value(self):
+        self.sprite.position = (5, 6)
+        self.sprite.angle = 30
+        snapshot = capture_snapshot(7, [self.sprites])
+        self.sprite.position = (50, 60)
+        self.sprite.visible = False
+
+        self.assertEqual(snapshot.tick, 7)
+        (state,) = snapshot.layers[0]
+        self.assertIs(state.sprite, self.sprite)
+        self.assertEqual((state.center_x, state.center_y, state.angle), (5, 6, 30))
+        self.assertEqual((state.width, state.height), (10, 10))
+        self.assertEqual(state.alpha, 255)
+
+    def test_captures_texts(self):
+        texts = ["3", "debug"]
+        snapshot = capture_snapshot(0, [self.sprites], texts)
+        texts[0] = "GO"
+        self.assertEqual(snapshot.texts, ("3", "debug"))
+
+    def test_buffer_returns_last_two_snapshots(self):
+        buffer = SnapshotBuffer()
+        self.assertEqual(buffer.latest(), (None, None))
+        snapshots = [capture_snapshot(tick, [self.sprites]) for tick in range(5)]
+        buffer.publish(snapshots[0])
+        self.assertEqual(buffer.latest(), (None, snapshots[0]))
+        for snapshot in snapshots[1:]:
+            buffer.publish(snapshot)
+        self.assertEqual(buffer.latest(), (snapshots[3], snapshots[4]))